@@ -0,0 +1,1316 @@
+"""
+Benchmark Suite: times the public functions of every day module
+Key Concepts: Input-size Sweeps, Empirical Big-O Fitting, Regression Tracking
+Usage:
+    python benchmarks.py run -o results.json            # full sweep
+    python benchmarks.py run --filter day1 --max-size 10000
+    python benchmarks.py compare baseline.json results.json
+"""
+
+import argparse
+import array
+import atexit
+import bisect
+import json
+import math
+import platform
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import deque, namedtuple
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import day1_complexity as day1
+import day2_arrays_list as day2
+import day3_strings as day3
+import day4_linked_lists as day4
+import day5_stacks as day5
+import parallel_reduce
+
+# --------------------------
+# 1. Case Registry
+# --------------------------
+# A case maps an input size n to a zero-argument callable that does the work.
+# bytes_per_n (optional) is the input bytes per unit of n, for an MB/s column.
+Case = namedtuple('Case', 'name setup sizes expected bytes_per_n', defaults=(None,))
+
+CASES = {}
+
+LINEAR_SIZES = (1_000, 4_000, 16_000, 64_000, 256_000)
+LOG_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+QUADRATIC_SIZES = (50, 100, 200, 400, 800)
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function when an optional dependency is missing."""
+
+def case(name, sizes=LINEAR_SIZES, expected=None, bytes_per_n=None):
+    def register(setup):
+        CASES[name] = Case(name, setup, tuple(sizes), expected, bytes_per_n)
+        return setup
+    return register
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise SkipBenchmark("numpy is not installed") from None
+    return np
+
+_scratch = []
+
+def _scratch_path(name):
+    # Files for I/O cases live in one temp dir removed at interpreter exit
+    if not _scratch:
+        _scratch.append(tempfile.TemporaryDirectory())
+    return os.path.join(_scratch[0].name, name)
+
+def _chain(values):
+    head = None
+    for val in reversed(values):
+        head = day4.ListNode(val, head)
+    return head
+
+# --------------------------
+# 2. Complexity Fitting
+# --------------------------
+# Big-O classes from the day1 cheat sheet, as log g(n) so t ≈ c·g(n) fits in log space
+COMPLEXITY_CLASSES = {
+    'O(1)': lambda n: 0.0,
+    'O(log n)': lambda n: math.log(math.log2(max(n, 2))),
+    'O(n)': lambda n: math.log(n),
+    'O(n log n)': lambda n: math.log(n) + math.log(math.log2(max(n, 2))),
+    'O(n²)': lambda n: 2 * math.log(n),
+    'O(n³)': lambda n: 3 * math.log(n),
+    'O(2ⁿ)': lambda n: n * math.log(2),
+    'O(n!)': lambda n: math.lgamma(n + 1),
+}
+
+def fit_complexity(sizes, seconds):
+    """Return (best_class, log_constant, residuals_by_class) for the timings."""
+    log_t = [math.log(t) for t in seconds]
+    residuals = {}
+    constants = {}
+    for label, log_g in COMPLEXITY_CLASSES.items():
+        diffs = [lt - log_g(n) for n, lt in zip(sizes, log_t)]
+        c = sum(diffs) / len(diffs)
+        constants[label] = c
+        residuals[label] = sum((d - c) ** 2 for d in diffs)
+    best = min(residuals, key=residuals.get)  # Ties keep the simpler class
+    return best, constants[best], residuals
+
+def max_feasible_n(label, log_c, budget=1.0, limit=10**18):
+    """Largest n with c·g(n) <= budget seconds (the "Feasible Complexity" column)."""
+    log_g = COMPLEXITY_CLASSES[label]
+    target = math.log(budget) - log_c
+    if log_g(limit) <= target:
+        return limit
+    low, high = 1, limit
+    while low < high:  # Binary search on the monotone g
+        mid = (low + high + 1) // 2
+        if log_g(mid) <= target:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+# --------------------------
+# 3. Timing
+# --------------------------
+def time_call(fn, min_time=0.02, repeat=3):
+    """Best per-call time over `repeat` rounds, each lasting at least `min_time`."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return max(best, 1e-9)
+
+def python_ops_per_second(n=1_000_000):
+    # Rough interpreter speed: simple loop iterations per second (the "10^8 ops" rule)
+    def loop():
+        total = 0
+        for i in range(n):
+            total += i
+    return n / time_call(loop, repeat=3)
+
+def run_case(bench, min_time=0.02, repeat=3, max_size=None):
+    sizes = [n for n in bench.sizes if max_size is None or n <= max_size]
+    if len(sizes) < 2:
+        sizes = list(bench.sizes[:2])
+    seconds = [time_call(bench.setup(n), min_time, repeat) for n in sizes]
+    fitted, log_c, _ = fit_complexity(sizes, seconds)
+    result = {
+        'sizes': sizes,
+        'seconds': seconds,
+        'expected': bench.expected,
+        'fitted': fitted,
+        'max_n_per_second': max_feasible_n(fitted, log_c),
+    }
+    if bench.bytes_per_n:
+        result['mb_per_second'] = sizes[-1] * bench.bytes_per_n / seconds[-1] / 1e6
+    return result
+
+def run_suite(pattern=None, min_time=0.02, repeat=3, max_size=None, out=sys.stdout):
+    results = {}
+    skipped = {}
+    for name, bench in CASES.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        try:
+            result = run_case(bench, min_time, repeat, max_size)
+        except SkipBenchmark as e:
+            skipped[name] = str(e)
+            print(f"{name:<45} skipped: {e}", file=out)
+            continue
+        results[name] = result
+        flag = '' if bench.expected in (None, result['fitted']) else f" (expected {bench.expected})"
+        max_n = result['max_n_per_second']
+        max_n = 'unbounded' if max_n >= 10**18 else f"{max_n:.3g}"
+        print(f"{name:<45} {result['fitted']:<11} "
+              f"{result['seconds'][-1] * 1e3:10.3f} ms @ n={result['sizes'][-1]:<9}"
+              f" max n/s≈{max_n}"
+              + (f" {result['mb_per_second']:.1f} MB/s" if 'mb_per_second' in result else '')
+              + flag, file=out)
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'python_ops_per_second': python_ops_per_second(),
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+# --------------------------
+# 4. Regression Tracking
+# --------------------------
+def compare_runs(baseline, current, threshold=1.25):
+    """Return a list of (name, n, base_s, cur_s, ratio) that slowed down past threshold."""
+    regressions = []
+    for name, cur in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        base_times = dict(zip(base['sizes'], base['seconds']))
+        for n, cur_s in zip(cur['sizes'], cur['seconds']):
+            if n in base_times:
+                ratio = cur_s / base_times[n]
+                if ratio > threshold:
+                    regressions.append((name, n, base_times[n], cur_s, ratio))
+    return regressions
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+# --------------------------
+# 5. day1_complexity Cases
+# --------------------------
+@case('day1.get_first_element', LOG_SIZES, 'O(1)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.get_first_element(lst)
+
+@case('day1.linear_search', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.linear_search(lst, -1)  # Miss: full scan
+
+@case('day1.find_pairs', QUADRATIC_SIZES, 'O(n²)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.find_pairs(lst)
+
+@case('day1.binary_search', LOG_SIZES, 'O(log n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.binary_search(lst, -1)  # Miss: full descent
+
+@case('day1.duplicate_list', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.duplicate_list(lst)
+
+@case('day1.constant_space_sum', expected='O(n)')
+def _(n):
+    return lambda: day1.constant_space_sum(n)
+
+@case('day1.factorial', (50, 100, 200, 400, 800), 'O(n)')
+def _(n):
+    return lambda: day1.factorial(n)
+
+@case('day1.list_membership', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: n - 1 in lst
+
+@case('day1.dict_membership', LOG_SIZES, 'O(1)')
+def _(n):
+    dct = dict.fromkeys(range(n), 1)
+    return lambda: n - 1 in dct
+
+# Batched lookups: n targets against one sorted array of 10^6 items
+BATCH_HAYSTACK = 1_000_000
+
+def _batch_targets(n):
+    return [(i * 7919) % (2 * BATCH_HAYSTACK) for i in range(n)]  # ~50% hits
+
+@case('day1.binary_search loop (n targets)', expected='O(n)')
+def _(n):
+    lst = list(range(0, 2 * BATCH_HAYSTACK, 2))
+    targets = _batch_targets(n)
+    return lambda: [day1.binary_search(lst, t) for t in targets]
+
+@case('day1.binary_search_many list (n targets)', expected='O(n)')
+def _(n):
+    lst = list(range(0, 2 * BATCH_HAYSTACK, 2))
+    targets = _batch_targets(n)
+    return lambda: day1.binary_search_many(lst, targets)
+
+@case('day1.binary_search_many numpy (n targets)', expected='O(n)')
+def _(n):
+    np = _numpy()
+    arr = np.arange(0, 2 * BATCH_HAYSTACK, 2)
+    targets = np.array(_batch_targets(n))
+    return lambda: day1.binary_search_many(arr, targets)
+
+@case('day1.count_range_many list (n ranges)', expected='O(n)')
+def _(n):
+    lst = list(range(0, 2 * BATCH_HAYSTACK, 2))
+    lows = _batch_targets(n)
+    highs = [low + 100 for low in lows]
+    return lambda: day1.count_range_many(lst, lows, highs)
+
+# Repeated lookups: 1000 membership queries against n items
+@case('day1.linear_search x1000', (1_000, 2_000, 4_000, 8_000, 16_000), 'O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: [day1.linear_search(lst, t) for t in range(-1000, 0)]
+
+@case('day1.SearchIndex hash x1000', LOG_SIZES, 'O(1)')
+def _(n):
+    index = day1.SearchIndex(range(n))
+    return lambda: [t in index for t in range(-1000, 0)]
+
+@case('day1.SearchIndex sorted index() x1000', LOG_SIZES, 'O(log n)')
+def _(n):
+    index = day1.SearchIndex([[i] for i in range(n)])  # Unhashable -> sorted index
+    targets = [[i * (n // 1000)] for i in range(1000)]
+    return lambda: [index.index(t) for t in targets]
+
+@case('day1.SearchIndex append+remove', LOG_SIZES, 'O(log n)')
+def _(n):
+    index = day1.SearchIndex(range(n))
+    def churn():
+        index.append(-1)
+        index.remove(-1)
+    return churn
+
+# All-pairs: materialized vs streamed vs sharded across processes
+PAIR_SIZES = (250, 500, 1_000, 2_000)
+
+def _count_pairs(pairs):
+    return sum(1 for _ in pairs)
+
+def _add(a, b):
+    return a + b
+
+@case('day1.find_pairs (materialized)', PAIR_SIZES, 'O(n²)')
+def _(n):
+    lst = list(range(n))
+    return lambda: len(day1.find_pairs(lst))
+
+@case('day1.iter_pairs (streamed)', PAIR_SIZES, 'O(n²)')
+def _(n):
+    lst = list(range(n))
+    return lambda: _count_pairs(day1.iter_pairs(lst))
+
+@case('day1.reduce_pairs (all cores)', PAIR_SIZES, 'O(n²)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day1.reduce_pairs(lst, _count_pairs, _add)
+
+# Factorial engine, n up to 10^5 (recursive factorial stops near 1000)
+FACTORIAL_SIZES = (1_000, 4_000, 16_000, 64_000, 100_000)
+
+@case('day1.iterative_factorial', FACTORIAL_SIZES)
+def _(n):
+    return lambda: day1.iterative_factorial(n)
+
+@case('day1.factorial sequential loop', FACTORIAL_SIZES)
+def _(n):
+    def loop():
+        total = 1
+        for i in range(2, n + 1):
+            total *= i
+    return loop
+
+@case('day1.FactorialCache near hit (n-100 cached)', FACTORIAL_SIZES)
+def _(n):
+    seed = day1.iterative_factorial(n - 100)
+    def near_hit():
+        cache = day1.FactorialCache()  # Fresh per call, or the second call is an exact hit
+        cache.seed(n - 100, seed)
+        return cache(n)
+    return near_hit
+
+@case('day1.FactorialCache exact hit', FACTORIAL_SIZES, 'O(1)')
+def _(n):
+    cache = day1.FactorialCache()
+    cache(n)
+    return lambda: cache(n)
+
+@case('day1.binomial(n, n//2)', FACTORIAL_SIZES)
+def _(n):
+    return lambda: day1.binomial(n, n // 2)
+
+# --------------------------
+# 6. day2_arrays_list Cases
+# --------------------------
+@case('day2.list_to_array', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day2.list_to_array(lst)
+
+@case('day2.memory_savings', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: day2.memory_savings(lst)
+
+@case('day2.sum_list', expected='O(n)')
+def _(n):
+    lst = list(range(n))
+    return lambda: sum(lst)
+
+@case('day2.sum_array', expected='O(n)')
+def _(n):
+    arr = array.array('i', range(n))
+    return lambda: sum(arr)
+
+@case('day2.sum_numpy', LOG_SIZES, 'O(n)')
+def _(n):
+    np = _numpy()
+    np_arr = np.arange(n)
+    return lambda: np.sum(np_arr)
+
+# Reading a typed column from disk: full load vs memory map vs chunks
+FILE_SIZES = (100_000, 400_000, 1_600_000, 6_400_000)
+
+def _typed_file(n):
+    path = _scratch_path(f'column_{n}.tarr')
+    if not os.path.exists(path):
+        day2.write_typed_array(path, array.array('q', range(n)))
+    return path
+
+@case('day2.array.fromfile + sum', FILE_SIZES, 'O(n)')
+def _(n):
+    path = _typed_file(n)
+    def load():
+        arr = array.array('q')
+        with open(path, 'rb') as f:
+            f.seek(16)
+            arr.fromfile(f, n)
+        return sum(arr)
+    return load
+
+@case('day2.TypedArrayFile view + sum', FILE_SIZES, 'O(n)')
+def _(n):
+    typed = day2.TypedArrayFile(_typed_file(n))
+    return lambda: sum(typed.view())
+
+@case('day2.TypedArrayFile iter_chunks + sum', FILE_SIZES, 'O(n)')
+def _(n):
+    typed = day2.TypedArrayFile(_typed_file(n))
+    return lambda: sum(sum(chunk) for chunk in typed.iter_chunks())
+
+@case('day2.TypedArrayFile as_numpy + sum', FILE_SIZES, 'O(n)')
+def _(n):
+    _numpy()
+    typed = day2.TypedArrayFile(_typed_file(n))
+    return lambda: typed.as_numpy().sum()
+
+# Compact integers: build from a generator and reduce
+@case('day2.list build + sum', expected='O(n)')
+def _(n):
+    return lambda: sum(list(i % 100 for i in range(n)))
+
+@case('day2.CompactIntArray build + sum', expected='O(n)')
+def _(n):
+    return lambda: day2.CompactIntArray(i % 100 for i in range(n)).sum()
+
+@case('day2.CompactIntArray min/max', LOG_SIZES, 'O(n)')
+def _(n):
+    compact = day2.CompactIntArray(range(n))
+    return lambda: (compact.min(), compact.max())
+
+# Multi-core reductions: scaling from 1 core to all cores, next to day2.sum_array
+REDUCE_SIZES = (1_000_000, 4_000_000, 16_000_000)
+
+def _scaling_workers():
+    counts, k = [], 1
+    while k < (os.cpu_count() or 1):
+        counts.append(k)
+        k *= 2
+    return counts + [os.cpu_count() or 1]
+
+def _register_parallel_sum(workers):
+    @case(f'parallel_reduce.parallel_sum workers={workers}', REDUCE_SIZES, 'O(n)')
+    def _(n):
+        from concurrent.futures import ProcessPoolExecutor
+        shared = parallel_reduce.SharedArray.from_buffer(array.array('q', range(n)))
+        atexit.register(shared.close)
+        if workers == 1:
+            return lambda: parallel_reduce.parallel_sum(shared, workers=1)
+        pool = ProcessPoolExecutor(workers)  # Started once, outside the timed call
+        atexit.register(pool.shutdown)
+        return lambda: parallel_reduce.parallel_sum(shared, workers=workers, pool=pool)
+
+for _workers in _scaling_workers():
+    _register_parallel_sum(_workers)
+
+# --------------------------
+# 7. day3_strings Cases
+# --------------------------
+def _text(n):
+    return ''.join(chr(97 + (i * 7) % 26) for i in range(n))
+
+@case('day3.is_palindrome', expected='O(n)')
+def _(n):
+    s = 'a' * n
+    return lambda: day3.is_palindrome(s)
+
+@case('day3.compress', expected='O(n)')
+def _(n):
+    s = ''.join('abc'[i // 5 % 3] for i in range(n))  # Runs of 5
+    return lambda: day3.compress(s)
+
+@case('day3.custom_replace', expected='O(n)')
+def _(n):
+    s = 'ab ' * (n // 3)
+    return lambda: day3.custom_replace(s, 'ab', 'xyz')
+
+@case('day3.longest_unique_substring', expected='O(n)')
+def _(n):
+    s = _text(n)
+    return lambda: day3.longest_unique_substring(s)
+
+@case('day3.are_anagrams', expected='O(n)')
+def _(n):
+    s1 = _text(n)
+    s2 = s1[::-1]
+    return lambda: day3.are_anagrams(s1, s2)
+
+@case('day3.is_valid_email', expected='O(n)')
+def _(n):
+    email = 'a' * n + '@example.com'
+    return lambda: day3.is_valid_email(email)
+
+# 1000 keywords in an n-char text: one find/replace pass per keyword vs one automaton pass
+KEYWORD_COUNT = 1000
+
+def _keywords():
+    rng = random.Random(0)
+    return list(dict.fromkeys(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz')
+                                      for _ in range(rng.randint(4, 8)))
+                              for _ in range(KEYWORD_COUNT)))
+
+def _keyword_text(n, keywords):
+    rng = random.Random(n)
+    words, size = [], 0
+    while size < n:  # One word in ten is a keyword
+        word = rng.choice(keywords) if rng.random() < 0.1 else _text(rng.randint(2, 9))
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:n]
+
+@case('str.count per keyword (1000 keywords)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    text = _keyword_text(n, keywords)
+    return lambda: [text.count(keyword) for keyword in keywords]
+
+@case('re alternation finditer (1000 keywords)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    text = _keyword_text(n, keywords)
+    pattern = re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+    return lambda: list(pattern.finditer(text))
+
+@case('day3.AhoCorasick.findall (1000 keywords)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    text = _keyword_text(n, keywords)
+    matcher = day3.AhoCorasick(keywords)
+    return lambda: matcher.findall(text)
+
+@case('day3.AhoCorasick stream 64 KB chunks (bytes)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    data = _keyword_text(n, keywords).encode()
+    matcher = day3.AhoCorasick([keyword.encode() for keyword in keywords])
+    chunks = [data[i:i + 65536] for i in range(0, len(data), 65536)]
+    def scan():
+        stream = matcher.stream()
+        for chunk in chunks:
+            stream.feed(chunk)
+    return scan
+
+@case('day3.custom_replace per keyword (1000 keywords)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    text = _keyword_text(n, keywords)
+    def replace_all():
+        out = text
+        for keyword in keywords:
+            out = day3.custom_replace(out, keyword, keyword.upper())
+        return out
+    return replace_all
+
+@case('day3.AhoCorasick.replace (1000 keywords)', expected='O(n)')
+def _(n):
+    keywords = _keywords()
+    text = _keyword_text(n, keywords)
+    matcher = day3.AhoCorasick(keywords)
+    return lambda: matcher.replace(text, str.upper)
+
+# Run-length codec on repetitive telemetry-like data (n bytes), reported in MB/s
+def _telemetry(n):
+    rng = random.Random(n)
+    out, size = [], 0
+    while size < n:
+        run = min(n - size, int(rng.expovariate(1 / 60)) + 1)
+        out.append(rng.choice(b'\x00\x00\x00\xff01.,\n').to_bytes(1, 'little') * run)
+        size += run
+    return b''.join(out)
+
+@case('day3.compress (telemetry text)', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    text = _telemetry(n).decode('latin-1')
+    return lambda: day3.compress(text)
+
+@case('day3.rle_encode str', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    text = _telemetry(n).decode('latin-1')
+    return lambda: day3.rle_encode(text)
+
+@case('day3.rle_decode str', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    encoded = day3.rle_encode(_telemetry(n).decode('latin-1'))
+    return lambda: day3.rle_decode(encoded)
+
+@case('day3.rle_encode bytes', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    data = _telemetry(n)
+    return lambda: day3.rle_encode(data)
+
+@case('day3.rle_decode bytes', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    encoded = day3.rle_encode(_telemetry(n))
+    return lambda: day3.rle_decode(encoded)
+
+@case('day3.RLEEncoder 64 KB chunks (memoryview)', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    view = memoryview(_telemetry(n))
+    def encode():
+        encoder = day3.RLEEncoder()
+        for i in range(0, len(view), 65536):
+            encoder.feed(view[i:i + 65536])
+        encoder.flush()
+    return encode
+
+@case('day3.rle_encode_file', FILE_SIZES, 'O(n)', bytes_per_n=1)
+def _(n):
+    src = _scratch_path(f'telemetry_{n}.bin')
+    with open(src, 'wb') as f:
+        f.write(_telemetry(n))
+    return lambda: day3.rle_encode_file(src, src + '.rle')
+
+# Anagram grouping, lookups and pair checks over an n-word corpus: sorted keys vs AnagramIndex
+@lru_cache(maxsize=None)
+def _word_corpus(n):
+    # n words, 4-12 lowercase letters, drawn from ~n/4 roots so words form anagram groups
+    rng = random.Random(24)
+    roots = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(4, 12)))
+             for _ in range(max(1, n // 4))]
+    return [''.join(rng.sample(root, len(root))) for root in rng.choices(roots, k=n)]
+
+@lru_cache(maxsize=None)
+def _word_pairs(n):
+    # n pairs over a 1/16 vocabulary, as when re-checking candidates repeatedly
+    vocab = _word_corpus(n)[:max(1, n // 16)]
+    rng = random.Random(n)
+    return [(rng.choice(vocab), rng.choice(vocab)) for _ in range(n)]
+
+@case('day3 group anagrams: dict of sorted keys', LINEAR_SIZES, 'O(n)')
+def _(n):
+    words = _word_corpus(n)
+    def group():
+        groups = {}
+        for word in words:
+            groups.setdefault(''.join(sorted(word)), set()).add(word)
+        return groups
+    return group
+
+@case('day3 group anagrams: AnagramIndex', LINEAR_SIZES, 'O(n)')
+def _(n):
+    words = _word_corpus(n)
+    return lambda: day3.AnagramIndex(words)
+
+@case('day3 anagrams_of lookups: linear scan with are_anagrams', QUADRATIC_SIZES, 'O(n²)')
+def _(n):
+    words = _word_corpus(n)
+    return lambda: [[w for w in words if w != q and day3.are_anagrams(w, q)] for q in words]
+
+@case('day3 anagrams_of lookups: AnagramIndex', LINEAR_SIZES, 'O(n)')
+def _(n):
+    words = _word_corpus(n)
+    index = day3.AnagramIndex(words)
+    return lambda: [index.anagrams_of(q) for q in words]
+
+@case('day3 pairwise anagram check: are_anagrams per pair', LINEAR_SIZES, 'O(n)')
+def _(n):
+    pairs = _word_pairs(n)
+    return lambda: [day3.are_anagrams(a, b) for a, b in pairs]
+
+@case('day3 pairwise anagram check: are_anagrams_batch', LINEAR_SIZES, 'O(n)')
+def _(n):
+    pairs = _word_pairs(n)
+    return lambda: day3.are_anagrams_batch(pairs)
+
+# Email validation over mailing-list exports: n = lines, so the n/s column is lines per second
+@lru_cache(maxsize=None)
+def _email_lines(n):
+    # Mailing-list export: ~90% valid addresses, the rest typical junk
+    rng = random.Random(25)
+    domains = ['example.com', 'mail.co.uk', 'corp.example.org', 'lists.example.net']
+    junk = ['', 'n/a', 'user@localhost', 'user@@example.com', '@example.com', 'user@example.']
+    return [f"{''.join(rng.choices('abcdefghijklmnopqrstuvwxyz0123456789.', k=rng.randint(4, 16)))}"
+            f"@{rng.choice(domains)}" if rng.random() < 0.9 else rng.choice(junk) for _ in range(n)]
+
+@case('day3 email lines: re.fullmatch(pattern string) per line', LOG_SIZES, 'O(n)')
+def _(n):
+    lines = _email_lines(n)
+    return lambda: [line for line in lines if not re.fullmatch(r"[^@]+@[^@]+\.[^@]+", line)]
+
+@case('day3 email lines: is_valid_email per line', LOG_SIZES, 'O(n)')
+def _(n):
+    lines = _email_lines(n)
+    return lambda: [line for line in lines if not day3.is_valid_email(line)]
+
+@case('day3 email lines: validate_emails (one pass per block)', LOG_SIZES, 'O(n)')
+def _(n):
+    text = '\n'.join(_email_lines(n))
+    return lambda: day3.validate_emails(text)
+
+for _workers in (1, None):
+    @case(f"day3.validate_email_file ({_workers or 'all'} workers)", LOG_SIZES, 'O(n)')
+    def _(n, workers=_workers):
+        path = _scratch_path(f'emails_{n}.txt')
+        with open(path, 'w') as f:
+            f.write('\n'.join(_email_lines(n)))
+        return lambda: day3.validate_email_file(path, workers)
+
+
+# --------------------------
+# 8. day4_linked_lists Cases
+# --------------------------
+@case('day4.SLL.append (build n)', expected='O(n)')
+def _(n):
+    def build():
+        sll = day4.SLL()
+        for i in range(n):
+            sll.append(i)
+    return build
+
+@case('day4.DLL.append (build n)', expected='O(n)')
+def _(n):
+    def build():
+        dll = day4.DLL()
+        for i in range(n):
+            dll.append(i)
+    return build
+
+@case('day4.reverse_sll', expected='O(n)')
+def _(n):
+    state = [_chain(list(range(n)))]
+    def reverse():
+        state[0] = day4.reverse_sll(state[0])  # Reversing twice restores the list
+    return reverse
+
+@case('day4.find_middle', expected='O(n)')
+def _(n):
+    head = _chain(list(range(n)))
+    return lambda: day4.find_middle(head)
+
+@case('day4.has_cycle', expected='O(n)')
+def _(n):
+    head = _chain(list(range(n)))
+    return lambda: day4.has_cycle(head)
+
+# The next two mutate their input, so each call rebuilds the chain (both O(n))
+@case('day4.remove_nth_from_end (+build)', expected='O(n)')
+def _(n):
+    values = list(range(n))
+    return lambda: day4.remove_nth_from_end(_chain(values), n // 2)
+
+@case('day4.is_palindrome_linked_list (+build)', expected='O(n)')
+def _(n):
+    values = list(range(n // 2)) + list(range(n // 2))[::-1]
+    return lambda: day4.is_palindrome_linked_list(_chain(values))
+
+# Merging sorted chains: two-way, k-way heap merge, lazy iterator merge (k = 16)
+def _sorted_chains(n, k):
+    return [_chain(list(range(j, n, k))) for j in range(k)]
+
+@case('day4.merge_sorted_list (+build)', expected='O(n)')
+def _(n):
+    evens, odds = list(range(0, n, 2)), list(range(1, n, 2))
+    return lambda: day4.merge_sorted_list(_chain(evens), _chain(odds))
+
+@case('day4.merge_k_sorted_lists (k=16, +build)', expected='O(n)')
+def _(n):
+    return lambda: day4.merge_k_sorted_lists(_sorted_chains(n, 16))
+
+@case('day4.merge_sorted_iterables (k=16)', expected='O(n)')
+def _(n):
+    runs = [list(range(j, n, 16)) for j in range(16)]
+    return lambda: sum(1 for _ in day4.merge_sorted_iterables(*runs))
+
+# Sorting a chain: copy-sort-rebuild vs in-place merge sort (input rebuilt each call)
+def _shuffled(n):
+    return [(i * 7919) % n for i in range(n)]
+
+def _mostly_sorted(n):
+    values = list(range(n))
+    for i in range(0, n - 1, 1000):  # One swap per 1000 items
+        values[i], values[i + 1] = values[i + 1], values[i]
+    return values
+
+def _copy_sort_rebuild(head):
+    values = []
+    while head:
+        values.append(head.val)
+        head = head.next
+    values.sort()
+    return _chain(values)
+
+for _label, _make in (('random', _shuffled), ('mostly sorted', _mostly_sorted)):
+    @case(f'day4.copy-sort-rebuild {_label} (+build)', expected='O(n log n)')
+    def _(n, make=_make):
+        values = make(n)
+        return lambda: _copy_sort_rebuild(_chain(values))
+
+    @case(f'day4.sort_linked_list {_label} (+build)', expected='O(n log n)')
+    def _(n, make=_make):
+        values = make(n)
+        return lambda: day4.sort_linked_list(_chain(values))
+
+    @case(f'day4.sort_linked_list fixed-width {_label} (+build)', expected='O(n log n)')
+    def _(n, make=_make):
+        values = make(n)
+        return lambda: day4.sort_linked_list(_chain(values), natural=False)
+
+# Several separate scans vs one analyze_list pass (length, cycle, middle, 3 k-th-from-end)
+def _kth_from_end(head, k):
+    lead = head
+    for _ in range(k):
+        lead = lead.next
+    while lead:
+        head, lead = head.next, lead.next
+    return head
+
+@case('day4.separate scans (len+cycle+middle+3 kth)', expected='O(n)')
+def _(n):
+    head = _chain(list(range(n)))
+    def scans():
+        _walk(head)
+        day4.has_cycle(head)
+        day4.find_middle(head)
+        for k in (1, 10, 100):
+            _kth_from_end(head, k)
+    return scans
+
+@case('day4.analyze_list (one pass)', expected='O(n)')
+def _(n):
+    head = _chain(list(range(n)))
+    return lambda: day4.analyze_list(head, (1, 10, 100))
+
+@case('day4.analyze_list cyclic', expected='O(n)')
+def _(n):
+    head = _chain(list(range(n)))
+    node = head
+    while node.next:
+        node = node.next
+    node.next = head.next  # Tail links back to the second node
+    return lambda: day4.analyze_list(head)
+
+# LRU caches under skewed keys: n lookups over 100k keys, 1000-entry caches.
+# key = 100k ** u for uniform u is log-uniform, i.e. roughly Zipf(1): a few hot keys.
+CACHE_KEYSPACE = 100_000
+CACHE_SIZE = 1_000
+
+def _zipf_keys(n):
+    rng = random.Random(n)
+    return [int(CACHE_KEYSPACE ** rng.random()) for _ in range(n)]
+
+def _square(x):
+    return x * x
+
+@case('day4.LRUCache get/put (zipf keys)', expected='O(n)')
+def _(n):
+    keys = _zipf_keys(n)
+    def run():
+        cache = day4.LRUCache(CACHE_SIZE)
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, _square(key))
+    return run
+
+@case('day4.memoize (zipf keys)', expected='O(n)')
+def _(n):
+    keys = _zipf_keys(n)
+    def run():
+        square = day4.memoize(CACHE_SIZE)(_square)
+        for key in keys:
+            square(key)
+    return run
+
+@case('day4.memoize thread-safe (zipf keys)', expected='O(n)')
+def _(n):
+    keys = _zipf_keys(n)
+    def run():
+        square = day4.memoize(CACHE_SIZE, thread_safe=True)(_square)
+        for key in keys:
+            square(key)
+    return run
+
+@case('functools.lru_cache (zipf keys)', expected='O(n)')
+def _(n):
+    keys = _zipf_keys(n)
+    def run():
+        square = lru_cache(CACHE_SIZE)(_square)
+        for key in keys:
+            square(key)
+    return run
+
+# Ordered inserts + lookups: SLL walk from head (O(n) each) vs SkipList vs bisect.insort
+def _sll_insort(sll, val):
+    prev, curr = None, sll.head
+    while curr and curr.val <= val:
+        prev, curr = curr, curr.next
+    if prev is None:
+        sll.appendleft(val)
+    else:
+        sll.insert_after(prev, val)
+
+@case('day4.SLL ordered insert n', QUADRATIC_SIZES, 'O(n²)')
+def _(n):
+    values = _shuffled(n)
+    def build():
+        sll = day4.SLL()
+        for val in values:
+            _sll_insort(sll, val)
+    return build
+
+@case('day4.SkipList insert n', expected='O(n log n)')
+def _(n):
+    values = _shuffled(n)
+    return lambda: day4.SkipList(values, seed=0)
+
+# insort's element shifting is O(n) per insert, just a very fast memmove
+@case('list bisect.insort n', expected='O(n²)')
+def _(n):
+    values = _shuffled(n)
+    def build():
+        ordered = []
+        for val in values:
+            bisect.insort(ordered, val)
+    return build
+
+@case('day4.SkipList search+rank n', expected='O(n log n)')
+def _(n):
+    index = day4.SkipList(range(n), seed=0)
+    queries = _shuffled(n)
+    def lookups():
+        for key in queries:
+            index.search(key)
+            index.rank(key)
+    return lookups
+
+@case('day4.SkipList delete n', expected='O(n log n)')
+def _(n):
+    values = _shuffled(n)
+    def drain():
+        index = day4.SkipList(range(n), seed=0)
+        for val in values:
+            index.remove(val)
+    return drain
+
+# Bulk builders up to 10^6 nodes: linear now that SLL keeps a tail pointer
+BUILD_SIZES = (62_500, 125_000, 250_000, 500_000, 1_000_000)
+
+@case('day4.SLL.from_iterable', BUILD_SIZES, 'O(n)')
+def _(n):
+    return lambda: day4.SLL.from_iterable(range(n))
+
+@case('day4.DLL.from_iterable', BUILD_SIZES, 'O(n)')
+def _(n):
+    return lambda: day4.DLL.from_iterable(range(n))
+
+@case('day4.SLL iterate + to_list', BUILD_SIZES, 'O(n)')
+def _(n):
+    sll = day4.SLL.from_iterable(range(n))
+    return sll.to_list
+
+@case('day4.DLL popleft (drain n)', BUILD_SIZES, 'O(n)')
+def _(n):
+    def drain():
+        dll = day4.DLL.from_iterable(range(n))
+        while dll.head:
+            dll.popleft()
+    return drain
+
+# Node layouts: per-instance __dict__ (the original ListNode) vs __slots__ vs node pool
+class DictListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+def _build_nodes(node_cls, n):
+    head = None
+    for val in range(n):
+        head = node_cls(val, head)
+    return head
+
+def _walk(head):
+    count = 0
+    while head:
+        count += 1
+        head = head.next
+    return count
+
+@case('day4.build dict nodes', expected='O(n)')
+def _(n):
+    return lambda: _build_nodes(DictListNode, n)
+
+@case('day4.build slotted ListNode', expected='O(n)')
+def _(n):
+    return lambda: _build_nodes(day4.ListNode, n)
+
+@case('day4.build PooledSLL', expected='O(n)')
+def _(n):
+    def build():
+        pooled = day4.PooledSLL()
+        for val in range(n):
+            pooled.append(val)
+    return build
+
+@case('day4.traverse dict nodes', expected='O(n)')
+def _(n):
+    head = _build_nodes(DictListNode, n)
+    return lambda: _walk(head)
+
+@case('day4.traverse slotted ListNode', expected='O(n)')
+def _(n):
+    head = _build_nodes(day4.ListNode, n)
+    return lambda: _walk(head)
+
+@case('day4.traverse PooledSLL', expected='O(n)')
+def _(n):
+    pooled = day4.PooledSLL()
+    for val in range(n):
+        pooled.append(val)
+    return lambda: sum(1 for _ in pooled)
+
+# --------------------------
+# 9. day5_stacks Cases
+# --------------------------
+@case('day5.Stack push+pop (n each)', expected='O(n)')
+def _(n):
+    def churn():
+        stack = day5.Stack()
+        for i in range(n):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return churn
+
+@case('day5.NumericStack push+pop (n each)', expected='O(n)')
+def _(n):
+    def churn():
+        stack = day5.NumericStack('q')
+        for i in range(n):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return churn
+
+@case('day5.NumericStack bounded push+pop (n each)', expected='O(n)')
+def _(n):
+    def churn():
+        stack = day5.NumericStack('q', capacity=n)
+        for i in range(n):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return churn
+
+@case('day5.NumericStack ring push (n, capacity 1000)', expected='O(n)')
+def _(n):
+    def churn():
+        stack = day5.NumericStack('q', capacity=1000, on_full='overwrite')
+        for i in range(n):
+            stack.push(i)
+    return churn
+
+@case('day5.NumericStack push_many+pop_many', expected='O(n)')
+def _(n):
+    values = array.array('q', range(n))
+    def churn():
+        stack = day5.NumericStack('q')
+        stack.push_many(values)
+        stack.pop_many(n)
+    return churn
+
+@case('deque push+pop (n each)', expected='O(n)')
+def _(n):
+    def churn():
+        stack = deque()
+        for i in range(n):
+            stack.append(i)
+        while stack:
+            stack.pop()
+    return churn
+
+@case('day5.is_balanced', expected='O(n)')
+def _(n):
+    expr = '({[' * (n // 6) + ']})' * (n // 6)
+    return lambda: day5.is_balanced(expr)
+
+@case('day5.is_balanced (NumericStack)', expected='O(n)')
+def _(n):
+    expr = '({[' * (n // 6) + ']})' * (n // 6)
+    return lambda: day5.is_balanced(expr, lambda: day5.NumericStack('b'))
+
+# JSON-ish dumps: brackets are sparse, most characters are skipped by the fast path
+def _json_text(n):
+    record = '{"id": 12345, "name": "example", "tags": ["a", "b"], "pos": [1.5, 2.5]}, '
+    body = record * max(1, (n - 2) // len(record))
+    return '[' + body[:-2] + ']'
+
+@case('day5.is_balanced JSON-ish', expected='O(n)')
+def _(n):
+    text = _json_text(n)
+    return lambda: day5.is_balanced(text)
+
+@case('day5.validate_brackets JSON-ish', expected='O(n)')
+def _(n):
+    text = _json_text(n)
+    return lambda: day5.validate_brackets(text)
+
+@case('day5.validate_brackets 4 KB chunks', expected='O(n)')
+def _(n):
+    text = _json_text(n)
+    chunks = [text[i:i + 4096] for i in range(0, len(text), 4096)]
+    return lambda: day5.validate_brackets(chunks)
+
+@case('day5.validate_file (bytes)', FILE_SIZES, 'O(n)')
+def _(n):
+    path = _scratch_path(f'brackets_{n}.json')
+    with open(path, 'w') as f:
+        f.write(_json_text(n))
+    return lambda: day5.validate_file(path)
+
+for _workers in (1, None):
+    @case(f"day5.validate_files 8 files ({_workers or 'all'} workers)", FILE_SIZES, 'O(n)')
+    def _(n, workers=_workers):
+        paths = []
+        for i in range(8):
+            paths.append(_scratch_path(f'brackets_{n}_{i}.json'))
+            with open(paths[-1], 'w') as f:
+                f.write(_json_text(n // 8))
+        return lambda: day5.validate_files(paths, workers)
+
+@case('day5.TextEditor.write (n chars)', expected='O(n)')
+def _(n):
+    def session():
+        editor = day5.TextEditor()
+        for _ in range(n):
+            editor.write('x')
+    return session
+
+# Typing session in the middle of a 4 MB document: n keystrokes, a backspace every 20
+DOCUMENT_CHARS = 4 << 20
+TYPING_SIZES = (1_000, 4_000, 16_000, 64_000)
+
+def _document():
+    line = 'The quick brown fox jumps over the lazy dog. ' * 2 + '\n'
+    return (line * (DOCUMENT_CHARS // len(line) + 1))[:DOCUMENT_CHARS]
+
+def _type_into(editor, n):
+    pos = len(editor) // 2
+    for i in range(n):
+        if i % 20 == 19:
+            pos -= 1
+            editor.delete(pos)
+        else:
+            editor.insert(pos, 'x')
+            pos += 1
+
+@case('day5.TextEditor typing in 4 MB doc', TYPING_SIZES, 'O(n)')
+def _(n):
+    document = day5.Rope(_document())
+    def session():
+        editor = day5.TextEditor()
+        editor.rope = document  # Snapshots are immutable: every round starts from the same doc
+        _type_into(editor, n)
+    return session
+
+@case('day5.TextEditor typing + undo all in 4 MB doc', TYPING_SIZES, 'O(n)')
+def _(n):
+    document = day5.Rope(_document())
+    def session():
+        editor = day5.TextEditor()
+        editor.rope = document
+        _type_into(editor, n)
+        while not editor.undo_stack.is_empty():
+            editor.undo()
+    return session
+
+@case('str splice typing in 4 MB doc', QUADRATIC_SIZES, 'O(n)')
+def _(n):
+    document = _document()
+    def session():
+        text = document
+        pos = len(text) // 2
+        for i in range(n):  # Each keystroke copies the whole document
+            if i % 20 == 19:
+                pos -= 1
+                text = text[:pos] + text[pos + 1:]
+            else:
+                text = text[:pos] + 'x' + text[pos:]
+                pos += 1
+    return session
+
+@case('day5.eval_postfix', expected='O(n)')
+def _(n):
+    expr = '1 ' + '2 + ' * (n // 2)
+    return lambda: day5.eval_postfix(expr)
+
+@case('day5.eval_postfix (NumericStack)', expected='O(n)')
+def _(n):
+    expr = '1 ' + '2 + ' * (n // 2)
+    return lambda: day5.eval_postfix(expr, lambda: day5.NumericStack('d'))
+
+# One rule over n variable bindings: re-parse per row vs compiled (rows, columns, NumPy)
+RULE = 'price * (1 - discount) + tax * 2^2 - -fee'
+
+def _rule_rows(n):
+    return [{'price': i % 100, 'discount': (i % 7) / 10, 'tax': i % 3, 'fee': 1} for i in range(n)]
+
+@case('day5.eval_postfix per row (n rows)', expected='O(n)')
+def _(n):
+    postfix = day5.CompiledExpression(RULE).postfix_string
+    rows = _rule_rows(n)
+    return lambda: [day5.eval_postfix(postfix, variables=row) for row in rows]
+
+@case('day5.compiled call per row (n rows)', expected='O(n)')
+def _(n):
+    rows = _rule_rows(n)
+    return lambda: [day5.evaluate(RULE, row) for row in rows]
+
+@case('day5.evaluate_many (n rows)', expected='O(n)')
+def _(n):
+    rule = day5.compile_expression(RULE)
+    rows = _rule_rows(n)
+    return lambda: rule.evaluate_many(rows)
+
+@case('day5.evaluate_columns lists (n rows)', expected='O(n)')
+def _(n):
+    rule = day5.compile_expression(RULE)
+    rows = _rule_rows(n)
+    columns = {name: [row[name] for row in rows] for name in rule.variables}
+    if 'numpy' in sys.modules:
+        raise SkipBenchmark("numpy is loaded, so lists would be converted to arrays")
+    return lambda: rule.evaluate_columns(columns)
+
+@case('day5.evaluate_columns numpy (n rows)', expected='O(n)')
+def _(n):
+    np = _numpy()
+    rule = day5.compile_expression(RULE)
+    rows = _rule_rows(n)
+    columns = {name: np.array([row[name] for row in rows]) for name in rule.variables}
+    return lambda: rule.evaluate_columns(columns)
+
+@case('day5.reverse_string')
+def _(n):
+    s = _text(n)
+    return lambda: day5.reverse_string(s)
+
+@case('day5.has_redundant_parentheses', expected='O(n)')
+def _(n):
+    expr = '(a+b)' * (n // 5)
+    return lambda: day5.has_redundant_parentheses(expr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='run the benchmark sweep')
+    run.add_argument('-o', '--output', help='write JSON results to this file')
+    run.add_argument('--filter', help='regex selecting case names')
+    run.add_argument('--max-size', type=int, help='skip input sizes above this')
+    run.add_argument('--min-time', type=float, default=0.02, help='seconds per timing round')
+    run.add_argument('--repeat', type=int, default=3, help='timing rounds (best is kept)')
+
+    compare = sub.add_parser('compare', help='flag regressions between two runs')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=1.25,
+                         help='slowdown ratio that counts as a regression')
+
+    sub.add_parser('list', help='list registered cases')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for name, bench in CASES.items():
+            print(f"{name:<45} {bench.expected or '-':<11} sizes={list(bench.sizes)}")
+        return 0
+
+    if args.command == 'run':
+        report = run_suite(args.filter, args.min_time, args.repeat, args.max_size)
+        print(f"Python loop speed: {report['meta']['python_ops_per_second']:.3g} ops/s "
+              f"(rule of thumb: 1e8)")
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+        return 0
+
+    regressions = compare_runs(_load(args.baseline), _load(args.current), args.threshold)
+    for name, n, base_s, cur_s, ratio in regressions:
+        print(f"REGRESSION {name} n={n}: {base_s * 1e3:.3f} ms -> {cur_s * 1e3:.3f} ms ({ratio:.2f}x)")
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,15 @@ Big-O Cheat Sheet:
 O(1) < O(log n) < O(n) < O(n log n) < O(n²) < O(2ⁿ) < O(n!)
 """
 
+import array
+import bisect
+import os
+import sys
+from collections import OrderedDict, deque
+from functools import reduce
+from itertools import islice, repeat
+from math import prod
+
 # --------------------------
 # 1. Constant Time: O(1)
 # --------------------------
@@ -10,7 +19,6 @@ def get_first_element(lst):
     return lst[0]  # Single operation, independent of input size
 
 # Use Case: Accessing dictionary values or array indices
-print(get_first_element([10, 20, 30]))  # Output: 10
 
 # --------------------------
 # 2. Linear Time: O(n)
@@ -22,7 +30,6 @@ def linear_search(lst, target):
     return False
 
 # Use Case: Unsorted list search
-print(linear_search([5, 2, 9, 1], 9))  # Output: True
 
 # --------------------------
 # 3. Quadratic Time: O(n²)
@@ -35,7 +42,6 @@ def find_pairs(lst):
     return pairs
 
 # Use Case: Comparing all pairs (e.g., matrix operations)
-print(find_pairs([1, 2]))  # Output: [(1,1), (1,2), (2,1), (2,2)]
 
 # --------------------------
 # 4. Logarithmic Time: O(log n)
@@ -53,7 +59,6 @@ def binary_search(sorted_lst, target):
     return -1
 
 # Use Case: Searching in sorted data (optimal for large datasets)
-print(binary_search([1, 3, 5, 7, 9], 5))  # Output: 2
 
 # --------------------------
 # 5. Space Complexity
@@ -91,8 +96,6 @@ def factorial(n):
         return 1
     return n * factorial(n-1)  # O(n) time & space (call stack)
 
-print(factorial(5))  # Output: 120
-
 # --------------------------
 # 8.  Python Data Structure Complexities
 # --------------------------
@@ -107,22 +110,468 @@ Operation Complexity Table:
   |  Insert/Delete Mid	|  O(n)	|  O(1)	|  O(1)	|   O(n)  |
 """
 
-# timeit usage
-import timeit
-setup = "lst = list(range(10000))"
-stmt = "sum(lst)"  # O(n) operation
-time = timeit.timeit(stmt, setup, number=1000)
-print(f"Time: {time:.6f} seconds")
-
-# List membership test: O(n)
-list_time = timeit.timeit('999 in lst', 
-                          setup='lst=list(range(1000))', 
-                          number=10000)
-
-# Dict membership test: O(1)
-dict_time = timeit.timeit('999 in dct', 
-                          setup='dct={i:1 for i in range(1000)}', 
-                          number=10000)
-
-print(f"List: {list_time:.4f}s | Dict: {dict_time:.4f}s")
-# Typical output: List: 0.25s | Dict: 0.0007s
\ No newline at end of file
+# --------------------------
+# 9. Batched Binary Search: O(m log n) for m targets
+# --------------------------
+# Bound variants (bisect is C-level binary search)
+def lower_bound(sorted_lst, target):
+    return bisect.bisect_left(sorted_lst, target)  # First index with item >= target
+
+def upper_bound(sorted_lst, target):
+    return bisect.bisect_right(sorted_lst, target)  # First index with item > target
+
+def count_range(sorted_lst, low, high):
+    # Number of items with low <= item <= high
+    return max(0, bisect.bisect_right(sorted_lst, high) - bisect.bisect_left(sorted_lst, low))
+
+# NumPy path: used for np.ndarray and numeric array.array inputs, imported lazily
+def _as_numpy(seq):
+    np = sys.modules.get('numpy')  # An ndarray can only exist once numpy is imported
+    if np is not None and isinstance(seq, np.ndarray):
+        return np, seq
+    if isinstance(seq, array.array) and seq.typecode != 'u':
+        try:
+            import numpy as np
+        except ImportError:
+            return None, None
+        return np, np.frombuffer(seq, dtype=seq.typecode)  # Zero-copy view
+    return None, None
+
+def lower_bound_many(sorted_seq, targets):
+    np, arr = _as_numpy(sorted_seq)
+    if np is not None:
+        return np.searchsorted(arr, np.asarray(targets), side='left')
+    return [bisect.bisect_left(sorted_seq, t) for t in targets]
+
+def upper_bound_many(sorted_seq, targets):
+    np, arr = _as_numpy(sorted_seq)
+    if np is not None:
+        return np.searchsorted(arr, np.asarray(targets), side='right')
+    return [bisect.bisect_right(sorted_seq, t) for t in targets]
+
+def count_range_many(sorted_seq, lows, highs):
+    np, arr = _as_numpy(sorted_seq)
+    if np is not None:
+        counts = (np.searchsorted(arr, np.asarray(highs), side='right')
+                  - np.searchsorted(arr, np.asarray(lows), side='left'))
+        return np.maximum(counts, 0)
+    return [count_range(sorted_seq, low, high) for low, high in zip(lows, highs)]
+
+def binary_search_many(sorted_seq, targets):
+    # Leftmost index of each target, or -1 when absent (list, or ndarray on the NumPy path)
+    np, arr = _as_numpy(sorted_seq)
+    if np is not None:
+        targets = np.asarray(targets)
+        if len(arr) == 0:
+            return np.full(targets.shape, -1, dtype=np.intp)
+        idx = np.searchsorted(arr, targets, side='left')
+        found = arr[np.minimum(idx, len(arr) - 1)] == targets
+        return np.where(found, idx, -1)
+    n = len(sorted_seq)
+    positions = []
+    for t in targets:
+        i = bisect.bisect_left(sorted_seq, t)
+        positions.append(i if i < n and sorted_seq[i] == t else -1)
+    return positions
+
+# --------------------------
+# 10. Reusable Search Index
+# --------------------------
+"""
+Build once in O(n) (hash) or O(n log n) (sorted), then:
+
+  |  Operation	            |  Hash index   |  Sorted index  |
+  |-------------------------|---------------|----------------|
+  |  x in index	            |  O(1)	        |  O(log n)      |
+  |  index(x) (first pos)   |  O(log n)     |  O(log n)      |
+  |  positions(x)           |  O(k log n)   |  O(k log n)    |
+  |  append / remove        |  O(log n)*    |  O(n) memmove  |
+
+Positions stay exact under removals: removed slots become tombstones and a
+Fenwick tree counts the live slots before any slot in O(log n).
+"""
+class SearchIndex:
+    def __init__(self, items=()):
+        items = list(items)
+        self.kind = self._choose_kind(items) if items else None  # Decided by first append
+        self._build(items)
+
+    @staticmethod
+    def _choose_kind(items):
+        try:
+            set(items)
+            return 'hash'
+        except TypeError:
+            pass
+        try:
+            sorted(items)
+            return 'sorted'
+        except TypeError:
+            raise TypeError("SearchIndex needs hashable or mutually orderable items") from None
+
+    def _build(self, items):
+        self._slots = list(items)            # Value per slot (append-only between rebuilds)
+        self._alive = bytearray(b'\x01') * len(items)
+        self._live = len(items)
+        self._tree = [0] * (len(items) + 1)  # Fenwick tree over live slots (1-based)
+        for i in range(1, len(self._tree)):  # O(n) bulk build
+            self._tree[i] += 1
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+        if self.kind != 'sorted':
+            self._where = {}
+            for slot, value in enumerate(items):
+                self._where.setdefault(value, deque()).append(slot)
+        else:
+            self._keys = sorted((value, slot) for slot, value in enumerate(items))
+
+    # Fenwick helpers: O(log n)
+    def _add(self, slot, delta):
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _rank(self, slot):
+        total, i = 0, slot  # Live slots strictly before `slot`
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _select(self, position):
+        i, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:  # Descend to the slot holding the position-th live item
+            nxt = i + step
+            if nxt < len(self._tree) and self._tree[nxt] <= position:
+                i = nxt
+                position -= self._tree[nxt]
+            step >>= 1
+        return i
+
+    def _slots_of(self, value):
+        if self.kind != 'sorted':
+            try:
+                return self._where.get(value, ())
+            except TypeError:  # Unhashable values can't be in a hash index
+                return ()
+        keys = self._keys
+        try:
+            i = bisect.bisect_left(keys, (value,))
+        except TypeError:  # Not orderable against the keys: can't be present
+            return []
+        slots = []
+        while i < len(keys) and keys[i][0] == value:
+            slots.append(keys[i][1])
+            i += 1
+        return slots
+
+    # Queries
+    def __len__(self):
+        return self._live
+
+    def __contains__(self, value):
+        if self.kind != 'sorted':
+            return len(self._slots_of(value)) > 0
+        try:
+            i = bisect.bisect_left(self._keys, (value,))
+        except TypeError:
+            return False
+        return i < len(self._keys) and self._keys[i][0] == value
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self._live
+        if not 0 <= position < self._live:
+            raise IndexError("SearchIndex index out of range")
+        return self._slots[self._select(position)]
+
+    def __iter__(self):
+        return (value for value, alive in zip(self._slots, self._alive) if alive)
+
+    def count(self, value):
+        return len(self._slots_of(value))
+
+    def index(self, value):
+        slots = self._slots_of(value)
+        if not slots:
+            raise ValueError(f"{value!r} is not in index")
+        return self._rank(slots[0])
+
+    def positions(self, value):
+        return [self._rank(slot) for slot in self._slots_of(value)]
+
+    # Incremental updates
+    def append(self, value):
+        if self.kind is None:
+            self.kind = self._choose_kind([value])
+            self._keys = []
+        if self.kind == 'hash':
+            self._where.setdefault(value, deque()).append(len(self._slots))
+        else:
+            bisect.insort(self._keys, (value, len(self._slots)))
+        m = len(self._tree)  # Extend the Fenwick tree by one node
+        self._tree.append(1 + self._rank(m - 1) - self._rank(m - (m & -m)))
+        self._slots.append(value)
+        self._alive.append(1)
+        self._live += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def _discard(self, slot):
+        self._alive[slot] = 0
+        self._slots[slot] = None  # Drop the reference held by the tombstone
+        self._add(slot, -1)
+        self._live -= 1
+        if self._live * 2 < len(self._slots):  # Amortized compaction of tombstones
+            self._build(list(self))
+
+    def remove(self, value):
+        # Remove the first occurrence (like list.remove)
+        if self.kind != 'sorted':
+            try:
+                slots = self._where.get(value)
+            except TypeError:  # Unhashable: not in a hash index (ValueError, like list.remove)
+                slots = None
+            if not slots:
+                raise ValueError(f"{value!r} is not in index")
+            slot = slots.popleft()
+            if not slots:
+                del self._where[value]
+        else:
+            try:
+                i = bisect.bisect_left(self._keys, (value,))
+            except TypeError:
+                i = len(self._keys)
+            if i == len(self._keys) or self._keys[i][0] != value:
+                raise ValueError(f"{value!r} is not in index")
+            slot = self._keys.pop(i)[1]
+        self._discard(slot)
+
+    def pop(self, position=-1):
+        if position < 0:
+            position += self._live
+        if not 0 <= position < self._live:
+            raise IndexError("pop index out of range")
+        slot = self._select(position)
+        value = self._slots[slot]
+        if self.kind != 'sorted':
+            slots = self._where[value]
+            slots.remove(slot)
+            if not slots:
+                del self._where[value]
+        else:
+            self._keys.remove((value, slot))
+        self._discard(slot)
+        return value
+
+# --------------------------
+# 11. Streaming All-Pairs: O(n²) time, O(1) extra space
+# --------------------------
+# find_pairs materializes n² tuples; these yield them lazily instead.
+# unique=True yields each pair of distinct positions once (i < j), halving the work.
+def iter_pairs(lst, unique=False, start=0, stop=None):
+    # Rows start..stop of the pair space (the inner loop runs in C via zip)
+    stop = len(lst) if stop is None else stop
+    for i in range(start, stop):
+        yield from zip(repeat(lst[i]), islice(lst, i + 1, None) if unique else lst)
+
+def iter_pair_chunks(lst, chunk_size=65536, unique=False):
+    # Lists of at most chunk_size pairs: O(chunk_size) memory
+    pairs = iter_pairs(lst, unique)
+    while True:
+        chunk = list(islice(pairs, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def pair_index_blocks(n, block_rows=1024):
+    # NumPy mode: (i, j) index arrays covering block_rows rows (block_rows*n pairs) at a time
+    import numpy as np
+    cols = np.arange(n)
+    for start in range(0, n, block_rows):
+        rows = np.arange(start, min(start + block_rows, n))
+        yield np.repeat(rows, n), np.tile(cols, len(rows))
+
+# Parallel mode: split rows into shards with ~equal pair counts, reduce each in a worker
+def _row_shards(n, shards, unique):
+    total = n * (n - 1) // 2 if unique else n * n
+    bounds, done, row = [0], 0, 0
+    for k in range(1, shards):
+        target = total * k // shards
+        while row < n and done < target:
+            done += (n - row - 1) if unique else n
+            row += 1
+        bounds.append(row)
+    bounds.append(n)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+_PAIR_ITEMS = None  # Set once per worker process, so the input isn't pickled per task
+
+def _init_pair_worker(lst):
+    global _PAIR_ITEMS
+    _PAIR_ITEMS = lst
+
+def _reduce_pair_shard(reducer, lo, hi, unique):
+    return reducer(iter_pairs(_PAIR_ITEMS, unique, lo, hi))
+
+def reduce_pairs(lst, reducer, combine=None, workers=None, shards=None, unique=False):
+    # reducer(iterable_of_pairs) -> shard result; combine(a, b) merges results (optional).
+    # reducer/combine must be picklable (module-level functions) when workers != 1.
+    lst = list(lst)
+    workers = workers or os.cpu_count() or 1
+    shard_rows = _row_shards(len(lst), shards or workers * 4, unique)
+    if workers == 1:
+        results = [reducer(iter_pairs(lst, unique, lo, hi)) for lo, hi in shard_rows]
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # Imported on use: slow to import
+        with ProcessPoolExecutor(workers, initializer=_init_pair_worker, initargs=(lst,)) as pool:
+            futures = [pool.submit(_reduce_pair_shard, reducer, lo, hi, unique)
+                       for lo, hi in shard_rows]
+            results = [f.result() for f in futures]
+    if combine is None:
+        return results
+    return reduce(combine, results) if results else None
+
+# --------------------------
+# 12. Big-Integer Factorial Engine (no recursion)
+# --------------------------
+# factorial() above recurses n times (RecursionError past ~1000) and multiplies a
+# huge running product by small ints. Binary splitting multiplies operands of
+# similar size instead, which lets CPython's Karatsuba multiplication pay off.
+def product_range(lo, hi):
+    # lo * (lo+1) * ... * (hi-1), balanced product tree built bottom-up
+    if hi - lo <= 32:
+        return prod(range(lo, hi))
+    level = [prod(range(a, min(a + 16, hi))) for a in range(lo, hi, 16)]
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+def iterative_factorial(n):
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    return product_range(2, n + 1)
+
+class FactorialCache:
+    # Bounded LRU memo: a miss starts from the nearest cached k <= n, so
+    # n! = k! * product_range(k+1, n+1) costs only the missing factors.
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._values = OrderedDict()  # n -> n!, in LRU order
+        self._keys = []               # Sorted cached n, for nearest lookup
+
+    def __len__(self):
+        return len(self._values)
+
+    def __call__(self, n):
+        if n < 0:
+            raise ValueError("factorial() not defined for negative values")
+        if n in self._values:
+            self._values.move_to_end(n)
+            return self._values[n]
+        i = bisect.bisect_right(self._keys, n)
+        if i:
+            k = self._keys[i - 1]
+            value = self._values[k] * product_range(k + 1, n + 1)
+        else:
+            value = iterative_factorial(n)
+        self._store(n, value)
+        return value
+
+    def seed(self, n, value):  # Record an n! computed elsewhere, so later calls can extend it
+        self._store(n, value)
+
+    def _store(self, n, value):
+        if self.maxsize <= 0:
+            return
+        if n in self._values:  # Already indexed in _keys: just refresh recency
+            self._values.move_to_end(n)
+            return
+        self._values[n] = value
+        bisect.insort(self._keys, n)
+        if len(self._values) > self.maxsize:
+            evicted, _ = self._values.popitem(last=False)
+            del self._keys[bisect.bisect_left(self._keys, evicted)]
+
+    def clear(self):
+        self._values.clear()
+        self._keys.clear()
+
+_factorial_cache = FactorialCache()
+
+def cached_factorial(n):
+    return _factorial_cache(n)
+
+def factorials(ns):
+    # n! for many n: sort once, then each result extends the previous one
+    ns = list(ns)
+    results = {}
+    prev_n, prev = None, 1
+    for n in sorted(set(ns)):
+        if prev_n is None:
+            prev = cached_factorial(n)
+        else:
+            prev = prev * product_range(prev_n + 1, n + 1)
+        results[n] = prev
+        prev_n = n
+    if results:
+        _factorial_cache.seed(prev_n, prev)  # Largest result seeds later calls
+    return [results[n] for n in ns]
+
+def binomial(n, k):
+    # C(n, k) = (n-k+1)...n / k!, using the cache for k!
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    return product_range(n - k + 1, n + 1) // cached_factorial(k)
+
+def binomials(pairs):
+    return [binomial(n, k) for n, k in pairs]
+
+# --------------------------
+# Demo (run explicitly: `python run_demos.py day1`)
+# --------------------------
+def demo():
+    print(get_first_element([10, 20, 30]))  # Output: 10
+    print(linear_search([5, 2, 9, 1], 9))  # Output: True
+    print(find_pairs([1, 2]))  # Output: [(1,1), (1,2), (2,1), (2,2)]
+    print(list(iter_pairs([1, 2, 3], unique=True)))  # Output: [(1,2), (1,3), (2,3)]
+    print(binary_search([1, 3, 5, 7, 9], 5))  # Output: 2
+    print(binary_search_many([1, 3, 3, 5, 7], [3, 4, 7]))  # Output: [1, -1, 4]
+    print(count_range([1, 3, 3, 5, 7], 3, 5))  # Output: 3
+    index = SearchIndex([5, 2, 9, 1, 9])
+    print(9 in index, index.index(9), index.positions(9))  # Output: True 2 [2, 4]
+    print(factorial(5))  # Output: 120
+    print(iterative_factorial(10_000).bit_length())  # Output: 118459 (bits, no RecursionError)
+    print(binomial(10, 3))  # Output: 120
+
+    # timeit usage
+    import timeit
+    setup = "lst = list(range(10000))"
+    stmt = "sum(lst)"  # O(n) operation
+    time = timeit.timeit(stmt, setup, number=1000)
+    print(f"Time: {time:.6f} seconds")
+
+    # List membership test: O(n)
+    list_time = timeit.timeit('999 in lst',
+                              setup='lst=list(range(1000))',
+                              number=10000)
+
+    # Dict membership test: O(1)
+    dict_time = timeit.timeit('999 in dct',
+                              setup='dct={i:1 for i in range(1000)}',
+                              number=10000)
+
+    print(f"List: {list_time:.4f}s | Dict: {dict_time:.4f}s")
+    # Typical output: List: 0.25s | Dict: 0.0007s
+
+
+if __name__ == "__main__":
+    demo()
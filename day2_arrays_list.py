@@ -5,39 +5,30 @@ Key Differences:
 """
 
 import array  # For native arrays
-import numpy as np  # For NumPy arrays (optional but common in practice)
+import mmap
+import struct
+import sys
+from itertools import islice
+# NumPy (optional but common in practice) is imported lazily inside the
+# functions that need it, so importing this module stays cheap.
 
 # --------------------------
 # 1. Python Lists (Dynamic Arrays)
 # --------------------------
-py_list = [1, 2, "three", True]  # Heterogeneous, O(1) append
-py_list.append(4.5)  # [1, 2, 'three', True, 4.5]
-
+# py_list = [1, 2, "three", True]  -> Heterogeneous, O(1) append
 # Memory Overhead (Lists store extra metadata)
-print(f"List size: {py_list.__sizeof__()} bytes")  # ~104 bytes (varies)
 
 # --------------------------
 # 2. Native Arrays (Fixed-Type)
 # --------------------------
 # 'i' = signed integer, 'd' = double (float)
-int_array = array.array('i', [1, 2, 3, 4])  # Homogeneous, compact
-int_array.append(5)  # O(1) amortized
-try:
-    int_array.append("text")  # TypeError: integer argument expected
-except TypeError as e:
-    print(f"Array type constraint: {e}")
-
-# Memory Efficiency
-print(f"Array size: {int_array.__sizeof__()} bytes")  # ~68 bytes
+# int_array = array.array('i', [1, 2, 3, 4])  -> Homogeneous, compact
+# Appending a value of the wrong type raises TypeError
 
 # --------------------------
 # 3. NumPy Arrays (Scientific Computing)
 # --------------------------
-np_array = np.array([1.5, 2.5, 3.5], dtype=np.float32)  # Homogeneous, vectorized ops
-print(np_array * 2)  # [3., 5., 7.] (O(1) time, no loops)
-
-# Memory Comparison
-print(f"NumPy array size: {np_array.nbytes} bytes")  # 12 bytes (4 bytes per float32)
+# np.array([1.5, 2.5, 3.5], dtype=np.float32)  -> Homogeneous, vectorized ops
 
 # --------------------------
 # 4. When to Use Each
@@ -54,38 +45,24 @@ print(f"NumPy array size: {np_array.nbytes} bytes")  # 12 bytes (4 bytes per flo
 # --------------------------
 # 5. Performance Benchmark
 # --------------------------
-from timeit import timeit
-
-# Summing 1M elements
-list_time = timeit('sum(lst)', setup='lst=list(range(1_000_000))', number=100)
-array_time = timeit('sum(arr)', setup='import array; arr=array.array("i", range(1_000_000))', number=100)
-numpy_time = timeit('np.sum(np_arr)', setup='import numpy as np; np_arr=np.arange(1_000_000)', number=100)
-
-print(f"List: {list_time:.4f}s\nArray: {array_time:.4f}s\nNumPy: {numpy_time:.4f}s")
-# Typical Output:
-# List: 1.2345s
-# Array: 0.8765s
-# NumPy: 0.0123s
+# See `benchmark_sum()` below; it is only run on request.
 
 # --------------------------
 # 6. Practical Applications
 # --------------------------
 # Lists: JSON data, general sequences
-user_data = ["Alice", 30, True, ["Python", "SQL"]]
-
-# Arrays: Binary I/O, memory-sensitive tasks
-with open('data.bin', 'wb') as f:
-    int_array.tofile(f)  # Compact binary storage
-
-# NumPy: Numerical computations
-matrix = np.random.rand(1000, 1000)  # 1M elements, efficient linear algebra
+# Arrays: Binary I/O, memory-sensitive tasks (array.tofile / array.fromfile)
+# NumPy: Numerical computations (np.random.rand(1000, 1000) -> 1M elements)
 
 # --------------------------
 # 7. Exercises
 # --------------------------
 # 1. Convert list to array and benchmark
-def list_to_array(lst):
-    return array.array('i', lst)  # O(n) time
+def list_to_array(lst, typecode='i'):
+    # typecode=None picks the narrowest signed type that fits (see CompactIntArray)
+    if typecode is None:
+        typecode = narrowest_typecode(min(lst, default=0), max(lst, default=0))
+    return array.array(typecode, lst)  # O(n) time
 
 # 2. Find memory savings using arrays
 def memory_savings(lst):
@@ -93,4 +70,359 @@ def memory_savings(lst):
     arr_size = array.array('i', lst).__sizeof__()
     return list_size - arr_size
 
-print(f"Memory saved: {memory_savings(list(range(100)))} bytes")
\ No newline at end of file
+
+# --------------------------
+# 8. Typed Array Files (memory-mapped)
+# --------------------------
+"""
+`arr.tofile(f)` writes raw items only; readers must already know the typecode,
+length and byte order. This format prefixes a 16-byte header:
+
+| Offset | Size | Field                              |
+|--------|------|------------------------------------|
+| 0      | 4    | magic b'TARR'                      |
+| 4      | 1    | format version (1)                 |
+| 5      | 1    | typecode (e.g. b'i', b'q', b'd')   |
+| 6      | 1    | byte order (b'<' little, b'>' big) |
+| 7      | 1    | padding                            |
+| 8      | 8    | item count (uint64, little-endian) |
+
+Items start at offset 16, so 8-byte types stay aligned in the mapping.
+"""
+TARR_MAGIC = b'TARR'
+TARR_VERSION = 1
+_TARR_HEADER = struct.Struct('<4sBccxQ')
+_NATIVE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+def _pack_header(typecode, count, byteorder=_NATIVE_ORDER):
+    return _TARR_HEADER.pack(TARR_MAGIC, TARR_VERSION, typecode.encode(), byteorder, count)
+
+def _unpack_header(raw):
+    if len(raw) < _TARR_HEADER.size:
+        raise ValueError("file too short for a typed array header")
+    magic, version, typecode, byteorder, count = _TARR_HEADER.unpack_from(raw)
+    if magic != TARR_MAGIC or version != TARR_VERSION:
+        raise ValueError("not a typed array file (bad magic or version)")
+    return typecode.decode(), byteorder, count
+
+def write_typed_array(path, arr):
+    # O(n): header + raw items in native byte order
+    with open(path, 'wb') as f:
+        f.write(_pack_header(arr.typecode, len(arr)))
+        arr.tofile(f)
+
+def append_typed_array(path, values):
+    # O(len(values)): writes at the end and bumps the header count in place
+    with open(path, 'r+b') as f:
+        typecode, byteorder, count = _unpack_header(f.read(_TARR_HEADER.size))
+        if not isinstance(values, array.array) or values.typecode != typecode:
+            values = array.array(typecode, values)
+        if byteorder != _NATIVE_ORDER:
+            values = array.array(typecode, values)
+            values.byteswap()
+        f.seek(_TARR_HEADER.size + count * values.itemsize)
+        values.tofile(f)
+        f.seek(0)
+        f.write(_pack_header(typecode, count + len(values), byteorder))
+
+class TypedArrayFile:
+    # Read-only memory map of a typed array file: nothing is loaded up front,
+    # pages are read by the OS as they are touched.
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.typecode, self.byteorder, self.count = _unpack_header(self._mmap)
+        self.itemsize = array.array(self.typecode).itemsize
+        self.offset = _TARR_HEADER.size
+        if len(self._mmap) < self.offset + self.count * self.itemsize:
+            self._mmap.close()
+            raise ValueError("typed array file is truncated")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # Views returned by view()/as_numpy() must be released first (BufferError otherwise)
+        self._mmap.close()
+
+    @property
+    def native(self):
+        return self.byteorder == _NATIVE_ORDER
+
+    def raw(self, start=0, stop=None):
+        # Zero-copy bytes of items [start, stop)
+        stop = self.count if stop is None else min(stop, self.count)
+        lo = self.offset + start * self.itemsize
+        return memoryview(self._mmap)[lo:self.offset + stop * self.itemsize]
+
+    def view(self, start=0, stop=None):
+        # Zero-copy, array.array-like view (len, indexing, slicing, tolist())
+        if not self.native:
+            raise ValueError("file byte order differs from this machine; use iter_chunks() or as_numpy()")
+        return self.raw(start, stop).cast(self.typecode)
+
+    def as_numpy(self):
+        # Zero-copy NumPy array (read-only); non-native byte order is handled by the dtype
+        import numpy as np
+        dtype = np.dtype(self.typecode).newbyteorder(self.byteorder.decode())
+        return np.frombuffer(self._mmap, dtype=dtype, count=self.count, offset=self.offset)
+
+    def iter_chunks(self, chunk_size=1 << 20):
+        # Yields array.array copies of at most chunk_size items: O(chunk_size) memory
+        for start in range(0, self.count, chunk_size):
+            chunk = array.array(self.typecode)
+            chunk.frombytes(self.raw(start, start + chunk_size))
+            if not self.native:
+                chunk.byteswap()
+            yield chunk
+
+
+# --------------------------
+# 9. Adaptive Compact Integer Array
+# --------------------------
+# Signed typecodes from narrowest to widest, with the range each can hold
+INT_TYPECODES = ('b', 'h', 'i', 'q')
+INT_RANGES = {}
+for _tc in INT_TYPECODES:
+    _bits = array.array(_tc).itemsize * 8
+    INT_RANGES[_tc] = (-(1 << (_bits - 1)), (1 << (_bits - 1)) - 1)
+del _tc, _bits
+
+def narrowest_typecode(lo, hi):
+    for typecode in INT_TYPECODES:
+        low, high = INT_RANGES[typecode]
+        if low <= lo and hi <= high:
+            return typecode
+    raise OverflowError(f"values in [{lo}, {hi}] do not fit in a 64-bit signed integer")
+
+def deep_list_size(lst):
+    # The list's pointer block plus every distinct element object it references
+    seen = set()
+    total = sys.getsizeof(lst)
+    for item in lst:
+        if id(item) not in seen:
+            seen.add(id(item))
+            total += sys.getsizeof(item)
+    return total
+
+class CompactIntArray:
+    # Integer array stored in the narrowest typecode that fits ('b' -> 'h' -> 'i' -> 'q').
+    # Widening copies once per step (at most 3 times), so appends stay O(1) amortized.
+    def __init__(self, values=(), chunk_size=65536):
+        self._data = array.array('b')
+        self._lo, self._hi = INT_RANGES['b']
+        self.chunk_size = chunk_size
+        self.extend(values)
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    @property
+    def itemsize(self):
+        return self._data.itemsize
+
+    @property
+    def nbytes(self):
+        return len(self._data) * self._data.itemsize
+
+    def _widen(self, lo, hi):
+        if lo < self._lo or hi > self._hi:
+            # Ranges are nested, so the wider of the two typecodes fits everything
+            typecode = max(narrowest_typecode(lo, hi), self.typecode, key=INT_TYPECODES.index)
+            self._data = array.array(typecode, self._data)  # O(n) copy, once per widening
+            self._lo, self._hi = INT_RANGES[typecode]
+
+    def append(self, value):
+        if not self._lo <= value <= self._hi:
+            self._widen(value, value)
+        self._data.append(value)
+
+    def extend(self, values):
+        # Builds from any iterable one chunk at a time; never materializes the full input
+        if isinstance(values, (array.array, CompactIntArray)) and len(values):
+            self._widen(min(values), max(values))
+            self._data.extend(array.array(self.typecode, values))
+            return
+        it = iter(values)
+        while True:
+            chunk = list(islice(it, self.chunk_size))
+            if not chunk:
+                return
+            self._widen(min(chunk), max(chunk))
+            self._data.extend(chunk)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = CompactIntArray.__new__(CompactIntArray)
+            part._data = self._data[index]  # Same typecode, no widening needed
+            part._lo, part._hi = self._lo, self._hi
+            part.chunk_size = self.chunk_size
+            return part
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        if not self._lo <= value <= self._hi:
+            self._widen(value, value)
+        self._data[index] = value
+
+    def __eq__(self, other):
+        if isinstance(other, CompactIntArray):
+            return self._data.tolist() == other._data.tolist()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CompactIntArray('{self.typecode}', {self._data.tolist()!r})"
+
+    def tolist(self):
+        return self._data.tolist()
+
+    def to_array(self):
+        return array.array(self.typecode, self._data)
+
+    # Vectorized reductions: NumPy over a zero-copy view when installed, C-level builtins otherwise
+    def _numpy_view(self):
+        np = sys.modules.get('numpy')
+        if np is None:
+            try:
+                import numpy as np
+            except ImportError:
+                return None, None
+        return np, np.frombuffer(self._data, dtype=self.typecode)
+
+    def sum(self):
+        np, arr = self._numpy_view()
+        # int64 accumulation is exact while n * max|x| stays below 2**63
+        if np is not None and len(arr) and len(arr) * max(-self.min(), self.max()) < (1 << 63):
+            return int(arr.sum(dtype=np.int64))
+        return sum(self._data)
+
+    def min(self):
+        if not self._data:
+            raise ValueError("min() of empty CompactIntArray")
+        np, arr = self._numpy_view()
+        return int(arr.min()) if np is not None else min(self._data)
+
+    def max(self):
+        if not self._data:
+            raise ValueError("max() of empty CompactIntArray")
+        np, arr = self._numpy_view()
+        return int(arr.max()) if np is not None else max(self._data)
+
+    # Memory accounting: deep list size (pointer block + int objects) vs this object
+    def memory_report(self):
+        list_bytes = deep_list_size(self._data.tolist())
+        array_bytes = sys.getsizeof(self) + sys.getsizeof(self._data)
+        return {
+            'typecode': self.typecode,
+            'items': len(self),
+            'list_bytes': list_bytes,
+            'array_bytes': array_bytes,
+            'saved_bytes': list_bytes - array_bytes,
+        }
+
+    def bytes_saved(self):
+        return self.memory_report()['saved_bytes']
+
+
+# --------------------------
+# Demo (run explicitly: `python run_demos.py day2`)
+# --------------------------
+def benchmark_sum(n=1_000_000, number=100):
+    from timeit import timeit
+
+    # Summing n elements
+    list_time = timeit('sum(lst)', setup=f'lst=list(range({n}))', number=number)
+    array_time = timeit('sum(arr)', setup=f'import array; arr=array.array("i", range({n}))', number=number)
+    try:
+        numpy_time = timeit('np.sum(np_arr)', setup=f'import numpy as np; np_arr=np.arange({n})', number=number)
+    except ImportError:
+        numpy_time = None
+
+    print(f"List: {list_time:.4f}s\nArray: {array_time:.4f}s")
+    if numpy_time is not None:
+        print(f"NumPy: {numpy_time:.4f}s")
+    # Typical Output:
+    # List: 1.2345s
+    # Array: 0.8765s
+    # NumPy: 0.0123s
+
+
+def demo():
+    import os
+    import tempfile
+
+    # 1. Python Lists
+    py_list = [1, 2, "three", True]  # Heterogeneous, O(1) append
+    py_list.append(4.5)  # [1, 2, 'three', True, 4.5]
+    print(f"List size: {py_list.__sizeof__()} bytes")  # ~104 bytes (varies)
+
+    # 2. Native Arrays
+    int_array = array.array('i', [1, 2, 3, 4])  # Homogeneous, compact
+    int_array.append(5)  # O(1) amortized
+    try:
+        int_array.append("text")  # TypeError: integer argument expected
+    except TypeError as e:
+        print(f"Array type constraint: {e}")
+    print(f"Array size: {int_array.__sizeof__()} bytes")  # ~68 bytes
+
+    # 3. NumPy Arrays
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+        print("NumPy not installed; skipping NumPy examples")
+    if np is not None:
+        np_array = np.array([1.5, 2.5, 3.5], dtype=np.float32)  # Homogeneous, vectorized ops
+        print(np_array * 2)  # [3., 5., 7.] (O(1) time, no loops)
+        print(f"NumPy array size: {np_array.nbytes} bytes")  # 12 bytes (4 bytes per float32)
+
+    # 5. Performance Benchmark
+    benchmark_sum()
+
+    # 6. Arrays: Binary I/O (written to a temp dir, not the CWD)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'data.bin')
+        with open(path, 'wb') as f:
+            int_array.tofile(f)  # Compact binary storage
+        print(f"Wrote {os.path.getsize(path)} bytes to {path}")
+
+        # 8. Typed array file: self-describing header + memory-mapped reads
+        path = os.path.join(tmp, 'data.tarr')
+        write_typed_array(path, int_array)
+        append_typed_array(path, [6, 7])
+        with TypedArrayFile(path) as typed:
+            view = typed.view()
+            print(typed.typecode, len(typed), view.tolist())  # i 7 [1, 2, 3, 4, 5, 6, 7]
+            view.release()
+
+    # NumPy: Numerical computations
+    if np is not None:
+        matrix = np.random.rand(1000, 1000)  # 1M elements, efficient linear algebra
+        print(f"Matrix shape: {matrix.shape}")
+
+    # 7. Exercises
+    print(f"Memory saved: {memory_savings(list(range(100)))} bytes")
+
+    # 9. Adaptive compact integers
+    compact = CompactIntArray(range(100))
+    print(compact.typecode, compact.memory_report())  # 'b': 1 byte per item
+    compact.append(2**40)
+    print(compact.typecode, compact.max())  # 'q' 1099511627776
+
+
+if __name__ == "__main__":
+    demo()
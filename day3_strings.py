@@ -3,34 +3,24 @@ Strings: Immutable sequences of Unicode characters
 Key Concepts: Immutability, Slicing, Common Algorithms
 """
 
+import operator
+import os
+import string
+from collections import Counter, deque, namedtuple
+from itertools import accumulate, islice
+
 # --------------------------
 # 1. Core Properties
 # --------------------------
-s = "Hello, World!"
-
-# Immutability
-try:
-    s[0] = 'h'
-except TypeError:
-    print("Strigs are immutable! Create new strings instead.")
-
-# Length and Memory
-print(f"Length: {len(s)}") # 13
-print(f"Memory Size: {s.__sizeof__()} bytes") # 62 bytes (overhead + content)
+# Immutability: s[0] = 'h' raises TypeError
+# Length and Memory: len(s), s.__sizeof__() (overhead + content)
 
 # --------------------------
 # 3. Common Methods
 # --------------------------
-# Case Conversion (O(n))
-print("hello".upper())  # 'HELLO'
-
-# Searching (O(n))
-print("Hello, World!".find("World"))  # 7
-print("world" in "Hello, World!")  # True
-
-# Splitting (O(n))
-parts = "apple, banana, cherry".split(", ") # ['apple', 'banana', 'cherry']
-print(parts)
+# Case Conversion (O(n)): "hello".upper()
+# Searching (O(n)): str.find, `in`
+# Splitting (O(n)): "apple, banana, cherry".split(", ")
 
 # --------------------------
 # 4. Key Algorithms
@@ -40,33 +30,20 @@ def is_palindrome(s):
     s = ''.join(c.lower() for c in s if c.isalnum())
     return s == s[::-1]
 
-print(is_palindrome("A man, a plan, a canal: Panama"))  # True
-
 # String Compression O(n)
+# Ambiguous when s contains digits ("a12" could be 12 a's); see rle_encode (section 8)
 def compress(s):
-    compressed = []
-    count = 1
-    for i in range(1, len(s)):
-        if s[i] == s[i-1]:
-            count += 1
-        else:
-            compressed.append(f"{s[i-1]}{count}")
-            count = 1
-    compressed.append(f"{s[-1]}{count}")
-    return min(s, ''.join(compressed), key=len)
-
-print(compress("aabcccccaaa"))  # 'a2b1c5a3'
+    if not s:
+        return s
+    # Runs are found by the regex engine, so the Python work is per run, not per char
+    compressed = ''.join(f"{m.group(1)}{m.end() - m.start()}" for m in _RUN_STR.finditer(s))
+    return min(s, compressed, key=len)
 
 # --------------------------
 # 5. Performance Tips
 # --------------------------
-# Anti-Pattern: Slow concatenation (O(n²))
-result = ""
-for c in ["a", "b", "c", "d", "e"]:
-    result += c # Bad: New string created each time
-
-# Optimized: str.join() (O(n))
-result  =  "".join(["a", "b", "c", "d", "e"])  # Good: Single allocation
+# Anti-Pattern: Slow concatenation (O(n²)) -> `result += c` in a loop
+# Optimized: str.join() (O(n)) -> single allocation
 
 # --------------------------
 # 6. Exercises
@@ -87,17 +64,568 @@ def longest_unique_substring(s):
         used[c] = i
     return max_len
 
-print(longest_unique_substring("abcabcbb"))  # 3 ('abc')
-
-# 3. Anagram check (O(n))
+# 3. Anagram check (O(n) via signatures, see section 9)
 def are_anagrams(s1, s2):
-    return sorted(s1) == sorted(s2)
-
-print(are_anagrams("listen", "silent"))  # True
+    return len(s1) == len(s2) and anagram_signature(s1) == anagram_signature(s2)
 
-# 4. Regex Validator (O(n))
+# 4. Regex Validator (O(n)): compiled once; '@' check rejects most junk before the regex
 import re
+EMAIL_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
 def is_valid_email(email):
-    return bool(re.fullmatch(r"[^@]+@[^@]+\.[^@]+", email))
+    return '@' in email and EMAIL_PATTERN.fullmatch(email) is not None
+
+
+# --------------------------
+# 7. Multi-pattern Search (Aho-Corasick)
+# --------------------------
+# A trie of all patterns plus failure links (longest proper suffix that is
+# also a trie prefix) turns k separate str.find passes into one pass:
+# O(n + total pattern length + matches) for any number of patterns.
+# Works on str (characters) or bytes (byte values); build once, reuse.
+
+AhoMatch = namedtuple('AhoMatch', 'start end pattern')
+
+class AhoCorasick:
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))  # Unique, first-seen order
+        if not self.patterns:
+            raise ValueError("at least one pattern is required")
+        self.kind = type(self.patterns[0])
+        if self.kind not in (str, bytes) or any(type(p) is not self.kind for p in self.patterns):
+            raise TypeError("patterns must all be str or all be bytes")
+        if not all(self.patterns):
+            raise ValueError("empty patterns match everywhere; remove them")
+        self.goto = [{}]    # State -> {symbol: next state}
+        self.fail = [0]
+        self.out = [()]     # State -> ids of the patterns ending here (incl. via suffixes)
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:
+                nxt = self.goto[state].get(symbol)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][symbol] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] = (pid,)
+        # Breadth-first: a state's failure target is shallower, so it is final already
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and symbol not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(symbol, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] += self.out[self.fail[nxt]]
+        self.lengths = [len(p) for p in self.patterns]
+
+    def _scan(self, text, state=0, offset=0):
+        # (matches as AhoMatch with absolute offsets, final state); O(len(text) + matches)
+        goto, fail, out = self.goto, self.fail, self.out
+        lengths, patterns = self.lengths, self.patterns
+        matches = []
+        for i, symbol in enumerate(text, offset + 1):  # i = end of a match ending here
+            nxt = goto[state].get(symbol)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(symbol)
+            state = nxt or 0
+            if out[state]:
+                for pid in out[state]:
+                    matches.append(AhoMatch(i - lengths[pid], i, patterns[pid]))
+        return matches, state
+
+    # All occurrences of all patterns, overlapping, ordered by end position
+    def findall(self, text):
+        return self._scan(text)[0]
+
+    def finditer(self, text):
+        return iter(self.findall(text))
+
+    def stream(self):
+        return AhoStream(self)
+
+    # Leftmost-longest, non-overlapping matches (the ones replace() rewrites)
+    def find_leftmost_longest(self, text):
+        longest = {}
+        for match in self._scan(text)[0]:
+            if match.end - match.start > longest.get(match.start, (0, None))[0]:
+                longest[match.start] = (match.end - match.start, match)
+        chosen, end = [], 0
+        for start in sorted(longest):
+            if start >= end:
+                match = longest[start][1]
+                chosen.append(match)
+                end = match.end
+        return chosen
+
+    # One-pass multi-replace. replacements: {pattern: new}, a single str/bytes
+    # for every pattern, or a function pattern -> new.
+    def replace(self, text, replacements):
+        if isinstance(replacements, (str, bytes)):
+            new_for = lambda pattern: replacements
+        elif callable(replacements):
+            new_for = replacements
+        else:
+            new_for = replacements.__getitem__
+        pieces, last = [], 0
+        for match in self.find_leftmost_longest(text):
+            pieces.append(text[last:match.start])
+            pieces.append(new_for(match.pattern))
+            last = match.end
+        pieces.append(text[last:])
+        return self.kind().join(pieces)
+
+class AhoStream:
+    # Feed consecutive chunks; the automaton state carries over, so a match
+    # spanning a boundary is reported in the chunk where it ends (start may
+    # point into an earlier chunk). Offsets are absolute.
+    def __init__(self, automaton):
+        self.automaton = automaton
+        self.state = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        matches, self.state = self.automaton._scan(chunk, self.state, self.offset)
+        self.offset += len(chunk)
+        return matches
+
+def multi_replace(text, replacements):
+    # Convenience for one-off calls; keep the AhoCorasick object to reuse it
+    return AhoCorasick(replacements).replace(text, replacements)
+
+
+# --------------------------
+# 8. Run-length Codec (str and bytes, one-shot or streaming)
+# --------------------------
+# str format: each run is its character followed by the decimal run length,
+# omitted when 1. ASCII digits and backslashes are escaped with a backslash,
+# so "aaab1111" -> "a3b\14" decodes unambiguously (other Unicode digits such
+# as '٣' are ordinary symbols).
+# bytes format: (count, byte) pairs with count 1..255; longer runs repeat the pair.
+# Runs are found without a Python step per character: for str the regex
+# engine matches (.)\1*; for bytes, XOR-ing the input with itself shifted by
+# one (as two big ints) leaves non-zero bytes exactly at run boundaries, and
+# translate/split turn those into run lengths. bytes, bytearray, memoryview
+# and mmap inputs all work.
+_RUN_STR = re.compile(r'(.)\1*', re.S)
+_TOKEN_STR = re.compile(r'(\\.|[^\\0-9])([0-9]*)', re.S)  # ASCII digits only, as escaped
+_ESCAPED = frozenset('0123456789\\')
+_NONZERO_TO_ONE = bytes([0] + [1] * 255)
+_SINGLE_BYTES = [bytes((i,)) for i in range(256)]
+_RLE_MAX_RUN = 255
+
+def _str_runs(text):
+    # (symbols, lengths) of the maximal runs
+    try:  # Latin-1 text is one byte per char: reuse the bytes path
+        symbols, lengths = _byte_runs(text.encode('latin-1'))
+        return list(symbols.decode('latin-1')), lengths
+    except UnicodeEncodeError:
+        pass
+    symbols, lengths = [], []
+    for m in _RUN_STR.finditer(text):
+        symbols.append(m.group(1))
+        lengths.append(m.end() - m.start())
+    return symbols, lengths
+
+def _byte_runs(data):
+    n = len(data)
+    if n == 0:
+        return b'', []
+    diff = int.from_bytes(data[:n - 1], 'big') ^ int.from_bytes(data[1:], 'big')
+    boundaries = diff.to_bytes(n - 1, 'big').translate(_NONZERO_TO_ONE)
+    lengths = [len(gap) + 1 for gap in boundaries.split(b'\x01')]
+    starts = islice(accumulate(lengths, initial=0), len(lengths))
+    return bytes(map(data.__getitem__, starts)), lengths
+
+def _encode_str_runs(symbols, lengths):
+    return ''.join(('\\' + ch if ch in _ESCAPED else ch) + (str(count) if count > 1 else '')
+                   for ch, count in zip(symbols, lengths))
+
+def _encode_bytes_runs(symbols, lengths):
+    if lengths and max(lengths) > _RLE_MAX_RUN:  # Split long runs (per run, not per byte)
+        split_symbols, split_lengths = bytearray(), []
+        for symbol, count in zip(symbols, lengths):
+            while count > _RLE_MAX_RUN:
+                split_symbols.append(symbol)
+                split_lengths.append(_RLE_MAX_RUN)
+                count -= _RLE_MAX_RUN
+            split_symbols.append(symbol)
+            split_lengths.append(count)
+        symbols, lengths = split_symbols, split_lengths
+    out = bytearray(2 * len(lengths))  # Interleave counts and symbols with two C-level slice writes
+    out[0::2] = bytes(lengths)
+    out[1::2] = symbols
+    return bytes(out)
+
+def _decode_bytes_pairs(data):
+    # No per-byte Python objects: two strided slices and C-level map/join
+    if len(data) % 2:
+        raise ValueError("truncated RLE data: odd number of bytes")
+    counts, values = data[0::2], data[1::2]
+    return b''.join(map(operator.mul, map(_SINGLE_BYTES.__getitem__, values), counts))
+
+def _expand(token):
+    symbol, digits = token.groups()
+    return symbol[-1] * int(digits) if digits else symbol[-1]
+
+def _decode_str_tokens(text, start, stop):
+    pieces = []
+    pos = start
+    for m in _TOKEN_STR.finditer(text, start, stop):
+        if m.start() != pos:
+            break
+        pieces.append(_expand(m))
+        pos = m.end()
+    if pos != stop:
+        raise ValueError(f"malformed RLE text at {pos}: {text[pos:pos + 10]!r}")
+    return ''.join(pieces)
+
+def rle_encode(data):
+    if isinstance(data, str):
+        return _encode_str_runs(*_str_runs(data))
+    return _encode_bytes_runs(*_byte_runs(data))
+
+def rle_decode(data):
+    if isinstance(data, str):
+        return _decode_str_tokens(data, 0, len(data))
+    return _decode_bytes_pairs(bytes(data) if isinstance(data, memoryview) else data)
+
+class RLEEncoder:
+    # Incremental encoder: the last run of each chunk is held back, since the
+    # next chunk may continue it. Concatenated outputs equal rle_encode(whole input).
+    # text: whether to assume str output before the first feed (feed detects it)
+    def __init__(self, text=False):
+        self.pending = None  # (symbol, count) of the open run
+        self.text = text     # str input (else bytes-like)
+
+    def feed(self, chunk):
+        self.text = isinstance(chunk, str)
+        symbols, lengths = _str_runs(chunk) if self.text else _byte_runs(chunk)
+        if not lengths:
+            return self._encode(symbols, lengths)
+        if self.pending is not None:
+            symbol, count = self.pending
+            if symbols[0] == symbol:
+                lengths[0] += count
+            else:
+                symbols = ([symbol] if self.text else _SINGLE_BYTES[symbol]) + symbols
+                lengths.insert(0, count)
+        self.pending = symbols[-1], lengths.pop()
+        return self._encode(symbols[:-1], lengths)
+
+    def flush(self):
+        symbols, lengths = ([], []) if self.text else (b'', [])
+        if self.pending is not None:
+            symbol, count = self.pending
+            symbols, lengths = ([symbol] if self.text else _SINGLE_BYTES[symbol]), [count]
+        self.pending = None
+        return self._encode(symbols, lengths)
+
+    def _encode(self, symbols, lengths):
+        return _encode_str_runs(symbols, lengths) if self.text else _encode_bytes_runs(symbols, lengths)
+
+class RLEDecoder:
+    # Incremental decoder: an incomplete tail (an odd byte, or a str token
+    # whose count may continue) is carried into the next chunk.
+    def __init__(self, text=False):
+        self.carry = None
+        self.text = text
+
+    def feed(self, chunk):
+        self.text = isinstance(chunk, str)
+        if isinstance(chunk, memoryview):
+            chunk = bytes(chunk)
+        data = chunk if not self.carry else self.carry + chunk
+        if not self.text:
+            cut = len(data) - len(data) % 2
+            self.carry = data[cut:]
+            return _decode_bytes_pairs(data[:cut])
+        pieces, pos, last = [], 0, None
+        for m in _TOKEN_STR.finditer(data):
+            if m.start() != pos:
+                break
+            if last is not None:
+                pieces.append(_expand(last))
+            last, pos = m, m.end()
+        rest = data[pos:]
+        if rest == '\\':  # Escape cut off by the chunk boundary: last token is complete
+            if last is not None:
+                pieces.append(_expand(last))
+            self.carry = rest
+        elif rest:
+            raise ValueError(f"malformed RLE text at {pos}: {rest[:10]!r}")
+        else:  # Hold back the last token: more digits of its count may follow
+            self.carry = data[last.start():] if last is not None else ''
+        return ''.join(pieces)
+
+    def flush(self):
+        carry, self.carry = self.carry, None
+        if not carry:
+            return '' if self.text else b''
+        return rle_decode(carry)
+
+def rle_encode_file(src, dst, chunk_size=1 << 20):
+    # Binary files, bytes format; returns (bytes read, bytes written)
+    encoder = RLEEncoder()
+    read = written = 0
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        while chunk := fin.read(chunk_size):
+            read += len(chunk)
+            written += fout.write(encoder.feed(chunk))
+        written += fout.write(encoder.flush())
+    return read, written
+
+def rle_decode_file(src, dst, chunk_size=1 << 20):
+    decoder = RLEDecoder()
+    read = written = 0
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        while chunk := fin.read(chunk_size):
+            read += len(chunk)
+            written += fout.write(decoder.feed(chunk))
+        written += fout.write(decoder.flush())
+    return read, written
+
+
+# --------------------------
+# 9. Anagram Index (canonical signatures, O(1) group lookups)
+# --------------------------
+# Two words are anagrams iff their signatures are equal. Anagrams share
+# length and character set, so choosing the signature kind by those is safe:
+#   short words (<= SHORT_WORD): the sorted characters (C sort of a few items)
+#   longer lowercase ASCII: the 26 letter counts (26 C-level count passes, O(n))
+#   anything else longer: the character counts as a frozenset (Counter, O(n))
+SHORT_WORD = 32
+
+def anagram_signature(word):
+    if len(word) <= SHORT_WORD:
+        return ''.join(sorted(word))
+    if word.isascii() and word.isalpha() and word.islower():
+        return tuple(map(word.count, string.ascii_lowercase))
+    return frozenset(Counter(word).items())
+
+def _signatures(words):
+    # Bulk signing: if no word needs the counting path, sort+join runs entirely in C
+    if not words or max(map(len, words)) <= SHORT_WORD:
+        return map(''.join, map(sorted, words))
+    return map(anagram_signature, words)
+
+class AnagramIndex:
+    """
+    Groups words by signature: {signature: {word: None}} (insertion-ordered,
+    duplicate-free). normalize (e.g. str.lower) is applied before signing.
+    """
+    CHUNK = 4096
+
+    def __init__(self, words=(), normalize=None):
+        self.normalize = normalize
+        self.groups = {}
+        self.add_many(words)
+
+    def signature(self, word):
+        return anagram_signature(self.normalize(word) if self.normalize else word)
+
+    def add(self, word):  # O(len(word))
+        self.groups.setdefault(self.signature(word), {})[word] = None
+
+    def add_many(self, words):
+        # One streaming pass: any iterable (generator, file words) is consumed
+        # CHUNK words at a time, so memory stays bounded by the index itself
+        groups, words = self.groups, iter(words)
+        while chunk := list(islice(words, self.CHUNK)):
+            keys = list(map(self.normalize, chunk)) if self.normalize else chunk
+            for word, sig in zip(chunk, _signatures(keys)):
+                group = groups.get(sig)
+                if group is None:
+                    groups[sig] = {word: None}
+                else:
+                    group[word] = None
+
+    @classmethod
+    def from_file(cls, path, encoding='utf-8', normalize=None):
+        # Whitespace-separated words, read line by line
+        index = cls(normalize=normalize)
+        with open(path, encoding=encoding) as f:
+            index.add_many(word for line in f for word in line.split())
+        return index
+
+    def __len__(self):  # O(groups)
+        return sum(map(len, self.groups.values()))
+
+    def __contains__(self, word):
+        return word in self.groups.get(self.signature(word), ())
+
+    # All indexed anagrams of word, excluding word itself: O(len(word) + answer size)
+    def anagrams_of(self, word):
+        others = list(self.groups.get(self.signature(word), ()))
+        if word in others:
+            others.remove(word)
+        return others
+
+    def iter_groups(self, min_size=2):
+        for group in self.groups.values():
+            if len(group) >= min_size:
+                yield list(group)
+
+def are_anagrams_batch(pairs, cache=None):
+    """[are_anagrams(a, b) for a, b in pairs], signing each distinct word once.
+
+    Pass a dict as cache to share signatures across batches.
+    """
+    firsts, seconds = tuple(zip(*pairs)) or ((), ())
+    cache = {} if cache is None else cache
+    new = [word for word in dict.fromkeys(firsts + seconds) if word not in cache]
+    cache.update(zip(new, _signatures(new)))
+    # Signatures encode the length, so no separate length check is needed
+    return list(map(operator.eq, map(cache.__getitem__, firsts), map(cache.__getitem__, seconds)))
+
+
+# --------------------------
+# 10. Batch Email Validation (one regex pass per chunk of lines)
+# --------------------------
+# Same rule as is_valid_email, applied per line (lines end at \n, \r\n or \r).
+# Instead of one fullmatch call per line, a single findall per chunk skips
+# whole runs of valid lines and captures only the invalid line after each
+# run, so the Python-level work is proportional to the invalid lines only.
+# The pre-filter lives in the pattern: a line without '@' fails the run on
+# its first scan, with no backtracking into the domain part.
+_EMAIL_LINE = r'[^@\n]+@[^@\n]+\.[^@\n]+\n'
+_EMAIL_SCAN = {str: re.compile(r'(?m)^(?:' + _EMAIL_LINE + r')*([^\n]*\n|\Z)')}
+_EMAIL_SCAN[bytes] = re.compile(_EMAIL_SCAN[str].pattern.encode())
+
+EmailReport = namedtuple('EmailReport', 'offset valid invalid invalid_lines')
+
+def _email_scan(block, offset=0, encoding=None):
+    # block: str or bytes holding whole lines; offset: its position in the source
+    nl, cr = ('\n', '\r') if isinstance(block, str) else (b'\n', b'\r')
+    if cr in block:
+        block = block.replace(cr + nl, nl).replace(cr, nl)
+    if block and not block.endswith(nl):
+        block += nl
+    invalid = [line[:-1] for line in _EMAIL_SCAN[type(block)].findall(block) if line]
+    if encoding and not isinstance(block, str):
+        invalid = [line.decode(encoding, 'replace') for line in invalid]
+    return EmailReport(offset, block.count(nl) - len(invalid), len(invalid), invalid)
+
+def validate_emails(text, encoding=None):
+    """EmailReport for a str/bytes block of lines (encoding: decode invalid bytes lines)."""
+    return _email_scan(text, 0, encoding)
+
+def validate_email_stream(source, chunk_size=1 << 20, offset=0, encoding=None):
+    """
+    Yield one EmailReport per chunk of whole lines. source: a file object
+    (text or binary, read chunk_size at a time) or an iterable of str/bytes
+    chunks. Only one chunk plus a partial line is held in memory.
+    """
+    chunks = iter(lambda: source.read(chunk_size), source.read(0)) if hasattr(source, 'read') else source
+    carry = None
+    for chunk in chunks:
+        data = carry + chunk if carry else chunk
+        nl, cr = ('\n', '\r') if isinstance(data, str) else (b'\n', b'\r')
+        # Cut after the last line break; a trailing \r may be half of \r\n, so keep it
+        cut = data.rfind(nl) + 1 or data.rfind(cr, 0, len(data) - 1) + 1
+        carry = data[cut:]
+        if cut:
+            yield _email_scan(data[:cut], offset, encoding)
+            offset += cut
+    if carry:
+        yield _email_scan(carry, offset, encoding)
+
+def _email_file_range(path, start, stop, chunk_size, encoding):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        reads = iter(lambda: f.read(min(chunk_size, stop - f.tell())), b'')
+        return list(validate_email_stream(reads, chunk_size, start, encoding))
+
+def _line_aligned_ranges(path, parts):
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for k in range(1, parts):
+            f.seek(max(bounds[-1], size * k // parts - 1))
+            f.readline()  # Advance to the start of the next line
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+def validate_email_file(path, workers=None, chunk_size=1 << 20, encoding='utf-8'):
+    """
+    [EmailReport] for a file of one address per line, in file order. Each of
+    `workers` processes validates its own line-aligned byte range
+    (workers=1: in-process). Offsets are byte offsets; invalid lines are
+    decoded with `encoding` (None keeps bytes).
+    """
+    path = os.fspath(path)
+    workers = workers or os.cpu_count() or 1
+    ranges = _line_aligned_ranges(path, workers)
+    if workers == 1 or len(ranges) <= 1:
+        return [report for lo, hi in ranges
+                for report in _email_file_range(path, lo, hi, chunk_size, encoding)]
+    from concurrent.futures import ProcessPoolExecutor  # Only pay for it when used
+    with ProcessPoolExecutor(min(workers, len(ranges))) as pool:
+        parts = pool.map(_email_file_range, [path] * len(ranges), *zip(*ranges),
+                         [chunk_size] * len(ranges), [encoding] * len(ranges))
+        return [report for part in parts for report in part]
+
+
+# --------------------------
+# Demo (run explicitly: `python run_demos.py day3`)
+# --------------------------
+def demo():
+    # 1. Core Properties
+    s = "Hello, World!"
+
+    # Immutability
+    try:
+        s[0] = 'h'
+    except TypeError:
+        print("Strigs are immutable! Create new strings instead.")
+
+    # Length and Memory
+    print(f"Length: {len(s)}") # 13
+    print(f"Memory Size: {s.__sizeof__()} bytes") # 62 bytes (overhead + content)
+
+    # 3. Common Methods
+    print("hello".upper())  # 'HELLO'
+    print("Hello, World!".find("World"))  # 7
+    print("world" in "Hello, World!")  # True
+    parts = "apple, banana, cherry".split(", ") # ['apple', 'banana', 'cherry']
+    print(parts)
+
+    # 4. Key Algorithms
+    print(is_palindrome("A man, a plan, a canal: Panama"))  # True
+    print(compress("aabcccccaaa"))  # 'a2b1c5a3'
+    print(rle_encode("aaab1111"), rle_decode(rle_encode("aaab1111")))  # 'a3b\\14' 'aaab1111'
+    print(rle_encode(b"\x00" * 300 + b"ab"))  # b'\xff\x00-\x00\x01a\x01b' (300 = 255 + 45)
+
+    # 5. Performance Tips
+    result = ""
+    for c in ["a", "b", "c", "d", "e"]:
+        result += c # Bad: New string created each time
+    result  =  "".join(["a", "b", "c", "d", "e"])  # Good: Single allocation
+
+    # 6. Exercises
+    print(longest_unique_substring("abcabcbb"))  # 3 ('abc')
+    print(are_anagrams("listen", "silent"))  # True
+    print(is_valid_email("test@example.com"))  # True
+    print(validate_emails("a@b.com\nnot-an-email\nc@d.org\n"))  # EmailReport(offset=0, valid=2, invalid=1, invalid_lines=['not-an-email'])
+
+    # 7. Multi-pattern Search
+    matcher = AhoCorasick(["he", "she", "his", "hers"])
+    print([(m.start, m.pattern) for m in matcher.findall("ushers")])  # [(1, 'she'), (2, 'he'), (2, 'hers')]
+    print(matcher.replace("she sells his shells", str.upper))  # 'SHE sells HIS SHElls'
+    index = AnagramIndex(["listen", "silent", "enlist", "google", "tinsel"])
+    print(index.anagrams_of("listen"), list(index.iter_groups()))  # ['silent', 'enlist', 'tinsel'] [['listen', ...]]
+    print(are_anagrams_batch([("evil", "vile"), ("evil", "live"), ("evil", "veil!")]))  # [True, True, False]
+    stream = matcher.stream()
+    print(stream.feed("us"), stream.feed("hers"))  # Matches cross the chunk boundary, absolute offsets
+
 
-print(is_valid_email("test@example.com"))  # True
\ No newline at end of file
+if __name__ == "__main__":
+    demo()
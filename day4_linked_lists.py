@@ -3,7 +3,19 @@ Linked Lists: Sequential elements connected via pointers
 Key Concepts: Node Structure, Traversal, Dummy Nodes
 """
 
+import array
+import heapq
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import ExitStack, nullcontext
+from functools import wraps
+
 class ListNode:
+    __slots__ = ('val', 'next')  # No per-node __dict__: ~3x smaller nodes
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
@@ -12,19 +24,134 @@ class ListNode:
 # 1. Singly Linked List (SLL)
 # --------------------------
 class SLL:
-    def __init__(self):
+    def __init__(self, iterable=()):
         self.head = None
+        self.tail = None
+        self.length = 0
+        self.extend(iterable)
+
+    # Bulk build (O(n))
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(iterable)
 
-    # Append (O(n))
+    # Size (O(1), tracked on every update)
+    def __len__(self):
+        return self.length
+
+    # Append (O(1) with tail pointer)
     def append(self, val):
+        new_node = ListNode(val)
         if not self.head:
-            self.head = ListNode(val)
+            self.head = self.tail = new_node
         else:
-            curr = self.head
-            while curr.next:
-                curr = curr.next
-            curr.next = ListNode(val)
-    
+            self.tail.next = new_node
+            self.tail = new_node
+        self.length += 1
+        return new_node
+
+    # Append left (O(1))
+    def appendleft(self, val):
+        self.head = ListNode(val, self.head)
+        if self.tail is None:
+            self.tail = self.head
+        self.length += 1
+        return self.head
+
+    # Extend (O(k) for k new values)
+    def extend(self, iterable):
+        dummy = tail = ListNode()
+        count = 0
+        for val in iterable:  # Link the new run first, then splice it in once
+            tail.next = ListNode(val)
+            tail = tail.next
+            count += 1
+        if count:
+            if self.head:
+                self.tail.next = dummy.next
+            else:
+                self.head = dummy.next
+            self.tail = tail
+            self.length += count
+
+    # Pop left (O(1))
+    def popleft(self):
+        if not self.head:
+            raise IndexError("popleft from empty list")
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        node.next = None
+        self.length -= 1
+        return node.val
+
+    # Insert after a node (O(1))
+    def insert_after(self, node, val):
+        new_node = ListNode(val, node.next)
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        self.length += 1
+        return new_node
+
+    # Remove the node after `node`; node=None removes the head (O(1))
+    def remove_after(self, node):
+        if node is None:
+            return self.popleft()
+        target = node.next
+        if target is None:
+            raise IndexError("no node after the given node")
+        node.next = target.next
+        if target is self.tail:
+            self.tail = node
+        target.next = None
+        self.length -= 1
+        return target.val
+
+    # Remove first occurrence of a value (O(n))
+    def remove(self, val):
+        prev = None
+        curr = self.head
+        while curr:
+            if curr.val == val:
+                self.remove_after(prev)
+                return
+            prev, curr = curr, curr.next
+        raise ValueError(f"{val!r} not in list")
+
+    # Iteration (O(n))
+    def iter_nodes(self):
+        curr = self.head
+        while curr:
+            yield curr
+            curr = curr.next
+
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.val
+            curr = curr.next
+
+    # Reverse iteration (O(n) time, O(n) space: no prev pointers)
+    def __reversed__(self):
+        return reversed(self.to_list())
+
+    # Conversion (O(n))
+    def to_list(self):
+        return list(self)
+
+    def to_array(self, typecode='q'):
+        return array.array(typecode, self)
+
+    # In-place stable sort (O(n log n) time, O(1) extra space)
+    def sort(self, key=None, natural=True):
+        self.head = sort_linked_list(self.head, key, natural)
+        tail = self.head
+        while tail and tail.next:
+            tail = tail.next
+        self.tail = tail
+
     # Traversal (O(n))
     def print_list(self):
         curr = self.head
@@ -33,28 +160,33 @@ class SLL:
             curr = curr.next
         print("None")
 
-# Example usage of SLL
-sll = SLL()
-sll.append(1)
-sll.append(2)
-sll.append(3)
-print("SLL Print Forward")
-sll.print_list()  # Output: 1 -> 2 -> 3 -> None
-
 # --------------------------
 # 2. Doubly Linked List (DLL)
 # --------------------------
 class DLLNode:
+    __slots__ = ('val', 'prev', 'next')
+
     def __init__(self, val=0, prev=None, next=None):
         self.val = val
         self.prev = prev
         self.next = next
 
 class DLL:
-    def __init__(self):
+    def __init__(self, iterable=()):
         self.head = None
         self.tail = None
-    
+        self.length = 0
+        self.extend(iterable)
+
+    # Bulk build (O(n))
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(iterable)
+
+    # Size (O(1), tracked on every update)
+    def __len__(self):
+        return self.length
+
     # Append (O(1) with tail pointer)
     def append(self, val):
         new_node = DLLNode(val)
@@ -63,8 +195,120 @@ class DLL:
         else:
             new_node.prev = self.tail
             self.tail.next = new_node
-            self.tail = new_node   
-    
+            self.tail = new_node
+        self.length += 1
+        return new_node
+
+    # Append left (O(1))
+    def appendleft(self, val):
+        new_node = DLLNode(val, None, self.head)
+        if self.head:
+            self.head.prev = new_node
+        else:
+            self.tail = new_node
+        self.head = new_node
+        self.length += 1
+        return new_node
+
+    # Extend (O(k) for k new values)
+    def extend(self, iterable):
+        for val in iterable:
+            self.append(val)
+
+    # Insert before/after a node (O(1))
+    def insert_after(self, node, val):
+        new_node = DLLNode(val, node, node.next)
+        if node.next:
+            node.next.prev = new_node
+        else:
+            self.tail = new_node
+        node.next = new_node
+        self.length += 1
+        return new_node
+
+    def insert_before(self, node, val):
+        if node.prev is None:
+            return self.appendleft(val)
+        return self.insert_after(node.prev, val)
+
+    # Unlink a node (O(1): no search, the node knows its neighbours)
+    def remove_node(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+        return node.val
+
+    # Move an existing node to the front (O(1)), e.g. "most recently used"
+    def move_to_front(self, node):
+        if node is self.head:
+            return
+        node.prev.next = node.next  # node has a prev: it isn't the head
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+    # Pop from either end (O(1))
+    def pop(self):
+        if not self.tail:
+            raise IndexError("pop from empty list")
+        return self.remove_node(self.tail)
+
+    def popleft(self):
+        if not self.head:
+            raise IndexError("popleft from empty list")
+        return self.remove_node(self.head)
+
+    # Remove first occurrence of a value (O(n))
+    def remove(self, val):
+        for node in self.iter_nodes():
+            if node.val == val:
+                self.remove_node(node)
+                return
+        raise ValueError(f"{val!r} not in list")
+
+    # Iteration (O(n) each way)
+    def iter_nodes(self):
+        curr = self.head
+        while curr:
+            nxt = curr.next  # Read first so the caller may unlink `curr`
+            yield curr
+            curr = nxt
+
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.val
+            curr = curr.next
+
+    def __reversed__(self):
+        curr = self.tail
+        while curr:
+            yield curr.val
+            curr = curr.prev
+
+    # Conversion (O(n))
+    def to_list(self):
+        return list(self)
+
+    def to_array(self, typecode='q'):
+        return array.array(typecode, self)
+
+    # In-place stable sort (O(n log n) time, O(1) extra space)
+    def sort(self, key=None, natural=True):
+        self.head, self.tail = sort_dll(self.head, key, natural)
+
     # Traversal (Forward)
     def print_forward(self):
         curr = self.head
@@ -81,19 +325,6 @@ class DLL:
             curr = curr.prev
         print("None")
 
-# Example Usage 
-dll = DLL()
-dll.append(1)
-dll.append(2)
-dll.append(3)
-dll.append(4)
-dll.append(5)
-dll.append(6)
-print("DLL Print Forward")
-dll.print_forward()
-print("DLL Print Backward")
-dll.print_backward()
-
 # --------------------------
 # 3. Pointer Manipulation
 # --------------------------
@@ -108,24 +339,15 @@ def reverse_sll(head):
         curr = next_node
     return prev
 
-# Example
-head = ListNode(1, ListNode(2, ListNode(3)))
-reversed_head = reverse_sll(head)
-print("Reversed List: ")
-while reversed_head:
-    print(reversed_head.val, end=" -> ")
-    reversed_head = reversed_head.next # Output: 3 -> 2 -> 1 -> None
-print("None")
-
 # --------------------------
 # 4. Dummy Nodes Technique
 # --------------------------
 # Merge Two Sorted SLLs (O(n+m))
 def merge_sorted_list(l1, l2):
-    dummmy = ListNode()
+    dummy = ListNode()
     tail = dummy
     while l1 and l2:
-        if l1 < l2:
+        if l1.val <= l2.val:  # <= keeps equal values from l1 first (stable)
             tail.next = l1
             l1 = l1.next
         else:
@@ -136,6 +358,37 @@ def merge_sorted_list(l1, l2):
     tail.next = l1 or l2
     return dummy.next
 
+# Merge K Sorted SLLs (O(N log k) with a min-heap of the k current heads)
+def merge_k_sorted_lists(lists, key=None):
+    # Heap entries are (key, list index, node): the index breaks ties, so nodes
+    # are never compared and equal keys keep list order (stable)
+    heap = [((node.val if key is None else key(node.val)), i, node)
+            for i, node in enumerate(lists) if node]
+    heapq.heapify(heap)
+    dummy = tail = ListNode()
+    while heap:
+        _, i, node = heap[0]
+        nxt = node.next
+        if nxt:
+            heapq.heapreplace(heap, ((nxt.val if key is None else key(nxt.val)), i, nxt))
+        else:
+            heapq.heappop(heap)
+        tail.next = node
+        tail = node
+    tail.next = None
+    return dummy.next
+
+# Lazy K-way merge of sorted iterables: holds one item per input (bounded memory)
+def merge_sorted_iterables(*iterables, key=None):
+    return heapq.merge(*iterables, key=key)
+
+# Lazy K-way merge of pre-sorted text files (one record per line, newline stripped)
+def merge_sorted_files(paths, key=None, encoding='utf-8'):
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, encoding=encoding)) for path in paths]
+        lines = [(line.rstrip('\n') for line in f) for f in files]
+        yield from heapq.merge(*lines, key=key)
+
 # --------------------------
 # 5. Fast-Slow Pointers
 # --------------------------
@@ -158,6 +411,60 @@ def has_cycle(head):
             return True
     return False
 
+# Single-pass Analysis (Brent's cycle detection, O(n) time)
+# length counts distinct nodes; for a cyclic list kth_from_end is all None (no end)
+ListReport = namedtuple('ListReport', 'length has_cycle cycle_entry cycle_length middle kth_from_end')
+
+def analyze_list(head, ks=()):
+    """Length, cycle (entry + length), middle and k-th-from-end nodes at once.
+
+    `ks` is one k or an iterable of k values (1 = last node); they share the
+    traversal through a ring buffer of the last max(ks) nodes, grown only as
+    nodes are seen (so a huge k costs O(n), not O(k)). Safe on cyclic lists.
+    """
+    ks = [ks] if isinstance(ks, int) else list(ks)
+    if head is None:
+        return ListReport(0, False, None, 0, None, {k: None for k in ks})
+    span = max(max(ks, default=0), 1)
+    ring = [head]  # ring[i % span] = node at index i; fills up to span, then wraps
+    # Brent: the hare walks one node per step; the tortoise teleports to the
+    # hare at powers of two, so a cycle of length lam is caught within O(mu + lam)
+    power = lam = 1
+    tortoise, hare = head, head.next
+    count, middle = 1, head  # middle = node at index count // 2
+    while hare is not None and hare is not tortoise:
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        if count < span:
+            ring.append(hare)
+        else:
+            ring[count % span] = hare
+        count += 1
+        if not count & 1:
+            middle = middle.next
+        hare = hare.next
+        lam += 1
+
+    if hare is None:  # Reached the end: acyclic, everything is known already
+        kth = {k: ring[(count - k) % span] if 0 < k <= count else None for k in ks}
+        return ListReport(count, False, None, 0, middle, kth)
+
+    # Cycle of length lam: a pointer lam nodes ahead meets a pointer from head at the entry
+    ahead = head
+    for _ in range(lam):
+        ahead = ahead.next
+    entry, mu = head, 0
+    while entry is not ahead:
+        entry, ahead = entry.next, ahead.next
+        mu += 1
+    length = mu + lam
+    middle = head
+    for _ in range(length // 2):
+        middle = middle.next
+    return ListReport(length, True, entry, lam, middle, {k: None for k in ks})
+
 # --------------------------
 # 6. Exercises
 # --------------------------
@@ -196,3 +503,805 @@ def is_palindrome_linked_list(head):
         p2 = p2.next
     
     return True
+
+
+# --------------------------
+# 7. Array-backed Node Pool
+# --------------------------
+"""
+Nodes as parallel typed arrays instead of objects: node i is
+(vals[i], nexts[i], prevs[i]) with integer links and NIL = -1.
+Per node: 8 B value ('q') + 4 B per link ('i' links, so < 2**31 nodes),
+versus ~56-72 B for a slotted node object plus the boxed value.
+Freed slots are chained through `nexts` (free list), so alloc/free are O(1)
+and the arrays only grow when the free list is empty.
+"""
+NIL = -1
+
+class NodePool:
+    def __init__(self, typecode='q', doubly=False):
+        self.vals = array.array(typecode)
+        self.nexts = array.array('i')
+        self.prevs = array.array('i') if doubly else None
+        self.free = NIL  # Head of the free list
+
+    def alloc(self, val, next=NIL, prev=NIL):  # O(1) amortized
+        i = self.free
+        if i == NIL:
+            i = len(self.vals)
+            self.vals.append(val)
+            self.nexts.append(next)
+            if self.prevs is not None:
+                self.prevs.append(prev)
+        else:
+            self.free = self.nexts[i]
+            self.vals[i] = val
+            self.nexts[i] = next
+            if self.prevs is not None:
+                self.prevs[i] = prev
+        return i
+
+    def release(self, i):  # O(1)
+        self.nexts[i] = self.free
+        self.free = i
+
+class PooledSLL:
+    # Same API as SLL; nodes are indices into `pool` (NIL = no node)
+    def __init__(self, iterable=(), typecode='q', pool=None):
+        self.pool = pool or NodePool(typecode)
+        self.head = self.tail = NIL
+        self.length = 0
+        self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode='q'):
+        return cls(iterable, typecode)
+
+    def __len__(self):
+        return self.length
+
+    # Append (O(1) with tail index)
+    def append(self, val):
+        i = self.pool.alloc(val)
+        if self.head == NIL:
+            self.head = i
+        else:
+            self.pool.nexts[self.tail] = i
+        self.tail = i
+        self.length += 1
+        return i
+
+    # Append left (O(1))
+    def appendleft(self, val):
+        self.head = self.pool.alloc(val, self.head)
+        if self.tail == NIL:
+            self.tail = self.head
+        self.length += 1
+        return self.head
+
+    def extend(self, iterable):
+        for val in iterable:
+            self.append(val)
+
+    # Pop left (O(1)); the slot goes back to the pool's free list
+    def popleft(self):
+        i = self.head
+        if i == NIL:
+            raise IndexError("popleft from empty list")
+        val = self.pool.vals[i]
+        self.head = self.pool.nexts[i]
+        if self.head == NIL:
+            self.tail = NIL
+        self.pool.release(i)
+        self.length -= 1
+        return val
+
+    # Insert after a node index (O(1))
+    def insert_after(self, node, val):
+        nexts = self.pool.nexts
+        i = self.pool.alloc(val, nexts[node])
+        nexts[node] = i
+        if node == self.tail:
+            self.tail = i
+        self.length += 1
+        return i
+
+    # Remove the node after `node`; node=None (or NIL) removes the head (O(1))
+    def remove_after(self, node):
+        if node is None or node == NIL:
+            return self.popleft()
+        nexts = self.pool.nexts
+        target = nexts[node]
+        if target == NIL:
+            raise IndexError("no node after the given node")
+        nexts[node] = nexts[target]
+        if target == self.tail:
+            self.tail = node
+        val = self.pool.vals[target]
+        self.pool.release(target)
+        self.length -= 1
+        return val
+
+    # Remove first occurrence of a value (O(n))
+    def remove(self, val):
+        prev = NIL
+        for i in self.iter_nodes():
+            if self.pool.vals[i] == val:
+                self.remove_after(prev)
+                return
+            prev = i
+        raise ValueError(f"{val!r} not in list")
+
+    # Iteration (O(n)): node indices, then values
+    def iter_nodes(self):
+        nexts = self.pool.nexts
+        i = self.head
+        while i != NIL:
+            nxt = nexts[i]  # Read first so the caller may remove `i`
+            yield i
+            i = nxt
+
+    def __iter__(self):
+        vals, nexts = self.pool.vals, self.pool.nexts
+        i = self.head
+        while i != NIL:
+            yield vals[i]
+            i = nexts[i]
+
+    # Reverse iteration (O(n) time, O(n) space: no prev links)
+    def __reversed__(self):
+        return reversed(self.to_list())
+
+    # Conversion (O(n))
+    def to_list(self):
+        return list(self)
+
+    def to_array(self, typecode=None):
+        return array.array(typecode or self.pool.vals.typecode, self)
+
+    # Stable sort (O(n log n)). Relinks the node indices, so a node keeps its
+    # value as with SLL.sort; `natural` is accepted for API compatibility
+    # (Timsort already exploits runs). O(n) extra space for the index order.
+    def sort(self, key=None, natural=True):
+        self.head, self.tail = _relink_sorted(self.pool, list(self.iter_nodes()), key)
+
+    def print_list(self):
+        for val in self:
+            print(val, end=" -> ")
+        print("None")
+
+def _relink_sorted(pool, order, key):
+    # Sort node indices by value and rewrite the links; returns (head, tail)
+    vals, nexts, prevs = pool.vals, pool.nexts, pool.prevs
+    by_val = vals.__getitem__ if key is None else (lambda i: key(vals[i]))
+    order.sort(key=by_val)
+    if not order:
+        return NIL, NIL
+    for a, b in zip(order, order[1:]):
+        nexts[a] = b
+    nexts[order[-1]] = NIL
+    if prevs is not None:
+        prev = NIL
+        for i in order:
+            prevs[i] = prev
+            prev = i
+    return order[0], order[-1]
+
+class PooledDLL:
+    # Same API as DLL; nodes are indices into `pool` (NIL = no node)
+    def __init__(self, iterable=(), typecode='q', pool=None):
+        self.pool = pool or NodePool(typecode, doubly=True)
+        self.head = self.tail = NIL
+        self.length = 0
+        self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode='q'):
+        return cls(iterable, typecode)
+
+    def __len__(self):
+        return self.length
+
+    # Append (O(1) with tail pointer)
+    def append(self, val):
+        i = self.pool.alloc(val, prev=self.tail)
+        if self.head == NIL:
+            self.head = i
+        else:
+            self.pool.nexts[self.tail] = i
+        self.tail = i
+        self.length += 1
+        return i
+
+    # Append left (O(1))
+    def appendleft(self, val):
+        i = self.pool.alloc(val, self.head)
+        if self.head != NIL:
+            self.pool.prevs[self.head] = i
+        else:
+            self.tail = i
+        self.head = i
+        self.length += 1
+        return i
+
+    def extend(self, iterable):
+        for val in iterable:
+            self.append(val)
+
+    # Insert before/after a node index (O(1))
+    def insert_after(self, node, val):
+        nexts, prevs = self.pool.nexts, self.pool.prevs
+        i = self.pool.alloc(val, nexts[node], node)
+        if nexts[node] != NIL:
+            prevs[nexts[node]] = i
+        else:
+            self.tail = i
+        nexts[node] = i
+        self.length += 1
+        return i
+
+    def insert_before(self, node, val):
+        prev = self.pool.prevs[node]
+        if prev == NIL:
+            return self.appendleft(val)
+        return self.insert_after(prev, val)
+
+    # Unlink a node index (O(1)); the slot goes back to the pool's free list
+    def remove_node(self, i):
+        nexts, prevs = self.pool.nexts, self.pool.prevs
+        if prevs[i] != NIL:
+            nexts[prevs[i]] = nexts[i]
+        else:
+            self.head = nexts[i]
+        if nexts[i] != NIL:
+            prevs[nexts[i]] = prevs[i]
+        else:
+            self.tail = prevs[i]
+        val = self.pool.vals[i]
+        self.pool.release(i)
+        self.length -= 1
+        return val
+
+    # Move an existing node index to the front (O(1))
+    def move_to_front(self, i):
+        if i == self.head:
+            return
+        nexts, prevs = self.pool.nexts, self.pool.prevs
+        nexts[prevs[i]] = nexts[i]  # i has a prev: it isn't the head
+        if nexts[i] != NIL:
+            prevs[nexts[i]] = prevs[i]
+        else:
+            self.tail = prevs[i]
+        prevs[i] = NIL
+        nexts[i] = self.head
+        prevs[self.head] = i
+        self.head = i
+
+    def pop(self):
+        if self.tail == NIL:
+            raise IndexError("pop from empty list")
+        return self.remove_node(self.tail)
+
+    def popleft(self):
+        if self.head == NIL:
+            raise IndexError("popleft from empty list")
+        return self.remove_node(self.head)
+
+    # Remove first occurrence of a value (O(n))
+    def remove(self, val):
+        vals = self.pool.vals
+        for i in self.iter_nodes():
+            if vals[i] == val:
+                self.remove_node(i)
+                return
+        raise ValueError(f"{val!r} not in list")
+
+    # Iteration (O(n) each way)
+    def iter_nodes(self):
+        nexts = self.pool.nexts
+        i = self.head
+        while i != NIL:
+            nxt = nexts[i]  # Read first so the caller may unlink `i`
+            yield i
+            i = nxt
+
+    def __iter__(self):
+        vals, nexts = self.pool.vals, self.pool.nexts
+        i = self.head
+        while i != NIL:
+            yield vals[i]
+            i = nexts[i]
+
+    def __reversed__(self):
+        vals, prevs = self.pool.vals, self.pool.prevs
+        i = self.tail
+        while i != NIL:
+            yield vals[i]
+            i = prevs[i]
+
+    # Conversion (O(n))
+    def to_list(self):
+        return list(self)
+
+    def to_array(self, typecode=None):
+        return array.array(typecode or self.pool.vals.typecode, self)
+
+    # Stable sort (O(n log n), O(n) extra space); see PooledSLL.sort
+    def sort(self, key=None, natural=True):
+        self.head, self.tail = _relink_sorted(self.pool, list(self.iter_nodes()), key)
+
+    # Traversal (Forward)
+    def print_forward(self):
+        for val in self:
+            print(val, end=" <-> ")
+        print("None")
+
+    # Traversal (Backward)
+    def print_backward(self):
+        for val in reversed(self):
+            print(val, end=" <-> ")
+        print("None")
+
+# --------------------------
+# 8. In-place Merge Sort (bottom-up, O(n log n) time, O(1) extra space)
+# --------------------------
+# Relinks existing nodes: no recursion, no copy into a Python list.
+# Stable: equal keys keep their order (ties take from the left run).
+# key(val) is recomputed per comparison, since caching keys would cost O(n) space.
+def _merge_runs(a, b, key):
+    # Merge two None-terminated sorted runs; returns (head, tail)
+    dummy = tail = ListNode()
+    if key is None:
+        while a and b:
+            if b.val < a.val:
+                tail.next = b
+                b = b.next
+            else:
+                tail.next = a
+                a = a.next
+            tail = tail.next
+    else:
+        while a and b:
+            if key(b.val) < key(a.val):
+                tail.next = b
+                b = b.next
+            else:
+                tail.next = a
+                a = a.next
+            tail = tail.next
+    tail.next = a or b
+    while tail.next:
+        tail = tail.next
+    return dummy.next, tail
+
+def _cut_run(node, key):
+    # Detach the maximal non-decreasing run starting at node; returns the rest
+    if key is None:
+        while node.next and not node.next.val < node.val:
+            node = node.next
+    else:
+        while node.next and not key(node.next.val) < key(node.val):
+            node = node.next
+    rest = node.next
+    node.next = None
+    return rest
+
+def _cut(node, width):
+    # Detach the first `width` nodes starting at node; returns the rest
+    for _ in range(width - 1):
+        if node.next is None:
+            return None
+        node = node.next
+    rest = node.next
+    node.next = None
+    return rest
+
+def sort_linked_list(head, key=None, natural=True):
+    """Stable in-place merge sort of a ListNode/DLLNode chain (next links only).
+
+    natural=True merges the existing ascending runs pairwise, so input that is
+    already sorted costs one O(n) pass and k runs cost O(n log k).
+    natural=False uses fixed run widths 1, 2, 4, ... (classic bottom-up).
+    """
+    dummy = ListNode()
+    if natural:
+        while True:
+            tail, curr, runs = dummy, head, 0
+            while curr:
+                a = curr
+                curr = _cut_run(a, key)
+                runs += 1
+                if curr is None:  # Odd run out: carry it to the next pass
+                    tail.next = a
+                    break
+                b = curr
+                curr = _cut_run(b, key)
+                tail.next, tail = _merge_runs(a, b, key)
+                runs += 1
+            head = dummy.next
+            if runs <= 2:  # At most one merge happened, so one run is left
+                return head
+    width = 1
+    while True:
+        tail, curr, merges = dummy, head, 0
+        while curr:
+            a = curr
+            b = _cut(a, width)
+            curr = _cut(b, width) if b else None
+            tail.next, tail = _merge_runs(a, b, key)
+            merges += 1
+        head = dummy.next
+        if merges <= 1:
+            return head
+        width *= 2
+
+def sort_dll(head, key=None, natural=True):
+    # Sort by next links, then restore prev links in one pass; returns (head, tail)
+    head = sort_linked_list(head, key, natural)
+    prev, curr = None, head
+    while curr:
+        curr.prev = prev
+        prev, curr = curr, curr.next
+    return head, prev
+
+
+# --------------------------
+# 9. LRU / TTL Cache (hash map + DLL, O(1) get/put/evict)
+# --------------------------
+# The dict finds a key's node in O(1); the DLL keeps recency order:
+# head = most recently used, tail = next to evict.
+CacheStats = namedtuple('CacheStats', 'hits misses evictions expirations entries bytes')
+
+class LRUCache:
+    """
+    maxsize: entry limit (None = unbounded); maxbytes: limit on the summed
+    sizeof(value) (None = unbounded); ttl: default seconds before an entry
+    expires (None = never). thread_safe=True guards every call with a lock.
+    """
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, sizeof=sys.getsizeof,
+                 thread_safe=False, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self._map = {}
+        self._order = DLL()  # Node values are (key, value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.RLock() if thread_safe else nullcontext()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):  # Does not count as a use
+        with self._lock:
+            node = self._map.get(key)
+            return node is not None and not self._expired(node)
+
+    def _expired(self, node):
+        expires = node.val[3]
+        if expires is not None and self.clock() >= expires:
+            self._discard(node)
+            self.expirations += 1
+            return True
+        return False
+
+    def _discard(self, node):
+        key, _, size, _ = node.val
+        del self._map[key]
+        self._order.remove_node(node)
+        self._bytes -= size
+
+    def get(self, key, default=None):  # O(1)
+        with self._lock:
+            node = self._map.get(key)
+            if node is None or self._expired(node):
+                self.misses += 1
+                return default
+            self._order.move_to_front(node)
+            self.hits += 1
+            return node.val[1]
+
+    def put(self, key, value, ttl=None):  # O(1) amortized (each eviction is O(1))
+        with self._lock:
+            size = self.sizeof(value) if self.maxbytes is not None else 0
+            ttl = self.ttl if ttl is None else ttl
+            expires = self.clock() + ttl if ttl is not None else None
+            node = self._map.get(key)
+            if node is not None:
+                self._discard(node)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return  # Could never fit: don't flush the whole cache for it
+            self._map[key] = self._order.appendleft((key, value, size, expires))
+            self._bytes += size
+            while ((self.maxsize is not None and len(self._map) > self.maxsize)
+                   or (self.maxbytes is not None and self._bytes > self.maxbytes)):
+                self._discard(self._order.tail)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            node = self._map.get(key)
+            if node is None or self._expired(node):
+                return default
+            self._discard(node)
+            return node.val[1]
+
+    def clear(self):
+        with self._lock:
+            self._map.clear()
+            self._order = DLL()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, self.expirations,
+                              len(self._map), self._bytes)
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+def memoize(maxsize=128, maxbytes=None, ttl=None, thread_safe=False, **cache_options):
+    # Decorator backed by LRUCache; arguments must be hashable (like functools.lru_cache)
+    def decorator(func):
+        cache = LRUCache(maxsize, maxbytes, ttl, thread_safe=thread_safe, **cache_options)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # The marker keeps f(1, a=1) apart from f(1, ('a', 1)) (as functools._make_key)
+            key = (*args, _KWARGS_MARK, *sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+        wrapper.cache = cache
+        wrapper.cache_info = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+# --------------------------
+# 10. Skip List (ordered index, O(log n) expected per operation)
+# --------------------------
+# A sorted SLL with express lanes: next[0] is the plain chain, next[i] skips
+# ahead ~2^i nodes. widths[i] counts the nodes that next[i] jumps over, which
+# gives rank and index lookups in O(log n) as well.
+SKIP_MAX_LEVEL = 32
+
+class SkipNode:
+    __slots__ = ('val', 'key', 'next', 'widths')
+
+    def __init__(self, val, key, level):
+        self.val = val
+        self.key = key
+        self.next = [None] * level
+        self.widths = [0] * level
+
+class SkipList:
+    # Duplicates are kept in insertion order. seed makes the node levels reproducible.
+    def __init__(self, iterable=(), key=None, seed=None):
+        self.keyfunc = key
+        self._random = random.Random(seed)
+        self.head = SkipNode(None, None, 1)  # Sentinel; grows a lane per new top level
+        self.head.widths[0] = 1
+        self.length = 0
+        for val in iterable:
+            self.insert(val)
+
+    def __len__(self):
+        return self.length
+
+    def _key(self, val):
+        return val if self.keyfunc is None else self.keyfunc(val)
+
+    def _random_level(self):
+        # Each extra level has probability 1/2: count the trailing 1-bits of a random word
+        bits = self._random.getrandbits(SKIP_MAX_LEVEL - 1)
+        return (bits ^ (bits + 1)).bit_length()
+
+    def _bisect(self, key, right=False):
+        # (last node with key < key (<= if right), its 1-based position = rank)
+        node, steps = self.head, 0
+        for level in reversed(range(len(self.head.next))):
+            nxt = node.next[level]
+            while nxt is not None and (nxt.key <= key if right else nxt.key < key):
+                steps += node.widths[level]
+                node, nxt = nxt, nxt.next[level]
+        return node, steps
+
+    # Insert (O(log n) expected)
+    def insert(self, val):
+        key = self._key(val)
+        head = self.head
+        height = self._random_level()
+        while len(head.next) < height:  # New top lane spans the whole list
+            head.next.append(None)
+            head.widths.append(self.length + 1)
+        # Remember the last node before the insertion point on every lane
+        chain, offsets = [], []
+        prev, steps = head, 0
+        for level in reversed(range(len(head.next))):
+            nxt = prev.next[level]
+            while nxt is not None and nxt.key <= key:  # After equal keys: stable
+                steps += prev.widths[level]
+                prev, nxt = nxt, nxt.next[level]
+            chain.append(prev)
+            offsets.append(steps)
+        chain.reverse()
+        offsets.reverse()
+        node = SkipNode(val, key, height)
+        for level, prev in enumerate(chain):
+            if level < height:
+                gap = steps - offsets[level]  # Nodes between prev and the new node
+                node.next[level] = prev.next[level]
+                node.widths[level] = prev.widths[level] - gap
+                prev.next[level] = node
+                prev.widths[level] = gap + 1
+            else:
+                prev.widths[level] += 1  # Lane jumps over the new node
+        self.length += 1
+        return node
+
+    def _chain_at(self, index):
+        # Last node before 0-based `index` on every lane
+        node, steps = self.head, 0
+        chain = [None] * len(self.head.next)
+        for level in reversed(range(len(chain))):
+            while node.next[level] is not None and steps + node.widths[level] <= index:
+                steps += node.widths[level]
+                node = node.next[level]
+            chain[level] = node
+        return chain
+
+    def _index(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("skip list index out of range")
+        return index
+
+    # Delete by position (O(log n) expected)
+    def pop(self, index=-1):
+        chain = self._chain_at(self._index(index))
+        target = chain[0].next[0]
+        for level, prev in enumerate(chain):
+            if prev.next[level] is target:
+                prev.next[level] = target.next[level]
+                prev.widths[level] += target.widths[level] - 1
+            else:
+                prev.widths[level] -= 1
+        head = self.head
+        while len(head.next) > 1 and head.next[-1] is None:  # Drop empty top lanes
+            head.next.pop()
+            head.widths.pop()
+        self.length -= 1
+        return target.val
+
+    # Delete by value: first occurrence (O(log n) expected + duplicates of its key)
+    def remove(self, val):
+        key = self._key(val)
+        node, rank = self._bisect(key)
+        node = node.next[0]
+        while node is not None and node.key == key:
+            if node.val == val:
+                self.pop(rank)
+                return
+            node, rank = node.next[0], rank + 1
+        raise ValueError(f"{val!r} not in skip list")
+
+    # Search (O(log n) expected): first node with this key, or None
+    def search(self, key):
+        node = self._bisect(key)[0].next[0]
+        return node if node is not None and node.key == key else None
+
+    def __contains__(self, val):
+        key = self._key(val)
+        node = self.search(key)
+        while node is not None and node.key == key:
+            if node.val == val:
+                return True
+            node = node.next[0]
+        return False
+
+    # Rank: number of items with a smaller key, i.e. bisect_left (O(log n) expected)
+    def rank(self, key):
+        return self._bisect(key)[1]
+
+    def bisect_right(self, key):
+        return self._bisect(key, right=True)[1]
+
+    def __getitem__(self, index):  # O(log n) expected, via the lane widths
+        index = self._index(index)
+        node, steps = self.head, -1  # head sits at position -1
+        for level in reversed(range(len(node.next))):
+            while node.next[level] is not None and steps + node.widths[level] <= index:
+                steps += node.widths[level]
+                node = node.next[level]
+        return node.val
+
+    # Range scan lo <= key < hi (O(log n + k)); None leaves that side open
+    def range(self, lo=None, hi=None):
+        node = (self.head if lo is None else self._bisect(lo)[0]).next[0]
+        while node is not None and (hi is None or node.key < hi):
+            yield node.val
+            node = node.next[0]
+
+    def iter_nodes(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node
+            node = node.next[0]
+
+    def __iter__(self):
+        for node in self.iter_nodes():
+            yield node.val
+
+    def to_list(self):
+        return list(self)
+
+
+# --------------------------
+# Demo (run explicitly: `python run_demos.py day4`)
+# --------------------------
+def demo():
+    # Example usage of SLL
+    sll = SLL()
+    sll.append(1)
+    sll.append(2)
+    sll.append(3)
+    print("SLL Print Forward")
+    sll.print_list()  # Output: 1 -> 2 -> 3 -> None
+    sll.extend([4, 5])
+    print(len(sll), sll.popleft(), list(reversed(sll)))  # Output: 5 1 [5, 4, 3, 2]
+    unsorted = SLL([3, 1, 2])
+    unsorted.sort()
+    unsorted.print_list()  # Output: 1 -> 2 -> 3 -> None
+
+    # Single-pass analysis, safe on a cycle: 1 -> 2 -> 3 -> 4 -> (back to 2)
+    cyclic = SLL([1, 2, 3, 4])
+    cyclic.tail.next = cyclic.head.next
+    report = analyze_list(cyclic.head)
+    print(report.length, report.cycle_entry.val, report.cycle_length, report.middle.val)  # Output: 4 2 3 3
+
+    # LRU cache on the DLL
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')       # 'a' becomes most recent
+    cache.put('c', 3)    # Evicts 'b'
+    print('b' in cache, cache.stats())  # Output: False CacheStats(hits=1, misses=0, evictions=1, ...)
+
+    # Skip list: ordered index with O(log n) insert/search/rank
+    index = SkipList([30, 10, 50, 20, 40], seed=0)
+    print(index.to_list(), index.rank(35), index[1], list(index.range(20, 45)))  # Output: [10, 20, 30, 40, 50] 3 20 [20, 30, 40]
+
+    # Example usage of DLL
+    dll = DLL()
+    for val in range(1, 7):
+        dll.append(val)
+    print("DLL Print Forward")
+    dll.print_forward()
+    print("DLL Print Backward")
+    dll.print_backward()
+
+    # Reverse SLL
+    head = ListNode(1, ListNode(2, ListNode(3)))
+    reversed_head = reverse_sll(head)
+    print("Reversed List: ")
+    while reversed_head:
+        print(reversed_head.val, end=" -> ")
+        reversed_head = reversed_head.next # Output: 3 -> 2 -> 1 -> None
+    print("None")
+
+    # Array-backed node pool
+    pooled = PooledDLL()
+    for val in range(1, 4):
+        pooled.append(val)
+    pooled.print_backward()  # Output: 3 <-> 2 <-> 1 <-> None
+
+
+if __name__ == "__main__":
+    demo()
@@ -3,6 +3,15 @@ Stacks: Last-In-First-Out (LIFO) data structure
 Key Operations: Push, Pop, Peek, Applications
 """
 
+import array
+import math
+import os
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+
 # --------------------------
 # 1. Stack Implementation
 # --------------------------
@@ -29,105 +38,204 @@ class Stack:
     def size(self):
         return len(self.items)  # O(1)
     
-stack = Stack()
-stack.push(10)
-stack.push(20)
-stack.push(30)
-print("Stack after pushes:", stack.items)  # Output: [10, 20, 30]
-print("Pop:", stack.pop())  # Output: 30
-print("Peek:", stack.peek())  # Output: 20
-print("Size after pop:", stack.size())  # Output: 2
-print("Is stack empty?", stack.is_empty())  # Output: False
 
 # --------------------------
 # 2. Built-in Alternatives
 # --------------------------
-# Python lists can act as stacks (but lack explicit APIs)
-stack_list = []
-stack_list.append(10)  # Push
-stack_list.pop()  # Pop (raises IndexError if empty)
-
-# collections.deque is optimized for stack operations
-from collections import deque
-deque_stack = deque()
-deque_stack.append(40)  # Push
-deque_stack.pop()  # Pop (raises IndexError if empty)
+# Python lists can act as stacks (but lack explicit APIs):
+#   list.append (push), list.pop (pop, raises IndexError if empty)
+# collections.deque is optimized for stack operations:
+#   deque.append (push), deque.pop (pop, raises IndexError if empty)
 
 # --------------------------
 # 3. Applications
 # --------------------------
 # A. Parentheses Matching (O(n))
-def is_balanced(expr):
-    stack = Stack()
-    pairs = { ')':'(', '}':'{', ']':'[' }
+# Brackets are pushed as small int codes so a NumericStack works as well
+OPENING = {'(': 1, '{': 2, '[': 3}
+CLOSING = {')': 1, '}': 2, ']': 3}
+
+def is_balanced(expr, stack_factory=Stack):
+    stack = stack_factory()
     for char in expr:
-        if char in pairs.values():
-            stack.push(char)
-        elif char in pairs:
-            if stack.is_empty() or stack.pop() != pairs[char]:
+        if char in OPENING:
+            stack.push(OPENING[char])
+        elif char in CLOSING:
+            if stack.is_empty() or stack.pop() != CLOSING[char]:
                 return False
     return stack.is_empty()
 
-print(is_balanced("({[]})"))  # True
-print(is_balanced("({[)]})"))  # False
 
 # B. Undo/Redo Mechanism
+# The document is a Rope (section 9): insert/delete anywhere in O(log n)
+# instead of copying the whole string per edit. History records are
+# ('insert' | 'delete', pos, text). Adjacent single-character edits (typing,
+# backspace, forward delete) coalesce into one record, up to COALESCE_MAX
+# characters and breaking where text switches between space and non-space.
+# The oldest records are dropped beyond max_history entries or
+# max_history_chars characters.
+COALESCE_MAX = 256
+
 class TextEditor:
-    def __init__(self):
-        self.text = ""
+    def __init__(self, text="", max_history=1000, max_history_chars=1 << 20):
+        self.rope = Rope(text)
         self.undo_stack = Stack()
         self.redo_stack = Stack()
+        self.max_history = max_history
+        self.max_history_chars = max_history_chars
+        self.history_chars = 0  # Characters held by undo_stack records
+        self._open = False      # Top undo record still accepts keystrokes
+
+    @property
+    def text(self):  # O(n): materializes the document
+        return str(self.rope)
 
-    def write(self, char):
-        self.text += char
-        self.undo_stack.push(('add', len(char)))
+    @text.setter
+    def text(self, value):
+        self.rope = Rope(value)
+
+    def __len__(self):
+        return len(self.rope)
+
+    def snapshot(self):  # O(1): ropes are immutable and share structure
+        return self.rope
+
+    def write(self, chars):  # Type at the end of the document
+        self.insert(len(self.rope), chars)
+
+    def _clamp(self, pos):  # Records must hold the position the rope actually used
+        return max(0, min(pos, len(self.rope)))
+
+    def insert(self, pos, chars):  # O(log n)
+        if not chars:
+            return
+        pos = self._clamp(pos)
+        self.rope = self.rope.insert(pos, chars)
+        self._record('insert', pos, chars)
+
+    def delete(self, start, end=None):  # Removes text[start:end] (one char by default)
+        end = self._clamp(start + 1 if end is None else end)
+        start = self._clamp(start)
+        if start >= end:  # Nothing removed: no record, redo history kept
+            return
+        removed = self.rope[start:end]
+        self.rope = self.rope.delete(start, end)
+        self._record('delete', start, removed)
+
+    def _record(self, action, pos, text):
         self.redo_stack = Stack() # Clear redo on new action
+        undo = self.undo_stack
+        keystroke = len(text) == 1
+        if keystroke and self._open:
+            last, last_pos, last_text = undo.peek()
+            merged = None
+            edge = last_text[-1] if action == 'insert' or pos == last_pos else last_text[0]
+            if (last == action and len(last_text) < COALESCE_MAX
+                    and text.isspace() == edge.isspace()):
+                if action == 'insert' and pos == last_pos + len(last_text):
+                    merged = (action, last_pos, last_text + text)       # Typing on
+                elif action == 'delete' and pos + len(text) == last_pos:
+                    merged = (action, pos, text + last_text)            # Backspace
+                elif action == 'delete' and pos == last_pos:
+                    merged = (action, pos, last_text + text)            # Forward delete
+            if merged is not None:
+                undo.pop()
+                undo.push(merged)
+                self.history_chars += len(text)
+                self._trim_history()
+                return
+        undo.push((action, pos, text))
+        self._open = keystroke
+        self.history_chars += len(text)
+        self._trim_history()
+
+    def _trim_history(self):
+        # Drop the oldest records (bottom of the stack) beyond the caps; keep the newest
+        items = self.undo_stack.items
+        drop = max(0, len(items) - self.max_history)
+        dropped = sum(len(record[2]) for record in items[:drop])
+        while drop < len(items) - 1 and self.history_chars - dropped > self.max_history_chars:
+            dropped += len(items[drop][2])
+            drop += 1
+        if drop:
+            self.history_chars -= dropped
+            del items[:drop]
 
+    def _apply(self, action, pos, text):
+        if action == 'insert':
+            self.rope = self.rope.insert(pos, text)
+        else:
+            self.rope = self.rope.delete(pos, pos + len(text))
+
+    # Undo/redo return the document as a Rope snapshot (O(1); prints, compares
+    # and concatenates with str like a str)
     def undo(self):
         if not self.undo_stack.is_empty():
-            action, pos = self.undo_stack.pop()
-            if action == "add":
-                removed = self.text[-pos:]
-                self.text = self.text[:-pos]
-                self.redo_stack.push(('remove', removed))
-            return self.text
+            action, pos, text = self.undo_stack.pop()
+            self._open = False
+            self.history_chars -= len(text)
+            self._apply('delete' if action == 'insert' else 'insert', pos, text)
+            self.redo_stack.push((action, pos, text))
+            return self.rope
         return "Nothing to undo"
 
     def redo(self):
         if not self.redo_stack.is_empty():
-            action, data = self.redo_stack.pop()
-            if action == "remove":
-                self.text += data
-                self.undo_stack.push(('add', len(data)))
-            return self.text
+            action, pos, text = self.redo_stack.pop()
+            self._open = False
+            self._apply(action, pos, text)
+            self.undo_stack.push((action, pos, text))
+            self.history_chars += len(text)
+            self._trim_history()
+            return self.rope
         return "Nothing to redo"
 
-editor = TextEditor()
-editor.write("hello")
-editor.write("world")
-print("Text: ", editor.text)
-print("Undo: ", editor.undo())  # "hello"
-print("Redo: ", editor.redo())  # "hello world"
-
 # --------------------------
 # 4. Advanced Use Cases
 # --------------------------
 # A. Postfix Evaluation (O(n))
-def eval_postfix(expr):
-    stack = Stack()
-    for token in expr.split():
-        if token.isdigit():
-            stack.push(int(token))
-        else:
+# Numbers may be negative or floats ("-3", "2.5", "1e3"); '~' negates and
+# '^' raises to a power (the compiler's postfix output, see section 7).
+# variables maps any other token to its value.
+# stack_factory: e.g. lambda: NumericStack('d') (float, since '/' yields floats)
+_NUMBER = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+def _number(token):
+    if not _NUMBER.fullmatch(token):
+        return None  # Not a literal ("inf"/"nan" stay variable names)
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def eval_postfix(expr, stack_factory=Stack, variables=None):
+    # expr: a postfix string, or a token sequence such as CompiledExpression.postfix
+    stack = stack_factory()
+    for token in expr.split() if isinstance(expr, str) else expr:
+        if token == '~':
+            stack.push(-stack.pop())
+        elif token in BINARY_OPS:
+            b = stack.pop()  # Right operand is on top
             a = stack.pop()
-            b = stack.pop()
-            if token == '+': stack.push(a+b)
-            elif token == '-': stack.push(a-b)
-            elif token == '*': stack.push(a*b)
-            elif token == '/': stack.push(a/b)
+            stack.push(BINARY_OPS[token](a, b))
+        else:
+            value = _number(token) if isinstance(token, str) else token
+            if value is None:
+                if variables is None or token not in variables:
+                    raise ValueError(f"unknown token {token!r}")
+                value = variables[token]
+            stack.push(value)
     return stack.pop()
 
-print(eval_postfix("3 4 + 5 *")) # 35
+
+BINARY_OPS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': lambda a, b: a / b,
+    '^': lambda a, b: a ** b,
+}
+
 
 # B. Browser History (Simplified)
 class Browser:
@@ -162,26 +270,759 @@ def reverse_string(s):
         reversed_string += stack.pop()
     return reversed_string
 
-print(reverse_string("Hello, This is a reversed string"))
 
 # 2. Check for redundant parentheses
 def has_redundant_parentheses(expr):
     stack = Stack()
-    for char in expr:
+    for i, char in enumerate(expr):
         if char == ")":
+            if stack.is_empty():
+                raise ValueError(f"unmatched ')' at {i}")
             top = stack.pop()
             if top == "(":
                 return True
             while top != "(":
+                if stack.is_empty():
+                    raise ValueError(f"unmatched ')' at {i}")
                 top = stack.pop()
         else:
             stack.push(char)
     return False
 
-print(has_redundant_parentheses("(())"))
 
+# --------------------------
+# 6. Typed Numeric Stack (array.array, bulk operations, optional capacity)
+# --------------------------
+# Stores raw machine numbers instead of boxed objects (8 bytes per item for
+# 'q'/'d' vs a pointer + int object). push/pop are bound straight to the
+# array's C methods when no capacity check is needed.
+#   capacity=None: unbounded
+#   on_full='error': a push beyond capacity raises IndexError, nothing is pushed
+#   on_full='overwrite': ring buffer, a push beyond capacity drops the oldest item
+class NumericStack:
+    def __init__(self, typecode='q', iterable=(), capacity=None, on_full='error'):
+        if on_full not in ('error', 'overwrite'):
+            raise ValueError("on_full must be 'error' or 'overwrite'")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.typecode = typecode
+        self.capacity = capacity
+        self.on_full = on_full
+        self.ring = capacity is not None and on_full == 'overwrite'
+        if self.ring:
+            # items is the raw ring: logical item i lives at items[(start + i) % capacity]
+            self.items = array.array(typecode, [0]) * capacity
+            self.start = self.count = 0
+            self.push, self.pop = self._ring_push, self._ring_pop
+        else:
+            self.items = array.array(typecode)
+            if capacity is None:
+                self.push, self.pop = self.items.append, self.items.pop  # No Python frame per call
+            else:
+                self.push, self.pop = self._bounded_push, self._pop
+        self.push_many(iterable)
+
+    # Bounded push (O(1))
+    def _bounded_push(self, item):
+        if len(self.items) >= self.capacity:
+            raise IndexError("Push to full stack")
+        self.items.append(item)
+
+    def _pop(self):
+        if self.items:
+            return self.items.pop()
+        raise IndexError("Pop from empty stack")
+
+    # Ring push/pop (O(1))
+    def _ring_push(self, item):
+        if self.count < self.capacity:
+            self.items[(self.start + self.count) % self.capacity] = item
+            self.count += 1
+        else:  # Overwrite the oldest entry, which becomes the newest
+            self.items[self.start] = item
+            self.start = (self.start + 1) % self.capacity
+
+    def _ring_pop(self):
+        if not self.count:
+            raise IndexError("Pop from empty stack")
+        self.count -= 1
+        return self.items[(self.start + self.count) % self.capacity]
+
+    def _ring_slice(self, lo, hi):
+        # Logical items lo..hi-1 as one array (at most two slices of the ring)
+        first = (self.start + lo) % self.capacity
+        last = first + hi - lo
+        if last <= self.capacity:
+            return self.items[first:last]
+        return self.items[first:] + self.items[:last - self.capacity]
+
+    # Bulk push (O(k), one C-level extend)
+    def push_many(self, values):
+        values = array.array(self.typecode, values)
+        if not self.ring:
+            if self.capacity is not None and len(self.items) + len(values) > self.capacity:
+                raise IndexError("Push to full stack")
+            self.items.extend(values)
+            return
+        if len(values) >= self.capacity:
+            self.items[:] = values[len(values) - self.capacity:]
+            self.start, self.count = 0, self.capacity
+            return
+        end = (self.start + self.count) % self.capacity  # First free (or oldest) slot
+        head = min(len(values), self.capacity - end)
+        self.items[end:end + head] = values[:head]
+        self.items[:len(values) - head] = values[head:]
+        overflow = self.count + len(values) - self.capacity
+        if overflow > 0:
+            self.start = (self.start + overflow) % self.capacity
+        self.count = min(self.count + len(values), self.capacity)
+
+    # Bulk pop (O(k)): the top k items in pop order, topmost first
+    def pop_many(self, k):
+        size = self.size()
+        if k > size:
+            raise IndexError("Pop from empty stack")
+        if k <= 0:
+            return array.array(self.typecode)
+        if self.ring:
+            top = self._ring_slice(self.count - k, self.count)
+            self.count -= k
+        else:
+            top = self.items[size - k:]
+            del self.items[size - k:]
+        top.reverse()
+        return top
+
+    def peek(self):
+        if self.ring:
+            if self.count:
+                return self.items[(self.start + self.count - 1) % self.capacity]
+        elif self.items:
+            return self.items[-1]
+        raise IndexError("Peek from empty stack")
+
+    def is_empty(self):
+        return not (self.count if self.ring else self.items)
+
+    def size(self):
+        return self.count if self.ring else len(self.items)
+
+    __len__ = size
+
+    def to_list(self):  # Bottom to top
+        if self.ring:
+            return self._ring_slice(0, self.count).tolist()
+        return self.items.tolist()
+
+
+# --------------------------
+# 7. Expression Compiler (infix -> postfix -> Python function)
+# --------------------------
+# Parse once with the shunting-yard algorithm (an operator stack), cache the
+# result by expression string, then evaluate many times without re-parsing.
+# Precedence: + - < * / < unary - < ^ ; '^' and unary '-' are right-associative.
+PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, '~': 3, '^': 4}
+RIGHT_ASSOC = {'~', '^'}
+PYTHON_OPS = {'+': '+', '-': '-', '*': '*', '/': '/', '^': '**'}
+# PRECEDENCE also matches Python's binding strength ('**' over unary '-'),
+# so the code generator reuses it; names and literals bind tightest
+_PY_ATOM = max(PRECEDENCE.values()) + 1
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<op>[-+*/^()])
+      | (?P<bad>\S)
+    )""", re.VERBOSE)
+
+def tokenize(expr):
+    # Yields numbers (int/float), variable names and operator/paren strings
+    for match in _TOKEN.finditer(expr):
+        kind = match.lastgroup
+        if kind == 'bad':
+            raise ValueError(f"unexpected character {match.group(kind)!r} at {match.start(kind)}")
+        if kind is None:  # Trailing whitespace
+            continue
+        text = match.group(kind)
+        if kind == 'num':
+            yield _number(text)
+        else:
+            yield text
+
+def to_postfix(expr):
+    """Infix string -> postfix token list, e.g. '-a + 2*b' -> ['a', '~', 2, 'b', '*', '+']."""
+    output = []
+    ops = Stack()
+    expect_operand = True  # Alternating operand/operator states reject malformed input
+    for token in tokenize(expr):
+        if expect_operand:
+            if token == '(':
+                ops.push(token)
+            elif token == '-':
+                ops.push('~')  # Unary minus: prefix, never pops anything
+            elif token == '+':
+                pass  # Unary plus is a no-op
+            elif token in PRECEDENCE or token == ')':
+                raise ValueError(f"expected an operand before {token!r} in {expr!r}")
+            else:
+                output.append(token)
+                expect_operand = False
+        elif token == ')':
+            while not ops.is_empty() and ops.peek() != '(':
+                output.append(ops.pop())
+            if ops.is_empty():
+                raise ValueError(f"unmatched ')' in {expr!r}")
+            ops.pop()
+        elif token in PRECEDENCE:
+            prec = PRECEDENCE[token]
+            while not ops.is_empty() and ops.peek() != '(':
+                top = PRECEDENCE[ops.peek()]
+                if top > prec or (top == prec and token not in RIGHT_ASSOC):
+                    output.append(ops.pop())
+                else:
+                    break
+            ops.push(token)
+            expect_operand = True
+        else:
+            raise ValueError(f"expected an operator before {token!r} in {expr!r}")
+    if expect_operand:
+        raise ValueError(f"incomplete expression {expr!r}")
+    while not ops.is_empty():
+        op = ops.pop()
+        if op == '(':
+            raise ValueError(f"unmatched '(' in {expr!r}")
+        output.append(op)
+    return output
+
+class CompiledExpression:
+    """
+    An infix expression compiled to a Python function of its variables.
+    Variables are ordered by first appearance; call with a mapping and/or
+    keyword arguments, or evaluate whole rows/columns at once.
+    """
+    def __init__(self, expr):
+        self.expr = expr
+        self.postfix = tuple(to_postfix(expr))
+        self.variables = tuple(dict.fromkeys(t for t in self.postfix if isinstance(t, str)
+                                             and t not in PRECEDENCE))
+        self.source, constants = self._generate()
+        try:
+            # Only numbers, fixed operators and positional parameters reach eval
+            self.func = eval(self.source, {'__builtins__': {}, **constants})
+        except (SyntaxError, RecursionError, MemoryError):
+            # Too large for the Python compiler: evaluate the postfix tokens instead
+            self.source = None
+            postfix, names = self.postfix, self.variables
+            self.func = lambda *values: eval_postfix(postfix, variables=dict(zip(names, values)))
+
+    def _generate(self):
+        # Returns (lambda source, {name: constant}). Each stack entry is
+        # (code, binding strength); parentheses are added only where Python's
+        # precedence would otherwise regroup the postfix tree, so flat chains
+        # stay flat and the evaluation order matches eval_postfix exactly.
+        params = {name: f'_{i}' for i, name in enumerate(self.variables)}
+        constants = {}
+        stack = Stack()
+        for token in self.postfix:
+            if token == '~':
+                code, prec = stack.pop()
+                unary = PRECEDENCE['~']
+                stack.push((f'-{code}' if prec >= unary else f'-({code})', unary))
+            elif token in PYTHON_OPS:
+                prec = PRECEDENCE[token]
+                b, b_prec = stack.pop()
+                a, a_prec = stack.pop()
+                if token == '^':  # Right-associative; 'a ** -b' needs no parentheses
+                    a = a if a_prec > prec else f'({a})'
+                    b = b if b_prec >= PRECEDENCE['~'] else f'({b})'
+                else:  # Left-associative: keep a + (b + c) grouped for float exactness
+                    a = a if a_prec >= prec else f'({a})'
+                    b = b if b_prec > prec else f'({b})'
+                stack.push((f'{a} {PYTHON_OPS[token]} {b}', prec))
+            elif isinstance(token, str):
+                stack.push((params[token], _PY_ATOM))
+            elif isinstance(token, float) and not math.isfinite(token):
+                name = f'_c{len(constants)}'  # repr would give the name 'inf'
+                constants[name] = token
+                stack.push((name, _PY_ATOM))
+            else:
+                stack.push((repr(token), _PY_ATOM))
+        return f"lambda {', '.join(params.values())}: {stack.pop()[0]}", constants
+
+    def __repr__(self):
+        return f'CompiledExpression({self.expr!r})'
+
+    @property
+    def postfix_string(self):  # Accepted by eval_postfix(..., variables=...)
+        return ' '.join(map(str, self.postfix))
+
+    def __call__(self, bindings=None, **kwargs):
+        if kwargs:
+            bindings = {**bindings, **kwargs} if bindings else kwargs
+        return self.func(*[bindings[name] for name in self.variables])
+
+    # Many bindings: one function call per row, no per-row parsing (O(rows))
+    def evaluate_many(self, rows):
+        func, names = self.func, self.variables
+        if not names:
+            return [func() for _ in rows]
+        if len(names) == 1:
+            get = itemgetter(names[0])
+            return [func(get(row)) for row in rows]
+        get = itemgetter(*names)
+        return [func(*get(row)) for row in rows]
+
+    # Columns: {name: sequence}. NumPy arrays (or any sequences, if NumPy is
+    # already imported) are combined with whole-array operations; otherwise
+    # map() walks the columns in step.
+    def evaluate_columns(self, columns):
+        cols = [columns[name] for name in self.variables]
+        np = sys.modules.get('numpy')
+        if np is not None and cols:
+            return self.func(*[np.asarray(col) for col in cols])
+        if not cols:
+            return self.func()
+        return list(map(self.func, *cols))
+
+@lru_cache(maxsize=1024)
+def compile_expression(expr):
+    # Cached by expression string: repeated rules compile once
+    return CompiledExpression(expr)
+
+def evaluate(expr, bindings=None, **kwargs):
+    return compile_expression(expr)(bindings, **kwargs)
+
+
+# --------------------------
+# 8. Streaming Bracket Validator (chunked, resumable, str or bytes)
+# --------------------------
+# State between chunks is just the open-bracket stack (codes + positions,
+# typed arrays) and the absolute offset, so input never has to fit in memory.
+# Fast path: re.findall pulls out only the brackets in C, so runs of other
+# text cost no Python bytecode. Inside a chunk a bracket is known by its
+# ordinal; character offsets are only worked out for a mismatch and for the
+# openers still unclosed when the chunk ends (scanning back from its end).
+BracketReport = namedtuple('BracketReport', 'balanced position reason')
+
+_BRACKET_RE = {str: re.compile(r'[(){}\[\]]'), bytes: re.compile(rb'[(){}\[\]]')}
+_OPEN_CODES = {**OPENING, **{k.encode(): v for k, v in OPENING.items()}}
+_CLOSE_CODES = {**CLOSING, **{k.encode(): v for k, v in CLOSING.items()}}
+_OPEN_CHARS = '?({['
+_CLOSE_CHARS = '?)}]'
+
+class BracketValidator:
+    def __init__(self):
+        self.codes = array.array('b')      # Open bracket codes (1..3), innermost last
+        self.positions = array.array('q')  # Where each of them opened
+        self.offset = 0                    # Characters (or bytes) consumed so far
+        self.error = None                  # First mismatch, as a BracketReport
+
+    # Consume the next chunk (O(len(chunk))); returns False once a mismatch was seen
+    def feed(self, chunk):
+        if self.error is not None:
+            return False
+        if isinstance(chunk, (bytearray, memoryview)):
+            chunk = bytes(chunk)
+        pattern = _BRACKET_RE[type(chunk)]
+        codes, positions = self.codes, self.positions
+        push_code, push_position = codes.append, positions.append
+        pop_code, pop_position = codes.pop, positions.pop
+        opens, closes = _OPEN_CODES, _CLOSE_CODES
+        brackets = pattern.findall(chunk)
+        for i, bracket in enumerate(brackets):
+            code = opens.get(bracket)
+            if code is not None:
+                push_code(code)
+                push_position(~i)  # Negative: an ordinal in this chunk, resolved below
+                continue
+            code = closes[bracket]
+            if not codes or codes[-1] != code:
+                self._mismatch(chunk, pattern, i, code)
+                break
+            pop_code()
+            pop_position()
+        self._resolve(chunk, pattern, len(brackets))
+        self.offset += len(chunk)
+        return self.error is None
+
+    def _mismatch(self, chunk, pattern, ordinal, code):
+        # Cold path: find the offending bracket's offset by counting matches again
+        for i, match in enumerate(pattern.finditer(chunk)):
+            if i == ordinal:
+                break
+        if self.codes:
+            reason = f"expected {_CLOSE_CHARS[self.codes[-1]]!r}, found {_CLOSE_CHARS[code]!r}"
+        else:
+            reason = f"unexpected {_CLOSE_CHARS[code]!r}"
+        self.error = BracketReport(False, self.offset + match.start(), reason)
+
+    def _resolve(self, chunk, pattern, ordinal):
+        # Replace this chunk's ordinals (top of the stack) by absolute offsets
+        positions = self.positions
+        first = len(positions)
+        while first and positions[first - 1] < 0:
+            first -= 1
+        if first == len(positions):
+            return
+        wanted = {~positions[k]: k for k in range(first, len(positions))}
+        lowest = ~positions[first]
+        # Walk the reversed chunk: its matches are brackets ordinal-1, ordinal-2, ...
+        end = len(chunk) - 1
+        for match in pattern.finditer(chunk[::-1]):
+            ordinal -= 1
+            if ordinal in wanted:
+                positions[wanted[ordinal]] = self.offset + end - match.start()
+                if ordinal == lowest:
+                    break
+
+    # Verdict for everything fed so far; an unclosed bracket reports where it opened
+    def report(self):
+        if self.error is not None:
+            return self.error
+        if self.codes:
+            return BracketReport(False, self.positions[-1], f"unclosed {_OPEN_CHARS[self.codes[-1]]!r}")
+        return BracketReport(True, None, None)
+
+    # Feed a str/bytes, a file object (read in chunk_size pieces) or an iterable of chunks
+    def feed_all(self, source, chunk_size=1 << 20):
+        if isinstance(source, (str, bytes, bytearray, memoryview)):
+            self.feed(source)
+        elif hasattr(source, 'read'):
+            while self.error is None:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                self.feed(chunk)
+        else:
+            for chunk in source:
+                if not self.feed(chunk):
+                    break
+        return self.report()
+
+def validate_brackets(source, chunk_size=1 << 20):
+    return BracketValidator().feed_all(source, chunk_size)
+
+def validate_file(path, chunk_size=1 << 20):
+    # Binary mode: positions are byte offsets, no decoding cost
+    with open(path, 'rb') as f:
+        return validate_brackets(f, chunk_size)
+
+def validate_files(paths, workers=None, chunk_size=1 << 20):
+    """{path: BracketReport}, one file per task on a process pool (workers=1: in-process)."""
+    paths = [os.fspath(path) for path in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return {path: validate_file(path, chunk_size) for path in paths}
+    from concurrent.futures import ProcessPoolExecutor  # Only pay for it when used
+    with ProcessPoolExecutor(min(workers, len(paths))) as pool:
+        reports = pool.map(validate_file, paths, [chunk_size] * len(paths))
+        return dict(zip(paths, reports))
+
+
+# --------------------------
+# 9. Rope (persistent AVL tree of text leaves)
+# --------------------------
+# Leaves hold up to LEAF_MAX characters; internal nodes cache length and
+# height. Nodes are never modified, so an edit copies only the O(log n)
+# nodes on its path and every old Rope stays valid as a snapshot.
+# split and concat are AVL joins (O(log n)); a small leaf arriving at a
+# seam is merged into its neighbour so typing doesn't create 1-char leaves.
+LEAF_MAX = 512
+
+class RopeNode:
+    __slots__ = ('left', 'right', 'text', 'length', 'height')
+
+    def __init__(self, left=None, right=None, text=None):
+        self.left = left
+        self.right = right
+        self.text = text
+        if text is not None:
+            self.length, self.height = len(text), 0
+        else:
+            self.length = left.length + right.length
+            lh, rh = left.height, right.height
+            self.height = (lh if lh > rh else rh) + 1
+
+def _rope_leaf(text):
+    return RopeNode(text=text) if text else None
+
+def _rope_build(text):
+    pieces = [text[i:i + LEAF_MAX] for i in range(0, len(text), LEAF_MAX)]
+    def build(lo, hi):  # Halving keeps sibling heights within 1
+        if hi - lo == 1:
+            return RopeNode(text=pieces[lo])
+        mid = (lo + hi) // 2
+        return RopeNode(build(lo, mid), build(mid, hi))
+    return build(0, len(pieces)) if pieces else None
+
+def _rope_balance(l, r):
+    # Node(l, r) with at most one (single or double) rotation; heights differ by <= 2
+    if l.height > r.height + 1:
+        ll, lr = l.left, l.right
+        if ll.height >= lr.height:
+            return RopeNode(ll, RopeNode(lr, r))
+        return RopeNode(RopeNode(ll, lr.left), RopeNode(lr.right, r))
+    if r.height > l.height + 1:
+        rl, rr = r.left, r.right
+        if rr.height >= rl.height:
+            return RopeNode(RopeNode(l, rl), rr)
+        return RopeNode(RopeNode(l, rl.left), RopeNode(rl.right, rr))
+    return RopeNode(l, r)
+
+def _rope_join(l, r):
+    # Descend the taller tree's inner spine to a matching height, rebalance upward
+    if l.height > r.height + 1:
+        return _rope_balance(l.left, _rope_join(l.right, r))
+    if r.height > l.height + 1:
+        return _rope_balance(_rope_join(l, r.left), r.right)
+    return RopeNode(l, r)
+
+def _rope_merge_edge(node, text, at_end):
+    # Path-copy to the last (or first) leaf and merge text into it; None if too big
+    if node.text is not None:
+        if node.length + len(text) > LEAF_MAX:
+            return None
+        return RopeNode(text=node.text + text if at_end else text + node.text)
+    if at_end:
+        right = _rope_merge_edge(node.right, text, at_end)
+        return None if right is None else RopeNode(node.left, right)
+    left = _rope_merge_edge(node.left, text, at_end)
+    return None if left is None else RopeNode(left, node.right)
+
+def _rope_concat(l, r):
+    if l is None:
+        return r
+    if r is None:
+        return l
+    if r.text is not None and r.length < LEAF_MAX:
+        merged = _rope_merge_edge(l, r.text, True)
+        if merged is not None:
+            return merged
+    if l.text is not None and l.length < LEAF_MAX:
+        merged = _rope_merge_edge(r, l.text, False)
+        if merged is not None:
+            return merged
+    return _rope_join(l, r)
+
+def _rope_splice(node, start, end, text):
+    # Fast path: replace [start, end) inside one leaf, path-copying the O(log n)
+    # ancestors; no rebalancing needed. None if the edit doesn't fit one leaf.
+    path = []
+    while node.text is None:
+        left_length = node.left.length
+        if end <= left_length:
+            path.append((node, True))
+            node = node.left
+        elif start >= left_length:
+            path.append((node, False))
+            start -= left_length
+            end -= left_length
+            node = node.right
+        else:
+            return None
+    new = node.text[:start] + text + node.text[end:]
+    if not 0 < len(new) <= LEAF_MAX:
+        return None
+    node = RopeNode(text=new)
+    for parent, went_left in reversed(path):
+        node = RopeNode(node, parent.right) if went_left else RopeNode(parent.left, node)
+    return node
+
+def _rope_split(node, i):
+    # (first i characters, the rest)
+    if node is None:
+        return None, None
+    if node.text is not None:
+        return _rope_leaf(node.text[:i]), _rope_leaf(node.text[i:])
+    left_length = node.left.length
+    if i < left_length:
+        a, b = _rope_split(node.left, i)
+        return a, _rope_concat(b, node.right)
+    if i > left_length:
+        a, b = _rope_split(node.right, i - left_length)
+        return _rope_concat(node.left, a), b
+    return node.left, node.right
+
+class Rope:
+    """Immutable text with O(log n) insert, delete, split and concat."""
+    __slots__ = ('root',)
+
+    def __init__(self, text=''):
+        self.root = _rope_build(text)
+
+    @classmethod
+    def _wrap(cls, root):
+        rope = cls.__new__(cls)
+        rope.root = root
+        return rope
+
+    def __len__(self):
+        return self.root.length if self.root is not None else 0
+
+    def _clamp(self, pos):
+        return max(0, min(pos, len(self)))
+
+    def insert(self, pos, text):  # O(log n + len(text))
+        pos = self._clamp(pos)
+        if self.root is not None and len(text) <= LEAF_MAX:
+            root = _rope_splice(self.root, pos, pos, text)
+            if root is not None:
+                return Rope._wrap(root)
+        a, b = _rope_split(self.root, pos)
+        middle = _rope_build(text) if len(text) > LEAF_MAX else _rope_leaf(text)
+        return Rope._wrap(_rope_concat(_rope_concat(a, middle), b))
+
+    def delete(self, start, end):  # Without [start, end), O(log n)
+        start, end = self._clamp(start), self._clamp(end)
+        if start >= end:
+            return self
+        root = _rope_splice(self.root, start, end, '')
+        if root is not None:
+            return Rope._wrap(root)
+        a, rest = _rope_split(self.root, start)
+        _, c = _rope_split(rest, end - start)
+        return Rope._wrap(_rope_concat(a, c))
+
+    def split(self, pos):
+        a, b = _rope_split(self.root, self._clamp(pos))
+        return Rope._wrap(a), Rope._wrap(b)
+
+    def __add__(self, other):  # Rope + Rope/str -> Rope
+        if isinstance(other, str):
+            other = Rope(other)
+        elif not isinstance(other, Rope):
+            return NotImplemented
+        return Rope._wrap(_rope_concat(self.root, other.root))
+
+    def __radd__(self, other):  # str + Rope -> Rope
+        if not isinstance(other, str):
+            return NotImplemented
+        return Rope(other) + self
+
+    def leaves(self):  # In-order leaf texts
+        stack, node = [], self.root
+        while stack or node is not None:
+            while node is not None and node.text is None:
+                stack.append(node.right)
+                node = node.left
+            if node is not None:
+                yield node.text
+            node = stack.pop() if stack else None
+
+    def __str__(self):  # O(n)
+        return ''.join(self.leaves())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):  # O(log n + k) for a step-1 slice
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return str(self)[index]
+            out = []
+            self._collect(self.root, start, stop, out)
+            return ''.join(out)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("rope index out of range")
+        node = self.root
+        while node.text is None:
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+        return node.text[index]
+
+    def _collect(self, node, start, stop, out):
+        if node is None or start >= stop:
+            return
+        if node.text is not None:
+            out.append(node.text[start:stop])
+            return
+        left_length = node.left.length
+        if start < left_length:
+            self._collect(node.left, start, min(stop, left_length), out)
+        if stop > left_length:
+            self._collect(node.right, max(start - left_length, 0), stop - left_length, out)
+
+    def __eq__(self, other):
+        if isinstance(other, (Rope, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'Rope({len(self)} chars)'
+
+
+# --------------------------
+# Demo (run explicitly: `python run_demos.py day5`)
+# --------------------------
+def demo():
+    # 1. Stack Implementation
+    stack = Stack()
+    stack.push(10)
+    stack.push(20)
+    stack.push(30)
+    print("Stack after pushes:", stack.items)  # Output: [10, 20, 30]
+    print("Pop:", stack.pop())  # Output: 30
+    print("Peek:", stack.peek())  # Output: 20
+    print("Size after pop:", stack.size())  # Output: 2
+    print("Is stack empty?", stack.is_empty())  # Output: False
+
+    # 2. Built-in Alternatives
+    from collections import deque
+    stack_list = []
+    stack_list.append(10)  # Push
+    stack_list.pop()  # Pop
+    deque_stack = deque()
+    deque_stack.append(40)  # Push
+    deque_stack.pop()  # Pop
+
+    # 3. Applications
+    print(is_balanced("({[]})"))  # True
+    print(is_balanced("({[)]})"))  # False
+
+    editor = TextEditor()
+    editor.write("hello")
+    editor.write("world")
+    print("Text: ", editor.text)
+    print("Undo: ", editor.undo())  # "hello"
+    print("Redo: ", editor.redo())  # "helloworld"
+    editor.insert(5, " ")  # Edit anywhere: O(log n) on the rope
+    editor.delete(0)
+    print("Text: ", editor.text, "| Undo: ", editor.undo())  # "ello world" | "hello world"
+
+    # 4. Advanced Use Cases
+    print(eval_postfix("3 4 + 5 *")) # 35
+
+    # 7. Expression Compiler
+    rule = compile_expression("-price * (1 - discount) + 2^3")
+    print(rule.postfix_string)  # Output: price ~ 1 discount - * 2 3 ^ +
+    print(rule(price=100, discount=0.25))  # Output: -67.0
+    print(rule.evaluate_many([{'price': 10, 'discount': 0}, {'price': 4, 'discount': 0.5}]))  # Output: [-2, 6.0]
+    print(eval_postfix("10 4 -"), eval_postfix("-3 2.5 *"))  # Output: 6 -7.5
 
+    # 6. Typed Numeric Stack
+    numbers = NumericStack('q', range(5))
+    print(numbers.pop(), numbers.pop_many(2).tolist(), numbers.to_list())  # Output: 4 [3, 2] [0, 1]
+    recent = NumericStack('d', capacity=3, on_full='overwrite')
+    recent.push_many([1.0, 2.0, 3.0, 4.0])
+    print(recent.to_list())  # Output: [2.0, 3.0, 4.0]
+    print(is_balanced("({[]})", stack_factory=lambda: NumericStack('b')))  # True
 
+    # 8. Streaming Bracket Validator
+    validator = BracketValidator()
+    for chunk in ('{"a": [1, 2', '], "b": (3', ']}'):  # Mismatch spans chunk boundaries
+        validator.feed(chunk)
+    print(validator.report())  # Output: BracketReport(balanced=False, position=21, reason="expected ')', found ']'")
 
+    # 5. Exercises
+    print(reverse_string("Hello, This is a reversed string"))
+    print(has_redundant_parentheses("(())"))
 
 
+if __name__ == "__main__":
+    demo()
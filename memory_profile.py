@@ -0,0 +1,215 @@
+"""
+Memory Profiling: deep (retained) object sizes and per-call peak allocations
+Key Concepts: Object Graph Traversal, tracemalloc, Shallow vs Deep Size
+Usage:
+    python memory_profile.py structures --n 10000
+    python memory_profile.py allocations --filter day4 --n 10000
+"""
+
+import argparse
+import array
+import functools
+import gc
+import re
+import sys
+import time
+import tracemalloc
+import types
+from collections import namedtuple
+
+# --------------------------
+# 1. Deep Size
+# --------------------------
+# `obj.__sizeof__()` / sys.getsizeof are shallow: a list reports its pointer
+# block, not the elements; a ListNode reports one node, not the chain.
+# deep_sizeof walks everything reachable from the object and counts each
+# object once. The walk is iterative, so 10^6-node chains don't hit the
+# recursion limit.
+
+# Shared by everyone, never retained by a single structure
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+               types.MethodType, types.CodeType)
+_SKIP_IDS = {id(None), id(True), id(False), id(NotImplemented), id(Ellipsis)}
+_ATOMIC_TYPES = (int, float, complex, str, bytes, bytearray, array.array, range)
+
+def _slot_names(cls):
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return [name for name in names if name not in ('__dict__', '__weakref__')]
+
+def _children(obj):
+    if isinstance(obj, _ATOMIC_TYPES):  # getsizeof already includes their payload
+        return ()
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    children = []
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        children.append(obj.__dict__)
+    for name in _slot_names(type(obj)):
+        try:
+            children.append(getattr(obj, name))
+        except AttributeError:  # Unset slot
+            pass
+    if not children and not hasattr(obj, '__dict__'):
+        # Containers such as deque/OrderedDict: fall back to what they reference
+        children = [ref for ref in gc.get_referents(obj) if not isinstance(ref, _SKIP_TYPES)]
+    return children
+
+def deep_sizeof(obj, breakdown=None):
+    """Retained size in bytes of obj and everything reachable from it.
+
+    If `breakdown` is a dict it is filled with {type name: [count, bytes]}.
+    """
+    seen = set(_SKIP_IDS)
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        size = sys.getsizeof(current)
+        total += size
+        if breakdown is not None:
+            entry = breakdown.setdefault(type(current).__name__, [0, 0])
+            entry[0] += 1
+            entry[1] += size
+        stack.extend(_children(current))
+    return total
+
+def size_report(structures):
+    """[(name, shallow_bytes, deep_bytes)] for a {name: object} mapping."""
+    return [(name, obj.__sizeof__(), deep_sizeof(obj)) for name, obj in structures.items()]
+
+# --------------------------
+# 2. Per-call Peak Allocations (tracemalloc)
+# --------------------------
+AllocationProfile = namedtuple('AllocationProfile', 'result peak_bytes net_bytes seconds top')
+
+def _snapshot():
+    # Hide tracemalloc's own bookkeeping from the per-line report
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+def profile_allocations(func, *args, top=5, **kwargs):
+    """Call func(*args, **kwargs) and report the peak and net bytes it allocated.
+
+    `top` lists the source lines with the largest net allocation growth.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = _snapshot() if top else None
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        lines = []
+        if top:
+            stats = _snapshot().compare_to(before, 'lineno')
+            lines = [(str(stat.traceback), stat.size_diff) for stat in stats[:top] if stat.size_diff > 0]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return AllocationProfile(result, peak - baseline, current - baseline, seconds, lines)
+
+def track_allocations(func):
+    """Decorator: each call records its AllocationProfile on wrapper.profiles."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = profile_allocations(func, *args, top=0, **kwargs)
+        wrapper.profiles.append(profile._replace(result=None))
+        return profile.result
+    wrapper.profiles = []
+    return wrapper
+
+# --------------------------
+# 3. Reports for the day modules
+# --------------------------
+class _DictListNode:
+    # The original ListNode layout (per-instance __dict__), for comparison with __slots__
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+def sample_structures(n):
+    import day2_arrays_list as day2
+    import day4_linked_lists as day4
+    import day5_stacks as day5
+
+    sll = day4.SLL.from_iterable(range(n))
+    dict_sll = day4.SLL()
+    for val in reversed(range(n)):
+        dict_sll.head = _DictListNode(val, dict_sll.head)
+    pooled_sll = day4.PooledSLL.from_iterable(range(n))
+    dll = day4.DLL.from_iterable(range(n))
+    pooled_dll = day4.PooledDLL.from_iterable(range(n))
+    stack = day5.Stack()
+    for val in range(n):
+        stack.push(val)
+    editor = day5.TextEditor()
+    for _ in range(min(n, 2000)):
+        editor.write('x')
+    return {
+        'list': list(range(n)),
+        "array('q')": array.array('q', range(n)),
+        'CompactIntArray': day2.CompactIntArray(range(n)),
+        'SLL (dict nodes)': dict_sll,
+        'SLL': sll,
+        'PooledSLL': pooled_sll,
+        'DLL': dll,
+        'PooledDLL': pooled_dll,
+        'Stack': stack,
+        "NumericStack('q')": day5.NumericStack('q', range(n)),
+        f'TextEditor ({min(n, 2000)} writes)': editor,
+    }
+
+def print_size_report(n):
+    print(f"{'structure (n=' + str(n) + ')':<32} {'shallow':>12} {'deep':>14} {'deep/item':>10}")
+    for name, shallow, deep in size_report(sample_structures(n)):
+        print(f"{name:<32} {shallow:>12,} {deep:>14,} {deep / max(n, 1):>10.1f}")
+
+def print_allocation_report(n, pattern=None, top=3):
+    # Peak allocations of one call per benchmark case, at input size n
+    import benchmarks
+    for name, bench in benchmarks.CASES.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        try:
+            fn = bench.setup(n)
+        except benchmarks.SkipBenchmark as e:
+            print(f"{name:<45} skipped: {e}")
+            continue
+        profile = profile_allocations(fn, top=top)
+        print(f"{name:<45} peak {profile.peak_bytes:>13,} B  net {profile.net_bytes:>13,} B")
+        for where, size in profile.top:
+            print(f"    {size:>12,} B  {where}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    structures = sub.add_parser('structures', help='shallow vs deep size per data structure')
+    structures.add_argument('--n', type=int, default=10_000)
+    allocations = sub.add_parser('allocations', help='peak allocations per benchmark case')
+    allocations.add_argument('--n', type=int, default=10_000)
+    allocations.add_argument('--filter', help='regex selecting benchmark case names')
+    allocations.add_argument('--top', type=int, default=3, help='allocation sites to list')
+    args = parser.parse_args(argv)
+
+    if args.command == 'structures':
+        print_size_report(args.n)
+    else:
+        print_allocation_report(args.n, args.filter, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
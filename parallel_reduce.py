@@ -0,0 +1,256 @@
+"""
+Parallel Reductions: chunked sum/min/max/mean/histogram over large numeric arrays
+Key Concepts: Shared Memory, Chunking, Associative Combine
+"""
+
+import array
+import mmap
+import operator
+import os
+from collections import namedtuple
+from functools import partial, reduce
+from multiprocessing import shared_memory
+
+from day2_arrays_list import TypedArrayFile, _NATIVE_ORDER
+
+# --------------------------
+# 1. Data Sources
+# --------------------------
+# Workers never receive the data itself, only a small descriptor:
+#   ('shm',  shared_memory_name, typecode, count, offset, byteorder)
+#   ('file', path,               typecode, count, offset, byteorder)
+# and attach to the shared block / memory-map the file on their side.
+Source = namedtuple('Source', 'kind name typecode count offset byteorder')
+
+class SharedArray:
+    # A typed array living in a multiprocessing.shared_memory block.
+    # Build it once and pass it to many reductions to avoid re-copying.
+    def __init__(self, typecode, count):
+        self.typecode = typecode
+        self.count = count
+        itemsize = array.array(typecode).itemsize
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, count * itemsize))
+        self.source = Source('shm', self.shm.name, typecode, count, 0, _NATIVE_ORDER)
+
+    @classmethod
+    def from_buffer(cls, data, typecode=None):
+        # One memcpy from an array.array / NumPy array / buffer into shared memory
+        view = memoryview(data).cast('B')
+        typecode = typecode or _typecode_of(data)
+        shared = cls(typecode, view.nbytes // array.array(typecode).itemsize)
+        shared.shm.buf[:view.nbytes] = view
+        return shared
+
+    def view(self):
+        return self.shm.buf[:self.count * array.array(self.typecode).itemsize].cast(self.typecode)
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _typecode_of(data):
+    if isinstance(data, array.array):
+        return data.typecode
+    dtype = getattr(data, 'dtype', None)
+    if dtype is not None:
+        if dtype.byteorder not in '=|' and dtype.byteorder != _NATIVE_ORDER.decode():
+            raise ValueError("non-native byte order arrays are not supported; convert first")
+        return dtype.char
+    return memoryview(data).format
+
+def _attach(source):
+    # Returns (byte view of the array's items, handle to close afterwards)
+    itemsize = array.array(source.typecode).itemsize
+    stop = source.offset + source.count * itemsize
+    if source.kind == 'shm':
+        handle = shared_memory.SharedMemory(name=source.name)
+        raw = handle.buf[source.offset:stop]
+    else:
+        with open(source.name, 'rb') as f:
+            handle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        raw = memoryview(handle)[source.offset:stop]
+    return raw, handle
+
+def _chunk_view(raw, source, start, stop):
+    # Native byte order: zero-copy cast. Otherwise: byteswapped copy of just this chunk.
+    itemsize = array.array(source.typecode).itemsize
+    part = raw[start * itemsize:stop * itemsize]
+    if source.byteorder == _NATIVE_ORDER:
+        return part.cast(source.typecode)
+    chunk = array.array(source.typecode)
+    chunk.frombytes(part)
+    chunk.byteswap()
+    return memoryview(chunk)
+
+def _run_chunk(source, start, stop, chunk_fn):
+    raw, handle = _attach(source)
+    view = _chunk_view(raw, source, start, stop)
+    try:
+        return chunk_fn(view)
+    finally:
+        view.release()
+        raw.release()
+        handle.close()
+
+# --------------------------
+# 2. Parallel Reduce
+# --------------------------
+def _split(count, chunks):
+    if count == 0:
+        return []
+    chunks = max(1, min(chunks, count))
+    step = -(-count // chunks)  # Ceiling division
+    return [(lo, min(lo + step, count)) for lo in range(0, count, step)]
+
+def parallel_reduce(data, chunk_fn, combine, finish=None, initial=None, workers=None,
+                    chunks_per_worker=4, pool=None):
+    """
+    Split `data` into chunks, apply chunk_fn(memoryview) to each in a worker
+    process and fold the partial results with the associative `combine`.
+
+    data: array.array, NumPy array, SharedArray, TypedArrayFile or a typed
+    array file path. chunk_fn/combine/finish must be picklable (module-level).
+    `initial` seeds the fold (and is the result for empty data).
+    Pass an existing ProcessPoolExecutor as `pool` to skip pool start-up.
+    """
+    workers = workers or os.cpu_count() or 1
+    owned = None
+    if isinstance(data, SharedArray):
+        source = data.source
+    elif isinstance(data, (str, os.PathLike)):
+        with TypedArrayFile(data) as typed:
+            source = Source('file', os.fspath(data), typed.typecode, typed.count,
+                            typed.offset, typed.byteorder)
+    elif isinstance(data, TypedArrayFile):
+        source = Source('file', os.fspath(data.path), data.typecode, data.count,
+                        data.offset, data.byteorder)
+    elif workers == 1 and pool is None:
+        # Single core: reduce the caller's buffer in place, no shared memory needed
+        view = memoryview(data).cast('B').cast(_typecode_of(data))
+        results = [chunk_fn(view[lo:hi]) for lo, hi in _split(len(view), chunks_per_worker)]
+        return _finish(results, combine, finish, initial)
+    else:
+        owned = SharedArray.from_buffer(data)
+        source = owned.source
+
+    try:
+        ranges = _split(source.count, workers * chunks_per_worker)
+        if workers == 1 and pool is None:
+            results = [_run_chunk(source, lo, hi, chunk_fn) for lo, hi in ranges]
+        else:
+            if pool is None:
+                from concurrent.futures import ProcessPoolExecutor  # Only pay for it when used
+            executor = pool or ProcessPoolExecutor(workers)
+            try:
+                futures = [executor.submit(_run_chunk, source, lo, hi, chunk_fn) for lo, hi in ranges]
+                results = [f.result() for f in futures]
+            finally:
+                if pool is None:
+                    executor.shutdown()
+    finally:
+        if owned is not None:
+            owned.close()
+    return _finish(results, combine, finish, initial)
+
+def _finish(results, combine, finish, initial):
+    if initial is not None:
+        value = reduce(combine, results, initial)
+    elif results:
+        value = reduce(combine, results)
+    else:
+        raise ValueError("reduction of empty data")
+    return finish(value) if finish is not None else value
+
+# --------------------------
+# 3. Built-in Reducers
+# --------------------------
+# Each chunk function uses NumPy on a zero-copy view when installed, C-level builtins otherwise
+def _as_numpy(view):
+    try:
+        import numpy as np
+    except ImportError:
+        return None, None
+    return np, np.frombuffer(view, dtype=view.format)
+
+def chunk_sum(view):
+    np, arr = _as_numpy(view)
+    if np is None:
+        return sum(view)
+    if arr.dtype.kind in 'iu':
+        # 64-bit accumulation wraps silently; it is exact while n * max|x| fits
+        # (as CompactIntArray.sum). Narrow dtypes usually pass without a scan.
+        signed = arr.dtype.kind == 'i'
+        limit = 1 << (63 if signed else 64)
+        if len(arr) and len(arr) << (arr.dtype.itemsize * 8 - signed) > limit:
+            peak = max(-int(arr.min()), int(arr.max())) if signed else int(arr.max())
+            if len(arr) * peak >= limit:
+                return sum(view)  # Python ints: exact, but a per-item loop
+        return int(arr.sum(dtype=np.int64 if signed else np.uint64))
+    return float(arr.sum())
+
+def chunk_min(view):
+    np, arr = _as_numpy(view)
+    return min(view) if np is None else arr.min().item()
+
+def chunk_max(view):
+    np, arr = _as_numpy(view)
+    return max(view) if np is None else arr.max().item()
+
+def chunk_sum_count(view):
+    return chunk_sum(view), len(view)
+
+def _add_pairs(a, b):
+    return a[0] + b[0], a[1] + b[1]
+
+def _mean(total_count):
+    return total_count[0] / total_count[1]
+
+def chunk_histogram(view, bins, low, high):
+    # Fixed bin edges make per-chunk counts combinable by element-wise addition
+    np, arr = _as_numpy(view)
+    if np is not None:
+        return np.histogram(arr, bins=bins, range=(low, high))[0].tolist()
+    counts = [0] * bins
+    scale = bins / (high - low) if high > low else 0
+    for x in view:
+        if low <= x <= high:
+            counts[min(int((x - low) * scale), bins - 1)] += 1
+    return counts
+
+def _add_counts(a, b):
+    return [x + y for x, y in zip(a, b)]
+
+def parallel_sum(data, **kwargs):
+    return parallel_reduce(data, chunk_sum, operator.add, initial=0, **kwargs)
+
+def parallel_min(data, **kwargs):
+    return parallel_reduce(data, chunk_min, min, **kwargs)
+
+def parallel_max(data, **kwargs):
+    return parallel_reduce(data, chunk_max, max, **kwargs)
+
+def parallel_mean(data, **kwargs):
+    return parallel_reduce(data, chunk_sum_count, _add_pairs, _mean, **kwargs)
+
+def parallel_histogram(data, bins=10, value_range=None, **kwargs):
+    # Returns (counts, edges); value_range defaults to (min, max), which costs two extra passes
+    if value_range is None:
+        value_range = parallel_min(data, **kwargs), parallel_max(data, **kwargs)
+    low, high = value_range
+    counts = parallel_reduce(data, partial(chunk_histogram, bins=bins, low=low, high=high),
+                             _add_counts, initial=[0] * bins, **kwargs)
+    width = (high - low) / bins
+    return counts, [low + i * width for i in range(bins + 1)]
+
+
+if __name__ == "__main__":
+    data = array.array('q', range(1_000_000))
+    print(parallel_sum(data))  # 499999500000
+    print(parallel_min(data), parallel_max(data), parallel_mean(data))  # 0 999999 499999.5
+    print(parallel_histogram(data, bins=4)[0])  # [250000, 250000, 250000, 250000]
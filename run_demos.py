@@ -0,0 +1,93 @@
+"""
+Demo Runner: executes the example/benchmark code of each day module on request
+Usage:
+    python run_demos.py                 # run every demo
+    python run_demos.py day2 day4       # run selected demos
+    python run_demos.py --check-imports # verify modules import cheaply
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+
+MODULES = {
+    'day1': 'day1_complexity',
+    'day2': 'day2_arrays_list',
+    'day3': 'day3_strings',
+    'day4': 'day4_linked_lists',
+    'day5': 'day5_stacks',
+}
+
+# Library modules without a demo, held to the same import budget
+LIBRARY_MODULES = ('parallel_reduce',)
+
+# Importing a module must only define functions and classes
+IMPORT_BUDGET_SECONDS = 0.25
+
+# --------------------------
+# 1. Demos
+# --------------------------
+def run_demo(name):
+    module = importlib.import_module(MODULES[name])
+    print(f"===== {name} ({module.__name__}) =====")
+    module.demo()
+
+# --------------------------
+# 2. Import-time Budget
+# --------------------------
+# Each module is imported in a fresh interpreter so cached imports don't hide costs
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, 'numpy' in sys.modules)
+"""
+
+def measure_import(module):
+    out = subprocess.run([sys.executable, '-c', _PROBE.format(module=module)],
+                         capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    elapsed, numpy_loaded = out.split()
+    return float(elapsed), numpy_loaded == 'True'
+
+def check_imports(budget=IMPORT_BUDGET_SECONDS):
+    failures = []
+    for module in (*MODULES.values(), *LIBRARY_MODULES):
+        elapsed, numpy_loaded = measure_import(module)
+        print(f"{module}: {elapsed * 1000:.1f} ms{' (numpy imported!)' if numpy_loaded else ''}")
+        if elapsed > budget:
+            failures.append(f"{module} took {elapsed:.3f}s to import (budget {budget}s)")
+        if numpy_loaded:
+            failures.append(f"{module} imports numpy eagerly")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('demos', nargs='*', metavar='DAY',
+                        help=f"demos to run ({', '.join(MODULES)}); default: all")
+    parser.add_argument('--check-imports', action='store_true',
+                        help='fail if any module does work or imports numpy at import time')
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_SECONDS,
+                        help='import-time budget per module in seconds')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.demos if name not in MODULES]
+    if unknown:
+        parser.error(f"unknown demo(s): {', '.join(unknown)}")
+
+    if args.check_imports:
+        failures = check_imports(args.budget)
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        return 1 if failures else 0
+
+    for name in args.demos or MODULES:
+        run_demo(name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import array
+import math
+import operator
+
+import pytest
+
+import day1_complexity as day1
+
+
+@pytest.fixture
+def small_cache(monkeypatch):
+    cache = day1.FactorialCache(maxsize=2)
+    monkeypatch.setattr(day1, '_factorial_cache', cache)
+    return cache
+
+
+def test_factorials_and_cached_factorial_share_cache_under_eviction(small_cache):
+    assert day1.factorials([5]) == [120]
+    for n in (7, 9, 6, 5, 9, 12):
+        assert day1.cached_factorial(n) == math.factorial(n)
+    assert day1.factorials([3, 8, 8]) == [6, 40320, 40320]
+    assert len(small_cache) <= 2
+    assert small_cache._keys == sorted(small_cache._values)
+
+
+@pytest.mark.parametrize('items', [[1, 2, 3], [], [[1], [2]]], ids=['hash', 'empty', 'sorted'])
+@pytest.mark.parametrize('value', [[9], {'a': 1}, 'x'])
+def test_search_index_missing_values_raise_value_error(items, value):
+    index = day1.SearchIndex(items)
+    with pytest.raises(ValueError):
+        index.remove(value)
+    with pytest.raises(ValueError):
+        index.index(value)
+    assert index.count(value) == 0 and index.positions(value) == []
+    assert value not in index
+    assert list(index) == items
+
+
+def test_factorial_cache_extends_a_seeded_value():
+    cache = day1.FactorialCache()
+    cache.seed(900, math.factorial(900))
+    assert cache(1000) == math.factorial(1000)
+    assert cache._keys == [900, 1000]
+
+
+@pytest.mark.parametrize('seq', [[], [5], [1, 1, 2, 4, 4, 4, 7, 9, 9]], ids=['empty', 'one', 'dups'])
+def test_batched_bounds_match_bisect(seq):
+    targets = list(range(-1, 11))
+    assert day1.lower_bound_many(seq, targets) == [day1.lower_bound(seq, t) for t in targets]
+    assert day1.upper_bound_many(seq, targets) == [day1.upper_bound(seq, t) for t in targets]
+    assert day1.binary_search_many(seq, targets) == [seq.index(t) if t in seq else -1 for t in targets]
+    lows, highs = targets, [t + 3 for t in targets]
+    assert day1.count_range_many(seq, lows, highs) == [
+        sum(low <= x <= high for x in seq) for low, high in zip(lows, highs)]
+
+
+def test_count_range_is_zero_for_inverted_range():
+    assert day1.count_range([1, 2, 3, 4], 3, 1) == 0
+    assert day1.count_range_many([1, 2, 3, 4], [3], [1]) == [0]
+
+
+def test_batched_search_accepts_typed_arrays():
+    seq = array.array('i', [2, 3, 3, 8])
+    assert list(day1.binary_search_many(seq, [3, 4, 8])) == [1, -1, 3]
+    assert list(day1.lower_bound_many(seq, [0, 3, 9])) == [0, 1, 4]
+    assert list(day1.upper_bound_many(seq, [0, 3, 9])) == [0, 3, 4]
+
+
+@pytest.mark.parametrize('unique', [False, True])
+def test_iter_pairs_match_find_pairs(unique):
+    items = [3, 1, 4, 1, 5]
+    expected = [(a, b) for i, a in enumerate(items) for j, b in enumerate(items) if not unique or i < j]
+    assert list(day1.iter_pairs(items, unique)) == expected
+    if not unique:
+        assert expected == day1.find_pairs(items)
+    chunks = list(day1.iter_pair_chunks(items, chunk_size=4, unique=unique))
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert [pair for chunk in chunks for pair in chunk] == expected
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 7, 50])
+@pytest.mark.parametrize('unique', [False, True])
+def test_row_shards_cover_every_row_once(n, unique):
+    shards = day1._row_shards(n, 8, unique)
+    assert [row for lo, hi in shards for row in range(lo, hi)] == list(range(n))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_reduce_pairs_combines_shards_in_order(workers):
+    items = list(range(12))
+    pairs = day1.reduce_pairs(items, list, operator.add, workers=workers, shards=5, unique=True)
+    assert pairs == list(day1.iter_pairs(items, unique=True))
+    assert day1.reduce_pairs([], list, operator.add, workers=1) is None
@@ -0,0 +1,117 @@
+import array
+
+import pytest
+
+import day2_arrays_list as day2
+
+_FOREIGN_ORDER = b'>' if day2._NATIVE_ORDER == b'<' else b'<'
+
+
+@pytest.mark.parametrize('typecode', ['b', 'H', 'i', 'q', 'd'])
+def test_typed_array_write_append_read_round_trip(tmp_path, typecode):
+    path = tmp_path / 'data.tarr'
+    first = array.array(typecode, range(0, 100, 3))
+    day2.write_typed_array(path, first)
+    day2.append_typed_array(path, [1, 2, 3])
+    day2.append_typed_array(path, array.array(typecode, [4]))
+    expected = first.tolist() + [1, 2, 3, 4]
+    with day2.TypedArrayFile(path) as tarr:
+        assert (tarr.typecode, len(tarr), tarr.native) == (typecode, len(expected), True)
+        view = tarr.view()
+        assert view.tolist() == expected
+        assert tarr.view(2, 5).tolist() == expected[2:5]
+        view.release()
+        chunks = list(tarr.iter_chunks(chunk_size=7))
+        assert all(len(chunk) <= 7 for chunk in chunks)
+        assert [x for chunk in chunks for x in chunk] == expected
+
+
+def test_typed_array_empty_file(tmp_path):
+    path = tmp_path / 'empty.tarr'
+    day2.write_typed_array(path, array.array('i'))
+    with day2.TypedArrayFile(path) as tarr:
+        assert len(tarr) == 0 and list(tarr.iter_chunks()) == []
+    day2.append_typed_array(path, [7])
+    with day2.TypedArrayFile(path) as tarr:
+        assert list(tarr.iter_chunks()) == [array.array('i', [7])]
+
+
+def test_typed_array_foreign_byte_order(tmp_path):
+    path = tmp_path / 'swapped.tarr'
+    items = array.array('i', [1, -2, 300000])
+    items.byteswap()
+    path.write_bytes(day2._pack_header('i', 3, _FOREIGN_ORDER) + items.tobytes())
+    day2.append_typed_array(path, [4, 5])
+    with day2.TypedArrayFile(path) as tarr:
+        assert not tarr.native
+        with pytest.raises(ValueError):
+            tarr.view()
+        assert [x for chunk in tarr.iter_chunks(2) for x in chunk] == [1, -2, 300000, 4, 5]
+
+
+def test_typed_array_rejects_bad_files(tmp_path):
+    path = tmp_path / 'bad.tarr'
+    day2.write_typed_array(path, array.array('q', [1, 2, 3]))
+    raw = path.read_bytes()
+    path.write_bytes(raw[:-1])
+    with pytest.raises(ValueError, match='truncated'):
+        day2.TypedArrayFile(path)
+    path.write_bytes(b'XXXX' + raw[4:])
+    with pytest.raises(ValueError, match='magic'):
+        day2.TypedArrayFile(path)
+    path.write_bytes(raw[:10])
+    with pytest.raises(ValueError, match='too short'):
+        day2.TypedArrayFile(path)
+
+
+def _boundaries():
+    for typecode in day2.INT_TYPECODES:
+        lo, hi = day2.INT_RANGES[typecode]
+        yield typecode, lo, hi
+
+
+@pytest.mark.parametrize('typecode, lo, hi', list(_boundaries()))
+def test_narrowest_typecode_at_range_edges(typecode, lo, hi):
+    assert day2.narrowest_typecode(lo, hi) == typecode
+    if typecode != 'q':
+        wider = day2.INT_TYPECODES[day2.INT_TYPECODES.index(typecode) + 1]
+        assert day2.narrowest_typecode(lo - 1, 0) == wider
+        assert day2.narrowest_typecode(0, hi + 1) == wider
+    else:
+        with pytest.raises(OverflowError):
+            day2.narrowest_typecode(lo - 1, 0)
+        with pytest.raises(OverflowError):
+            day2.narrowest_typecode(0, hi + 1)
+
+
+@pytest.mark.parametrize('typecode, lo, hi', list(_boundaries()))
+def test_compact_int_array_widens_only_past_the_boundary(typecode, lo, hi):
+    values = day2.CompactIntArray([0, lo, hi])
+    assert values.typecode == typecode
+    if typecode == 'q':
+        with pytest.raises(OverflowError):
+            values.append(hi + 1)
+        with pytest.raises(OverflowError):
+            values[0] = lo - 1
+        assert values.tolist() == [0, lo, hi]
+        return
+    wider = day2.INT_TYPECODES[day2.INT_TYPECODES.index(typecode) + 1]
+    values.append(lo - 1)
+    assert values.typecode == wider and values.tolist() == [0, lo, hi, lo - 1]
+    values = day2.CompactIntArray([lo, hi])
+    values[0] = hi + 1
+    assert values.typecode == wider and values.tolist() == [hi + 1, hi]
+
+
+def test_compact_int_array_extend_matches_list():
+    source = [0, 1, -128, 127, 128, -32769, 2 ** 31, -(2 ** 63), 5]
+    for chunk_size in (1, 2, 4, 100):
+        values = day2.CompactIntArray(iter(source), chunk_size=chunk_size)
+        assert values.tolist() == source and values.typecode == 'q'
+        assert values.sum() == sum(source)
+    small = day2.CompactIntArray(range(-5, 5))
+    small.extend(day2.CompactIntArray([1000]))
+    small.extend(array.array('q', [-3]))
+    assert small.typecode == 'h' and small.tolist() == list(range(-5, 5)) + [1000, -3]
+    assert small[3:6] == day2.CompactIntArray([-2, -1, 0]) and small[3:6].typecode == 'h'
+    assert day2.CompactIntArray().sum() == 0
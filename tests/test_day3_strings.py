@@ -0,0 +1,217 @@
+import io
+import random
+import re
+
+import pytest
+
+import day3_strings as day3
+
+
+def _chunks(data, rng):
+    pos = 0
+    while pos < len(data):
+        step = rng.randint(1, 7)
+        yield data[pos:pos + step]
+        pos += step
+
+
+@pytest.mark.parametrize('text', [
+    '', 'a', 'aaab1111', 'a٣', '٣', 'aa٣٣', '\\\\12٣٣٣', 'ÿÿÿ\x00\x00', '日日本' * 3, 'x' * 1000,
+])
+def test_rle_str_round_trip(text):
+    assert day3.rle_decode(day3.rle_encode(text)) == text
+
+
+def test_rle_round_trip_random_str_and_bytes():
+    rng = random.Random(23)
+    for _ in range(500):
+        text = ''.join(rng.choice('ab1\\٣é日') * rng.randint(1, 12) for _ in range(rng.randint(0, 8)))
+        assert day3.rle_decode(day3.rle_encode(text)) == text
+        data = bytes(rng.choice(b'\x00\x01\xff') for _ in range(rng.randint(0, 4))) * rng.randint(1, 300)
+        encoded = day3.rle_encode(data)
+        assert day3.rle_decode(encoded) == data
+        assert day3.rle_decode(memoryview(encoded)) == data
+
+
+def test_rle_streaming_matches_one_shot():
+    rng = random.Random(5)
+    for _ in range(300):
+        text = ''.join(rng.choice('aa1\\٣') * rng.randint(1, 15) for _ in range(rng.randint(0, 6)))
+        for data in (text, text.encode()):
+            encoder = day3.RLEEncoder(text=isinstance(data, str))
+            encoded = [encoder.feed(chunk) for chunk in _chunks(data, rng)] + [encoder.flush()]
+            assert encoded[0][:0].join(encoded) == day3.rle_encode(data)
+            whole = encoded[0][:0].join(encoded)
+            decoder = day3.RLEDecoder(text=isinstance(data, str))
+            decoded = [decoder.feed(chunk) for chunk in _chunks(whole, rng)] + [decoder.flush()]
+            assert data[:0].join(decoded) == data
+
+
+def test_rle_flush_without_feed_keeps_stream_type():
+    assert day3.RLEEncoder(text=True).flush() == ''
+    assert day3.RLEEncoder().flush() == b''
+    assert day3.RLEDecoder(text=True).flush() == ''
+
+
+def test_rle_decode_rejects_malformed_input():
+    with pytest.raises(ValueError):
+        day3.rle_decode('12')
+    with pytest.raises(ValueError):
+        day3.rle_decode(b'\x02')
+
+
+def _naive_matches(text, patterns):
+    return sorted((i, i + len(p), p) for p in set(patterns)
+                  for i in range(len(text) - len(p) + 1) if text[i:i + len(p)] == p)
+
+
+def _naive_leftmost_longest(text, patterns):
+    chosen, i = [], 0
+    while i < len(text):
+        hits = [p for p in patterns if text.startswith(p, i)]
+        if hits:
+            p = max(hits, key=len)
+            chosen.append((i, i + len(p), p))
+            i += len(p)
+        else:
+            i += 1
+    return chosen
+
+
+@pytest.mark.parametrize('kind', [str, bytes])
+def test_aho_corasick_overlapping_matches_and_stream(kind):
+    rng = random.Random(22)
+    convert = (lambda s: s) if kind is str else str.encode
+    for _ in range(200):
+        patterns = [convert(''.join(rng.choice('ab') for _ in range(rng.randint(1, 4))))
+                    for _ in range(rng.randint(1, 5))]
+        text = convert(''.join(rng.choice('abc') for _ in range(rng.randrange(40))))
+        automaton = day3.AhoCorasick(patterns)
+        matches = automaton.findall(text)
+        assert sorted(matches) == _naive_matches(text, patterns)
+        assert [m.end for m in matches] == sorted(m.end for m in matches)
+        stream = automaton.stream()
+        assert [m for chunk in _chunks(text, rng) for m in stream.feed(chunk)] == matches
+        assert automaton.find_leftmost_longest(text) == _naive_leftmost_longest(text, patterns)
+
+
+def test_aho_stream_reports_a_match_spanning_chunks():
+    stream = day3.AhoCorasick(['needle', 'dle']).stream()
+    assert stream.feed('hay nee') == []
+    assert stream.feed('d') == []
+    assert stream.feed('le hay') == [day3.AhoMatch(4, 10, 'needle'), day3.AhoMatch(7, 10, 'dle')]
+    assert stream.offset == 14
+
+
+def test_aho_corasick_replace_and_errors():
+    assert day3.multi_replace('he said she sells', {'he': 'HE', 'she': 'SHE', 's': '$'}) == 'HE $aid SHE $ell$'
+    automaton = day3.AhoCorasick([b'ab', b'b'])
+    assert automaton.replace(b'abb', lambda p: p.upper()) == b'ABB'
+    assert automaton.replace(b'abb', b'-') == b'--'
+    with pytest.raises(ValueError):
+        day3.AhoCorasick([])
+    with pytest.raises(ValueError):
+        day3.AhoCorasick(['a', ''])
+    with pytest.raises(TypeError):
+        day3.AhoCorasick(['a', b'b'])
+
+
+def _shuffled(word, rng):
+    chars = list(word)
+    rng.shuffle(chars)
+    return ''.join(chars)
+
+
+@pytest.mark.parametrize('alphabet', ['abcxyz', 'aBc-é', 'ab'], ids=['lower', 'mixed', 'two'])
+@pytest.mark.parametrize('length', [day3.SHORT_WORD, day3.SHORT_WORD + 1, 200])
+def test_anagram_signature_matches_sorted_characters(alphabet, length):
+    rng = random.Random(24)
+    for _ in range(50):
+        word = ''.join(rng.choice(alphabet) for _ in range(length))
+        other = _shuffled(word, rng)
+        if rng.random() < 0.5:  # Swap one character: same length, different multiset
+            i = rng.randrange(length)
+            other = other[:i] + rng.choice(alphabet + 'q') + other[i + 1:]
+        expected = sorted(word) == sorted(other)
+        assert (day3.anagram_signature(word) == day3.anagram_signature(other)) == expected
+        assert day3.are_anagrams_batch([(word, other)]) == [expected]
+
+
+def test_anagram_index_mixes_short_and_long_words(tmp_path):
+    rng = random.Random(24)
+    long_word = 'listen' * 10
+    words = ['listen', 'silent', 'enlist', 'google', long_word, _shuffled(long_word, rng),
+             'Ab' * 20, _shuffled('Ab' * 20, rng), 'listen']
+    index = day3.AnagramIndex()
+    index.CHUNK = 2  # Several add_many chunks, some all-short and some with long words
+    index.add_many(iter(words))
+    assert len(index) == len(words) - 1
+    assert index.anagrams_of('tinsel') == ['listen', 'silent', 'enlist']
+    assert index.anagrams_of(long_word) == [words[5]]
+    assert words[7] in index and 'Ba' * 20 not in index
+    assert sorted(map(len, index.iter_groups())) == [2, 2, 3]
+    path = tmp_path / 'words.txt'
+    path.write_text(' '.join(words[:4]) + '\nSilent  TINSEL\n', encoding='utf-8')
+    folded = day3.AnagramIndex.from_file(path, normalize=str.lower)
+    assert folded.anagrams_of('listen') == ['silent', 'enlist', 'Silent', 'TINSEL']
+
+
+def test_are_anagrams_batch_shares_a_cache():
+    pairs = [('abc', 'cab'), ('abc', 'abd'), ('x' * 40, 'x' * 40), ('', ''), ('ab', 'abb')]
+    cache = {}
+    assert day3.are_anagrams_batch(pairs, cache) == [day3.are_anagrams(a, b) for a, b in pairs]
+    assert set(cache) == {word for pair in pairs for word in pair}
+    assert day3.are_anagrams_batch([('bca', 'abc')], cache) == [True]
+    assert day3.are_anagrams_batch([]) == []
+
+
+_ADDRESSES = ['a@b.co', 'first.last@mail.example.org', 'no-at-sign.com', '@b.co', 'a@b', 'a@@b.co',
+              'x@y.z', '', ' ', 'ü@é.de']
+
+
+def _email_text(rng, newline_choices):
+    text = ''.join(rng.choice(_ADDRESSES) + rng.choice(newline_choices) for _ in range(rng.randrange(1, 30)))
+    if rng.random() < 0.3:  # No line break after the last line
+        text = text.rstrip('\r\n')
+    # Split the text itself: '\r' then an empty '\n' line reads back as one '\r\n'
+    lines = re.split(r'\r\n|\r|\n', text) if text else []
+    if text.endswith(('\r', '\n')):
+        lines.pop()
+    return lines, text
+
+
+@pytest.mark.parametrize('newlines', [['\n'], ['\r\n'], ['\r'], ['\n', '\r\n', '\r']], ids=['lf', 'crlf', 'cr', 'mixed'])
+def test_validate_email_stream_matches_per_line_check(newlines):
+    rng = random.Random(25)
+    for _ in range(100):
+        lines, text = _email_text(rng, newlines)
+        invalid = [line for line in lines if not day3.is_valid_email(line)]
+        for source, encoding in ((text, None), (text.encode(), 'utf-8')):
+            reports = list(day3.validate_email_stream(_chunks(source, rng), encoding=encoding))
+            assert sum(r.valid for r in reports) == len(lines) - len(invalid)
+            assert [line for r in reports for line in r.invalid_lines] == invalid
+            assert sum(r.invalid for r in reports) == len(invalid)
+            assert [r.offset for r in reports] == sorted(set(r.offset for r in reports))
+            assert not reports or reports[0].offset == 0
+        assert day3.validate_emails(text)[1:3] == (len(lines) - len(invalid), len(invalid))
+
+
+def test_validate_email_stream_offsets_point_at_chunk_starts():
+    text = 'a@b.co\r\nbad\r\n' * 3
+    reports = list(day3.validate_email_stream(io.StringIO(text, newline=''), chunk_size=5))
+    assert all(text[r.offset - 1] == '\n' for r in reports if r.offset)
+    assert (sum(r.valid for r in reports), sum(r.invalid for r in reports)) == (3, 3)
+    assert list(day3.validate_email_stream(['a@b.co\r', '\nbad'])) == [
+        day3.EmailReport(0, 1, 0, []), day3.EmailReport(8, 0, 1, ['bad'])]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_validate_email_file_splits_on_line_boundaries(tmp_path, workers):
+    rng = random.Random(250)
+    lines, text = _email_text(rng, ['\n', '\r\n'])
+    path = tmp_path / 'emails.txt'
+    path.write_bytes(text.encode() * 20)
+    reports = day3.validate_email_file(path, workers=workers, chunk_size=16)
+    invalid = [line for line in lines if not day3.is_valid_email(line)] * 20
+    assert [line for r in reports for line in r.invalid_lines] == invalid
+    assert sum(r.valid for r in reports) == len(lines) * 20 - len(invalid)
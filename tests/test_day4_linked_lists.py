@@ -0,0 +1,299 @@
+import array
+import bisect
+import random
+import tracemalloc
+
+import pytest
+
+import day4_linked_lists as day4
+
+
+def test_memoize_keeps_keyword_and_positional_keys_apart():
+    calls = []
+
+    @day4.memoize(maxsize=16)
+    def f(*args, **kwargs):
+        calls.append((args, kwargs))
+        return args, kwargs
+
+    assert f(1, a=1) == ((1,), {'a': 1})
+    assert f((1,), (('a', 1),)) == (((1,), (('a', 1),)), {})
+    assert f(1, ('a', 1)) == ((1, ('a', 1)), {})
+    assert f(1, a=1) == ((1,), {'a': 1})
+    assert len(calls) == 3
+
+
+@pytest.fixture(params=[day4.SLL, day4.PooledSLL])
+def sll_class(request):
+    return request.param
+
+
+@pytest.fixture(params=[day4.DLL, day4.PooledDLL])
+def dll_class(request):
+    return request.param
+
+
+def test_singly_linked_api(sll_class):
+    lst = sll_class.from_iterable([3, 1, 2])
+    head = lst.appendleft(0)
+    node = lst.insert_after(head, 9)
+    lst.insert_after(lst.append(5), 7)
+    assert lst.to_list() == [0, 9, 3, 1, 2, 5, 7] and len(lst) == 7
+    assert lst.remove_after(node) == 3
+    assert lst.remove_after(None) == 0
+    lst.remove(7)
+    assert list(reversed(lst)) == [5, 2, 1, 9]
+    assert lst.to_array('q') == array.array('q', [9, 1, 2, 5])
+    assert len(list(lst.iter_nodes())) == len(lst) == 4
+    lst.sort()
+    assert lst.to_list() == [1, 2, 5, 9]
+    lst.sort(key=lambda v: -v)
+    assert lst.to_list() == [9, 5, 2, 1]
+    lst.append(4)  # The tail is kept right after sorting
+    assert lst.to_list() == [9, 5, 2, 1, 4]
+    assert lst.popleft() == 9
+    with pytest.raises(ValueError):
+        lst.remove(42)
+    tail = list(lst.iter_nodes())[-1]
+    with pytest.raises(IndexError):
+        lst.remove_after(tail)
+
+
+def test_doubly_linked_api(dll_class):
+    lst = dll_class([1, 2, 3])
+    first = lst.appendleft(0)
+    last = lst.append(4)
+    lst.insert_before(first, -1)
+    lst.insert_after(last, 5)
+    mid = lst.insert_after(first, 10)
+    assert lst.to_list() == [-1, 0, 10, 1, 2, 3, 4, 5]
+    lst.move_to_front(mid)
+    lst.move_to_front(lst.tail)
+    assert lst.to_list() == [5, 10, -1, 0, 1, 2, 3, 4]
+    assert list(reversed(lst)) == lst.to_list()[::-1]
+    lst.remove(0)
+    assert lst.remove_node(mid) == 10
+    assert (lst.pop(), lst.popleft()) == (4, 5)
+    lst.sort(key=lambda v: -v)
+    assert lst.to_list() == [3, 2, 1, -1]
+    assert list(reversed(lst)) == [-1, 1, 2, 3]
+    lst.sort()
+    lst.appendleft(-5)
+    assert lst.to_array('q') == array.array('q', [-5, -1, 1, 2, 3])
+    assert len(list(lst.iter_nodes())) == len(lst) == 5
+
+
+def test_pooled_sort_is_stable_and_keeps_values_on_nodes():
+    lst = day4.PooledDLL([5, 3, 5, 1])
+    nodes = list(lst.iter_nodes())
+    lst.sort(key=lambda v: v // 2)  # Keys 2, 1, 2, 0
+    assert lst.to_list() == [1, 3, 5, 5]
+    assert [lst.pool.vals[i] for i in nodes] == [5, 3, 5, 1]
+    assert list(lst.iter_nodes()) == [nodes[3], nodes[1], nodes[0], nodes[2]]
+
+
+def test_analyze_list_memory_is_bounded_by_list_length():
+    head = day4.SLL(range(5)).head
+    tracemalloc.start()
+    try:
+        report = day4.analyze_list(head, ks=[10**8, 2])
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 100_000
+    assert report.length == 5 and report.middle.val == 2
+    assert report.kth_from_end == {10**8: None, 2: head.next.next.next}
+    for k in range(1, 8):
+        node = day4.analyze_list(head, k).kth_from_end[k]
+        assert (node.val if node else None) == (5 - k if k <= 5 else None)
+
+
+def _nodes(head):
+    while head:
+        yield head
+        head = head.next
+
+
+def _values(head):
+    return [node.val for node in _nodes(head)]
+
+
+def test_merge_sorted_list_is_stable():
+    a = day4.SLL([(1, 'a'), (2, 'a'), (2, 'b')]).head
+    b = day4.SLL([(0, 'c'), (2, 'c')]).head
+    merged = _values(day4.merge_sorted_list(a, b))
+    assert merged == sorted([(1, 'a'), (2, 'a'), (2, 'b'), (0, 'c'), (2, 'c')])
+    assert _values(day4.merge_sorted_list(None, day4.SLL([1]).head)) == [1]
+
+
+def test_merge_k_sorted_lists_matches_stable_sort():
+    rng = random.Random(13)
+    runs = [sorted((rng.randrange(10), k) for _ in range(rng.randrange(6))) for k in range(7)]
+    heads = [day4.SLL(run).head for run in runs]
+    merged = _values(day4.merge_k_sorted_lists(heads, key=lambda v: v[0]))
+    assert merged == sorted((v for run in runs for v in run), key=lambda v: v[0])
+    assert merged == sorted(merged)  # Ties keep list order (the second field)
+    assert day4.merge_k_sorted_lists([None, None]) is None
+    assert day4.merge_k_sorted_lists([]) is None
+
+
+def test_merge_sorted_iterables_and_files(tmp_path):
+    assert list(day4.merge_sorted_iterables([1, 4], iter([2, 3]), [])) == [1, 2, 3, 4]
+    assert list(day4.merge_sorted_iterables(['bb', 'a'], ['ccc'], key=lambda s: -len(s))) == ['ccc', 'bb', 'a']
+    paths = []
+    for name, lines in (('x', 'apple\ncherry\n'), ('y', 'banana\ndate'), ('z', '')):
+        paths.append(tmp_path / name)
+        paths[-1].write_text(lines, encoding='utf-8')
+    assert list(day4.merge_sorted_files(paths)) == ['apple', 'banana', 'cherry', 'date']
+
+
+@pytest.mark.parametrize('natural', [True, False])
+@pytest.mark.parametrize('shape', ['random', 'sorted', 'reversed', 'runs', 'empty', 'one'])
+def test_sort_linked_list_is_stable_and_relinks_nodes(natural, shape):
+    rng = random.Random(14)
+    items = [(rng.randrange(8), i) for i in range(60)]
+    items = {
+        'random': items, 'sorted': sorted(items), 'reversed': sorted(items, reverse=True),
+        'runs': sorted(items[:25]) + sorted(items[25:]), 'empty': [], 'one': items[:1],
+    }[shape]
+    lst = day4.SLL(items)
+    nodes = {id(node) for node in lst.iter_nodes()}
+    head = day4.sort_linked_list(lst.head, key=lambda v: v[0], natural=natural)
+    assert _values(head) == sorted(items, key=lambda v: v[0])
+    assert {id(node) for node in _nodes(head)} == nodes
+
+
+@pytest.mark.parametrize('natural', [True, False])
+def test_sort_dll_restores_prev_links(natural):
+    items = [5, 1, 4, 1, 5, 9, 2, 6]
+    head, tail = day4.sort_dll(day4.DLL(items).head, natural=natural)
+    assert _values(head) == sorted(items)
+    backward, node = [], tail
+    while node:
+        backward.append(node.val)
+        node = node.prev
+    assert backward == sorted(items, reverse=True) and head.prev is None
+    assert day4.sort_dll(None, natural=natural) == (None, None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = day4.LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the eviction candidate
+    assert 'b' in cache  # Membership does not count as a use
+    cache.put('c', 3)
+    assert 'b' not in cache and cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats() == day4.CacheStats(hits=3, misses=1, evictions=1, expirations=0,
+                                            entries=2, bytes=0)
+    assert cache.pop('a') == 1 and cache.pop('a', 'gone') == 'gone' and len(cache) == 1
+
+
+def test_lru_cache_ttl_uses_the_clock():
+    clock = FakeClock()
+    cache = day4.LRUCache(maxsize=None, ttl=10, clock=clock)
+    cache.put('default', 1)
+    cache.put('short', 2, ttl=1)
+    clock.now = 1
+    assert 'short' not in cache and cache.get('default') == 1
+    clock.now = 9.5
+    cache.put('default', 3)  # Re-putting restarts the ttl
+    clock.now = 10
+    assert cache.get('default') == 3
+    clock.now = 19.5
+    assert cache.get('default') is None and cache.pop('default', 'gone') == 'gone'
+    stats = cache.stats()
+    assert (stats.expirations, stats.misses, stats.entries) == (2, 1, 0)
+
+
+def test_lru_cache_maxbytes_accounts_value_sizes():
+    cache = day4.LRUCache(maxsize=None, maxbytes=10, sizeof=len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'yyyy')
+    assert cache.stats().bytes == 8
+    cache.put('c', 'zzz')  # 11 bytes: evicts 'a'
+    assert 'a' not in cache and cache.stats().bytes == 7
+    cache.put('b', 'y')  # Replacing a value updates the byte count
+    assert cache.stats().bytes == 4
+    cache.put('huge', 'h' * 11)  # Never fits: skipped without flushing the cache
+    assert 'huge' not in cache and len(cache) == 2
+    cache.put('b', 'h' * 11)  # An oversized replacement drops the old value
+    assert 'b' not in cache and cache.stats().bytes == 3 and cache.stats().evictions == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.stats().bytes == 0
+
+
+def test_memoize_exposes_cache_info_and_clear():
+    calls = []
+
+    @day4.memoize(maxsize=1, thread_safe=True)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(2), square(2), square(3), square(2)] == [4, 4, 9, 4]
+    assert calls == [2, 3, 2]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 3, 2)
+    square.cache_clear()
+    assert square(3) == 9 and calls == [2, 3, 2, 3]
+
+
+def _check_against_model(skip, model):
+    keys = [v[0] for v in model]
+    assert skip.to_list() == model and len(skip) == len(model)
+    assert [skip[i] for i in range(len(model))] == model
+    assert [skip[-i] for i in range(1, len(model) + 1)] == model[::-1]
+    for key in range(-1, 22):
+        assert skip.rank(key) == bisect.bisect_left(keys, key)
+        assert skip.bisect_right(key) == bisect.bisect_right(keys, key)
+        assert list(skip.range(key, key + 3)) == [v for v in model if key <= v[0] < key + 3]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_skip_list_matches_sorted_model(seed):
+    rng = random.Random(seed)
+    skip = day4.SkipList(key=lambda v: v[0], seed=seed)
+    model = []
+    for step in range(300):
+        op = rng.random()
+        if op < 0.6 or not model:
+            val = (rng.randrange(20), step)
+            skip.insert(val)
+            bisect.insort_right(model, val, key=lambda v: v[0])  # Stable for equal keys
+        elif op < 0.8:
+            index = rng.randrange(-len(model), len(model))
+            assert skip.pop(index) == model.pop(index)
+        else:
+            val = rng.choice(model)
+            skip.remove(val)
+            model.remove(val)
+        if step % 25 == 0:
+            _check_against_model(skip, model)
+    _check_against_model(skip, model)
+    while model:
+        assert skip.pop() == model.pop()
+    assert len(skip.head.next) == 1
+
+
+def test_skip_list_search_and_errors():
+    skip = day4.SkipList([5, 1, 3, 3], seed=0)
+    assert skip.search(3).val == 3 and skip.search(4) is None
+    assert 3 in skip and 4 not in skip and list(skip.range()) == [1, 3, 3, 5]
+    skip.remove(3)
+    assert skip.to_list() == [1, 3, 5]
+    with pytest.raises(ValueError):
+        skip.remove(4)
+    with pytest.raises(IndexError):
+        skip[3]
+    with pytest.raises(IndexError):
+        day4.SkipList().pop()
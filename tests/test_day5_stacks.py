@@ -0,0 +1,244 @@
+import math
+import random
+
+import pytest
+
+import day5_stacks as day5
+
+
+@pytest.mark.parametrize('expr, expected', [
+    ('a' + '+a' * 1000, 1001),
+    ('+'.join(['1'] * 300), 300),
+    ('-'.join(['a'] * 500), -498),
+])
+def test_compile_expression_long_flat_chains(expr, expected):
+    assert day5.compile_expression(expr)(a=1) == expected
+
+
+def test_compile_expression_falls_back_when_source_does_not_compile():
+    expr = day5.CompiledExpression('+'.join(['x'] * 100_000))
+    assert expr.source is None
+    assert expr(x=2) == 200_000
+    assert expr.evaluate_many([{'x': 1}]) == [100_000]
+
+
+def test_compile_expression_overflowing_literals():
+    assert day5.evaluate('1e999') == math.inf
+    assert day5.evaluate('-1e999 * x', x=2) == -math.inf
+    assert math.isnan(day5.evaluate('1e999 - 1e999'))
+
+
+def _random_expr(rng, depth):
+    if depth == 0 or rng.random() < 0.3:
+        return rng.choice(['a', 'b', 'c', '0.1', '3', '2.5'])
+    if rng.random() < 0.15:
+        return '-' + _random_expr(rng, depth - 1)
+    op = rng.choice('+-*/^' if depth < 2 else '+-*/')
+    left, right = _random_expr(rng, depth - 1), _random_expr(rng, depth - 1)
+    return f'({left}) {op} ({right})' if rng.random() < 0.5 else f'{left} {op} {right}'
+
+
+def test_compiled_source_matches_postfix_evaluation():
+    rng = random.Random(19)
+    bindings = {'a': 0.7, 'b': 1.3, 'c': 2.9}
+    for _ in range(2000):
+        expr = _random_expr(rng, 4)
+        compiled = day5.CompiledExpression(expr)
+        try:
+            expected = day5.eval_postfix(compiled.postfix, variables=bindings)
+        except (ZeroDivisionError, OverflowError):
+            continue
+        actual = compiled(bindings)
+        assert actual == expected or (actual != actual and expected != expected), (expr, compiled.source)
+
+
+@pytest.mark.parametrize('pos', [100, -5])
+def test_editor_undo_of_out_of_range_insert(pos):
+    editor = day5.TextEditor()
+    editor.insert(pos, 'x')
+    assert editor.text == 'x'
+    assert editor.undo() == ''
+    assert editor.redo() == 'x'
+
+
+def test_editor_noop_delete_keeps_history():
+    editor = day5.TextEditor('abc')
+    editor.delete(0, 2)
+    editor.undo()
+    for start, end in [(3, None), (10, None), (2, 1), (-3, None), (5, 9)]:
+        editor.delete(start, end)
+    assert editor.undo_stack.is_empty()
+    assert editor.redo() == 'c'
+
+
+def test_editor_matches_str_model_with_undo_redo():
+    rng = random.Random(21)
+    editor = day5.TextEditor('hello', max_history=10_000)
+    for _ in range(3000):
+        choice = rng.random()
+        text = str(editor.rope)
+        if choice < 0.45:
+            pos, chars = rng.randint(-3, len(text) + 3), rng.choice(['x', ' ', 'ab', 'y' * 600])
+            editor.insert(pos, chars)
+            pos = max(0, min(pos, len(text)))
+            expected = text[:pos] + chars + text[pos:]
+        elif choice < 0.75:
+            start = rng.randint(-2, len(text) + 2)
+            end = rng.choice([None, start + rng.randint(-1, 30)])
+            editor.delete(start, end)
+            stop = start + 1 if end is None else end
+            lo, hi = max(0, min(start, len(text))), max(0, min(stop, len(text)))
+            expected = text[:lo] + text[hi:] if lo < hi else text
+        elif choice < 0.9:
+            result = editor.undo()
+            expected = text if result == "Nothing to undo" else str(result)
+        else:
+            result = editor.redo()
+            expected = text if result == "Nothing to redo" else str(result)
+        assert editor.text == expected
+        assert len(editor) == len(expected)
+    while not editor.undo_stack.is_empty():
+        editor.undo()
+    assert editor.text == 'hello'
+
+
+def test_rope_matches_str():
+    rng = random.Random(9)
+    text = ''.join(rng.choice('abc\n') for _ in range(3000))
+    rope = day5.Rope(text)
+    for _ in range(500):
+        if rng.random() < 0.5:
+            pos, chunk = rng.randint(-5, len(text) + 5), 'z' * rng.choice([1, 7, 700])
+            rope = rope.insert(pos, chunk)
+            pos = max(0, min(pos, len(text)))
+            text = text[:pos] + chunk + text[pos:]
+        else:
+            start = rng.randint(0, len(text))
+            end = start + rng.randint(0, 900)
+            rope = rope.delete(start, end)
+            text = text[:start] + text[end:]
+        assert len(rope) == len(text)
+    assert str(rope) == text and rope == text
+    assert rope[100:250] == text[100:250] and rope[-1] == text[-1]
+    left, right = rope.split(1234)
+    assert str(left) == text[:1234] and str(left + right) == text
+
+
+def test_undo_result_concatenates_like_str():
+    editor = day5.TextEditor('ab')
+    editor.write('c')
+    snapshot = editor.undo()
+    assert snapshot + 'x' == 'abx'
+    assert 'x' + snapshot == 'xab'
+    assert snapshot + day5.Rope('!') == 'ab!'
+    with pytest.raises(TypeError):
+        snapshot + 1
+
+
+@pytest.mark.parametrize('capacity, on_full', [(None, 'error'), (5, 'error'), (5, 'overwrite'), (1, 'overwrite')])
+def test_numeric_stack_matches_list_model(capacity, on_full):
+    rng = random.Random(18)
+    stack = day5.NumericStack('q', [1, 2], capacity=capacity, on_full=on_full)
+    model = [1, 2]
+    for step in range(400):
+        op = rng.random()
+        values = [rng.randrange(-100, 100) for _ in range(rng.randrange(8))]
+        if op < 0.3:
+            values = values[:1] or [step]
+            if capacity is not None and len(model) == capacity and on_full == 'error':
+                with pytest.raises(IndexError):
+                    stack.push(values[0])
+            else:
+                stack.push(values[0])
+                model = (model + values)[-capacity:] if capacity else model + values
+        elif op < 0.55:
+            if capacity is not None and len(model) + len(values) > capacity and on_full == 'error':
+                with pytest.raises(IndexError):
+                    stack.push_many(values)
+            else:
+                stack.push_many(values)
+                model = (model + values)[-capacity:] if capacity else model + values
+        elif op < 0.8:
+            if model:
+                assert stack.peek() == model[-1]
+                assert stack.pop() == model.pop()
+            else:
+                with pytest.raises(IndexError):
+                    stack.pop()
+        else:
+            k = rng.randrange(len(model) + 2)
+            if k > len(model):
+                with pytest.raises(IndexError):
+                    stack.pop_many(k)
+            else:
+                assert stack.pop_many(k).tolist() == model[len(model) - k:][::-1]
+                del model[len(model) - k:]
+        assert stack.to_list() == model and len(stack) == len(model)
+        assert stack.is_empty() == (not model)
+
+
+def test_numeric_stack_arguments_and_typecodes():
+    with pytest.raises(ValueError):
+        day5.NumericStack(on_full='drop')
+    with pytest.raises(ValueError):
+        day5.NumericStack(capacity=0)
+    with pytest.raises(IndexError):
+        day5.NumericStack(capacity=2, iterable=[1, 2, 3])
+    ring = day5.NumericStack('d', [0.5, 1.5, 2.5], capacity=2, on_full='overwrite')
+    assert ring.to_list() == [1.5, 2.5]
+    with pytest.raises(IndexError):
+        day5.NumericStack().peek()
+    assert day5.NumericStack().pop_many(0).tolist() == []
+
+
+def _reference_brackets(text):
+    # Whole-input scan with a plain stack of (char, position)
+    pairs = {')': '(', '}': '{', ']': '['}
+    stack = []
+    for pos, char in enumerate(text):
+        if char in '({[':
+            stack.append((char, pos))
+        elif char in pairs:
+            if not stack or stack[-1][0] != pairs[char]:
+                return False, pos
+            stack.pop()
+    return (False, stack[-1][1]) if stack else (True, None)
+
+
+def _random_chunks(rng, text):
+    cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, rng.randrange(6)))) if text else []
+    return [text[lo:hi] for lo, hi in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_bracket_validator_resumes_across_chunks(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        text = ''.join(rng.choice('(){}[]ab ') for _ in range(rng.randrange(30)))
+        if rng.random() < 0.5:  # Mostly-balanced inputs reach the unclosed/OK paths
+            text = ''.join(rng.choice(['()', '[x]', '{ }', '([])']) for _ in range(rng.randrange(6))) + text[:2]
+        expected = _reference_brackets(text)
+        for source in (text, text.encode()):
+            report = day5.validate_brackets(_random_chunks(rng, source))
+            assert (report.balanced, report.position) == expected, (text, source)
+        assert day5.is_balanced(text) == expected[0]
+
+
+def test_bracket_validator_reasons_and_stops_after_error():
+    assert day5.validate_brackets(['(a', 'b]']).reason == "expected ')', found ']'"
+    assert day5.validate_brackets(['ab', '}']) == day5.BracketReport(False, 2, "unexpected '}'")
+    assert day5.validate_brackets(['x[', '']) == day5.BracketReport(False, 1, "unclosed '['")
+    validator = day5.BracketValidator()
+    assert not validator.feed(')')
+    assert not validator.feed('()') and validator.offset == 1
+    assert day5.validate_brackets(bytearray(b'{[]}')).balanced
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_validate_files_reads_in_chunks(tmp_path, workers):
+    good, bad = tmp_path / 'good.txt', tmp_path / 'bad.txt'
+    good.write_bytes(b'(' * 3000 + b'[x]' + b')' * 3000)
+    bad.write_bytes(b'{' + b'.' * 5000 + b'(]')
+    reports = day5.validate_files([good, bad], workers=workers, chunk_size=7)
+    assert reports[str(good)] == day5.BracketReport(True, None, None)
+    assert reports[str(bad)] == day5.BracketReport(False, 5002, "expected ')', found ']'")
@@ -0,0 +1,30 @@
+import array
+import os
+import subprocess
+import sys
+
+import pytest
+
+import parallel_reduce
+
+
+def test_import_does_not_load_process_pool():
+    code = "import sys, parallel_reduce; print('concurrent.futures.process' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(parallel_reduce.__file__)))
+    assert out.stdout.strip() == 'False'
+
+
+def test_sum_is_exact_beyond_int64():
+    data = array.array('q', [2**62] * 8 + [-(2**62)] * 3)
+    assert parallel_reduce.parallel_sum(data, workers=1) == 5 * 2**62
+    unsigned = array.array('Q', [2**64 - 1] * 4)
+    assert parallel_reduce.parallel_sum(unsigned, workers=1) == 4 * (2**64 - 1)
+
+
+def test_numpy_chunk_sum_does_not_wrap():
+    np = pytest.importorskip('numpy')
+    data = np.full(8, 2**62, dtype=np.int64)
+    assert parallel_reduce.chunk_sum(memoryview(data)) == 8 * 2**62
+    small = np.arange(1000, dtype=np.int32)
+    assert parallel_reduce.chunk_sum(memoryview(small)) == 999 * 1000 // 2
@@ -0,0 +1,5 @@
+import run_demos
+
+
+def test_modules_import_within_budget_without_numpy():
+    assert run_demos.check_imports() == []